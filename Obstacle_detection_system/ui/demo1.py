@@ -34,7 +34,7 @@ class VideoThread(QThread):
                 break
 
             # 处理帧
-            results = self.model.predict(frame, verbose=False)
+            results = self.model.predict_frame(frame)
             annotated = results[0].plot()
 
             # 转换颜色空间
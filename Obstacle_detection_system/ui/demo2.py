@@ -56,7 +56,7 @@ class Worker:
     def process_video_frame(self):
         ret, frame = self.video_capture.read()
         if ret:
-            results = self.model.predict(frame)
+            results = self.model.predict_frame(frame)
             annotated_frame = results[0].plot()
             self.current_annotated_image = annotated_frame
             self.update_frame(frame, annotated_frame)
@@ -1,12 +1,124 @@
 import sys
 import os
 import configparser
-from PyQt5.QtCore import Qt, QTimer
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QVBoxLayout, QWidget, QPushButton, QHBoxLayout, \
-    QFileDialog, QMessageBox
-from PyQt5.QtGui import QImage, QPixmap, QIcon
+    QFileDialog, QMessageBox, QStatusBar, QCheckBox
+from PyQt5.QtGui import QIcon
 import cv2
+import numpy as np
 from ultralytics import YOLO
+from display import FrameView
+from pipeline import AsyncVideoWriter
+from ultralytics.data.utils import IMG_FORMATS
+from ultralytics.utils.files import increment_path
+
+
+class FolderDetectThread(QThread):
+    """文件夹检测线程：整个文件夹按批次流式推理，结果由后台线程写盘。"""
+
+    progress = pyqtSignal(int, int, float)  # 已处理数量, 总数量, 每秒处理张数
+    preview = pyqtSignal(np.ndarray)
+    finished_signal = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, model, folder_path, save_dir, batch=8, writers=2, preview_interval=0.5):
+        super().__init__()
+        self.model = model
+        self.folder_path = folder_path
+        self.save_dir = save_dir
+        self.batch = batch
+        self.writers = writers
+        self.preview_interval = preview_interval  # 预览缩略图的最小间隔（秒），为 0 时不预览
+        self.running = True
+        self.last_result = None
+        self.last_annotated = None
+        self.last_preview_time = 0.0
+        self.preview_lock = threading.Lock()
+        self.pending = threading.BoundedSemaphore(batch * writers * 2)  # 限制待写盘结果数量，防止内存堆积
+
+    def run(self):
+        total = sum(f.rsplit(".", 1)[-1].lower() in IMG_FORMATS for f in os.listdir(self.folder_path))
+        os.makedirs(self.save_dir, exist_ok=True)
+        count, start = 0, time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.writers) as executor:
+                results = self.model.predict(
+                    self.folder_path, stream=True, batch=self.batch, pipelined=True, verbose=False
+                )
+                for result in results:
+                    if not self.running:
+                        break
+                    self.pending.acquire()
+                    executor.submit(self.save_result, result)
+                    self.last_result = result
+                    count += 1
+                    if count % self.batch == 0 or count == total:
+                        self.progress.emit(count, total, count / (time.perf_counter() - start))
+                results.close()
+            self.progress.emit(count, total, count / (time.perf_counter() - start))
+            self.finished_signal.emit(self.save_dir)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def save_result(self, result):
+        try:
+            annotated = result.plot()
+            cv2.imwrite(os.path.join(self.save_dir, os.path.basename(result.path)), annotated)
+            self.last_annotated = annotated
+            if self.preview_interval:
+                with self.preview_lock:
+                    now = time.perf_counter()
+                    if now - self.last_preview_time < self.preview_interval:
+                        return
+                    self.last_preview_time = now
+                h, w = annotated.shape[:2]
+                scale = 320 / max(h, w)
+                self.preview.emit(cv2.resize(annotated, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA))
+        finally:
+            self.pending.release()
+
+    def stop(self):
+        self.running = False
+
+
+class VideoDetectThread(QThread):
+    """视频检测线程：逐帧推理并把标注帧交给后台写盘线程，界面只负责显示。"""
+
+    frame_ready = pyqtSignal(np.ndarray)
+    failed = pyqtSignal(str)
+
+    def __init__(self, model, cap, video_writer):
+        super().__init__()
+        self.model = model
+        self.cap = cap
+        self.video_writer = video_writer
+        self.running = True
+
+    def run(self):
+        try:
+            while self.running and self.cap.isOpened():
+                ret, frame = self.cap.read()
+                if not ret:
+                    break
+
+                results = self.model.predict_frame(frame)
+                if results:
+                    annotated_frame = results[0].plot()
+                    self.video_writer.write(annotated_frame)
+                    self.frame_ready.emit(annotated_frame)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.cap.release()
+
+    def stop(self):
+        self.running = False
+
 
 class Worker:
     def __init__(self):
@@ -15,6 +127,10 @@ class Worker:
         self.detection_type = None
         self.video_writer = None
         self.video_path = None
+        # 视频输出设置，可在 config.ini 的 [Output] 中修改
+        self.output_path = 'output.mp4'
+        self.output_fourcc = 'mp4v'
+        self.output_queue_size = 64
 
     def load_model(self):
         model_path, _ = QFileDialog.getOpenFileName(None, "选择模型文件", "", "模型文件 (*.pt)")
@@ -42,9 +158,9 @@ class Worker:
 
     def save_video(self):
         if self.video_writer is not None:
-            self.video_writer.release()
+            self.video_writer.close()
+            QMessageBox.information(None, "保存视频", f"视频保存成功！\n{self.video_writer.path}")
             self.video_writer = None
-            QMessageBox.information(None, "保存视频", "视频保存成功！")
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -54,12 +170,12 @@ class MainWindow(QMainWindow):
         self.setGeometry(300, 150, 1200, 600)
 
         # 创建两个 QLabel 分别显示左右图像
-        self.label1 = QLabel()
+        self.label1 = FrameView()
         self.label1.setAlignment(Qt.AlignCenter)
         self.label1.setMinimumSize(580, 450)
         self.label1.setStyleSheet('border:3px solid #6950a1; background-color: black;')
 
-        self.label2 = QLabel()
+        self.label2 = FrameView()
         self.label2.setAlignment(Qt.AlignCenter)
         self.label2.setMinimumSize(580, 450)
         self.label2.setStyleSheet('border:3px solid #6950a1; background-color: black;')
@@ -129,11 +245,22 @@ class MainWindow(QMainWindow):
         self.exit_button.setFixedSize(120, 30)
         hbox_buttons.addWidget(self.exit_button)
 
+        # 文件夹检测时是否显示预览缩略图
+        self.preview_checkbox = QCheckBox("预览")
+        self.preview_checkbox.setChecked(True)
+        hbox_buttons.addWidget(self.preview_checkbox)
+
         layout.addLayout(hbox_buttons)
         central_widget = QWidget()
         central_widget.setLayout(layout)
         self.setCentralWidget(central_widget)
 
+        # 状态栏显示文件夹检测进度
+        self.statusBar = QStatusBar()
+        self.setStatusBar(self.statusBar)
+        self.folder_thread = None
+        self.video_thread = None
+
         # 加载上次运行的界面状态
         self.load_last_state()
 
@@ -141,6 +268,11 @@ class MainWindow(QMainWindow):
         self.config = configparser.ConfigParser()
         if os.path.exists('config.ini'):
             self.config.read('config.ini')
+            if 'Output' in self.config:
+                output = self.config['Output']
+                self.worker.output_path = output.get('video_path', self.worker.output_path)
+                self.worker.output_fourcc = output.get('fourcc', self.worker.output_fourcc)
+                self.worker.output_queue_size = output.getint('queue_size', self.worker.output_queue_size)
             if 'LastState' in self.config:
                 last_state = self.config['LastState']
                 self.worker.detection_type = last_state.get('detection_type', 'image')
@@ -161,25 +293,49 @@ class MainWindow(QMainWindow):
         if detection_type == "image":
             self.save_detection_results()
         elif detection_type == "video":
+            # 先停止视频线程，保证写盘线程关闭时不再有新帧写入
+            self.stop_video()
             self.worker.save_video()
 
     def select_image(self):
         image_path, _ = QFileDialog.getOpenFileName(None, "选择图片文件", "", "图片文件 (*.jpg *.jpeg *.png)")
-        self.flag = 0
         if image_path:
             self.detect_image(image_path)
 
     def detect_folder(self):
         folder_path = QFileDialog.getExistingDirectory(self, "选择图片文件夹")
-        self.flag = 1
         if folder_path:
-            image_paths = []
-            for filename in os.listdir(folder_path):
-                if filename.lower().endswith((".jpg", ".jpeg", ".png")):
-                    image_path = os.path.join(folder_path, filename)
-                    image_paths.append(image_path)
-            for image_path in image_paths:
-                self.detect_image(image_path)
+            # 整个文件夹交给后台线程批量推理，界面只显示进度和预览
+            save_dir = str(increment_path(Path("runs/detect/folder")))
+            preview_interval = 0.5 if self.preview_checkbox.isChecked() else 0
+            self.folder_thread = FolderDetectThread(self.worker.model, folder_path, save_dir,
+                                                    preview_interval=preview_interval)
+            self.folder_thread.progress.connect(self.update_folder_progress)
+            self.folder_thread.preview.connect(self.show_folder_preview)
+            self.folder_thread.finished_signal.connect(self.folder_detect_finished)
+            self.folder_thread.failed.connect(self.folder_detect_failed)
+            self.folder_detect_button.setEnabled(False)
+            self.worker.detection_type = "image"
+            self.folder_thread.start()
+
+    def update_folder_progress(self, count, total, speed):
+        self.statusBar.showMessage(f"文件夹检测: {count}/{total}  {speed:.1f} 张/秒")
+
+    def show_folder_preview(self, thumbnail):
+        self.label2.set_frame(thumbnail)
+
+    def folder_detect_finished(self, save_dir):
+        thread = self.folder_thread
+        if thread.last_result is not None:
+            self.current_results = [thread.last_result]
+            self.worker.current_annotated_image = thread.last_annotated
+            self.save_button.setEnabled(True)
+        self.folder_detect_button.setEnabled(True)
+        QMessageBox.information(self, "文件夹检测", f"检测完成，结果已保存到 {save_dir}")
+
+    def folder_detect_failed(self, message):
+        self.folder_detect_button.setEnabled(True)
+        QMessageBox.warning(self, "错误", f"文件夹检测失败: {message}")
 
     def select_video(self):
         video_path, _ = QFileDialog.getOpenFileName(None, "选择视频文件", "", "视频文件 (*.mp4 *.avi)")
@@ -187,6 +343,9 @@ class MainWindow(QMainWindow):
             self.detect_video(video_path)
 
     def detect_video(self, video_path):
+        if self.worker.model is None:
+            return
+        self.stop_video()
         self.worker.video_path = video_path
         self.worker.detection_type = "video"
         cap = cv2.VideoCapture(video_path)
@@ -196,28 +355,34 @@ class MainWindow(QMainWindow):
 
         frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        self.worker.video_writer = cv2.VideoWriter('output.mp4', cv2.VideoWriter_fourcc(*'mp4v'), fps, (frame_width, frame_height))
-
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            results = self.worker.model.predict(frame)
-            if results:
-                annotated_frame = results[0].plot()
-                self.worker.video_writer.write(annotated_frame)
-                annotated_frame = cv2.cvtColor(annotated_frame, cv2.COLOR_BGR2RGB)
-                height, width, channel = annotated_frame.shape
-                bytesPerLine = 3 * width
-                qimage = QImage(annotated_frame.data, width, height, bytesPerLine, QImage.Format_RGB888)
-                pixmap = QPixmap.fromImage(qimage)
-                self.label2.setPixmap(pixmap.scaled(self.label2.size(), Qt.KeepAspectRatio))
-                cv2.waitKey(1)
-
-        cap.release()
-        self.save_last_state()
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30
+        if self.worker.video_writer is not None:
+            self.worker.video_writer.close()
+        try:
+            # 编码写盘在后台线程中进行，推理循环只把帧放入队列
+            self.worker.video_writer = AsyncVideoWriter(self.worker.output_path, fps, (frame_width, frame_height),
+                                                        fourcc=self.worker.output_fourcc,
+                                                        queue_size=self.worker.output_queue_size)
+        except IOError as e:
+            cap.release()
+            self.worker.video_writer = None
+            QMessageBox.warning(self, "错误", str(e))
+            return
+
+        # 推理在后台线程中进行，界面线程只显示标注帧
+        self.video_thread = VideoDetectThread(self.worker.model, cap, self.worker.video_writer)
+        self.video_thread.frame_ready.connect(self.label2.set_frame)
+        self.video_thread.failed.connect(self.video_detect_failed)
+        self.video_thread.finished.connect(self.save_last_state)
+        self.video_thread.start()
+
+    def stop_video(self):
+        if self.video_thread is not None and self.video_thread.isRunning():
+            self.video_thread.stop()
+            self.video_thread.wait()
+
+    def video_detect_failed(self, message):
+        QMessageBox.warning(self, "错误", f"视频检测失败: {message}")
 
     def connect_bluetooth(self):
         # 这里添加蓝牙连接手机摄像头的代码
@@ -228,29 +393,14 @@ class MainWindow(QMainWindow):
             print(image_path)
             image = cv2.imread(image_path)
             if image is not None:
-                if self.flag == 0:
-                    results = self.worker.model.predict(image)
-                elif self.flag == 1:
-                    results = self.worker.model.predict(image_path, save=True)
+                results = self.worker.model.predict(image)
                 self.worker.detection_type = "image"
                 if results:
                     self.current_results = results
                     self.worker.current_annotated_image = results[0].plot()
-                    annotated_image = self.worker.current_annotated_image
-                    image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-                    height1, width1, channel1 = image_rgb.shape
-                    bytesPerLine1 = 3 * width1
-                    qimage1 = QImage(image_rgb.data, width1, height1, bytesPerLine1, QImage.Format_RGB888)
-                    pixmap1 = QPixmap.fromImage(qimage1)
-                    self.label1.setPixmap(pixmap1.scaled(self.label1.size(), Qt.KeepAspectRatio))
-                    annotated_image = cv2.cvtColor(annotated_image, cv2.COLOR_BGR2RGB)
-                    height2, width2, channel2 = annotated_image.shape
-                    bytesPerLine2 = 3 * width2
-                    qimage2 = QImage(annotated_image.data, width2, height2, bytesPerLine2, QImage.Format_RGB888)
-                    pixmap2 = QPixmap.fromImage(qimage2)
-                    self.label2.setPixmap(pixmap2.scaled(self.label2.size(), Qt.KeepAspectRatio))
+                    self.label1.set_frame(image)
+                    self.label2.set_frame(self.worker.current_annotated_image)
                     self.save_button.setEnabled(True)
-            cv2.waitKey(500)
 
     def save_detection_results(self):
         if self.worker.current_annotated_image is not None:
@@ -291,6 +441,12 @@ class MainWindow(QMainWindow):
             self.display_objects_button.setEnabled(True)
 
     def exit_application(self):
+        if self.folder_thread is not None and self.folder_thread.isRunning():
+            self.folder_thread.stop()
+            self.folder_thread.wait()
+        self.stop_video()
+        if self.worker.video_writer is not None:
+            self.worker.video_writer.close()
         self.save_last_state()
         sys.exit()
 
@@ -3,9 +3,10 @@ import os
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QApplication, QMainWindow, QLabel, QVBoxLayout, QWidget, QPushButton, QHBoxLayout, \
     QFileDialog, QMessageBox
-from PyQt5.QtGui import QImage, QPixmap, QIcon
+from PyQt5.QtGui import QIcon
 import cv2
 from ultralytics import YOLO
+from display import FrameView
 
 
 class Worker:
@@ -56,7 +57,7 @@ class Worker:
         self.is_camera_running = False
 
     def process_frame(self, frame):
-        results = self.model.predict(frame)
+        results = self.model.predict_frame(frame)
         annotated_frame = results[0].plot()
         return annotated_frame
 
@@ -69,12 +70,12 @@ class MainWindow(QMainWindow):
         self.setGeometry(300, 150, 1200, 600)
 
         # 创建两个 QLabel 分别显示左右图像
-        self.label1 = QLabel()
+        self.label1 = FrameView()
         self.label1.setAlignment(Qt.AlignCenter)
         self.label1.setMinimumSize(580, 450)
         self.label1.setStyleSheet('border:3px solid #6950a1; background-color: black;')
 
-        self.label2 = QLabel()
+        self.label2 = FrameView()
         self.label2.setAlignment(Qt.AlignCenter)
         self.label2.setMinimumSize(580, 450)
         self.label2.setStyleSheet('border:3px solid #6950a1; background-color: black;')
@@ -199,19 +200,8 @@ class MainWindow(QMainWindow):
                 self.display_frames(frame, annotated_frame)
 
     def display_frames(self, original_frame, annotated_frame):
-        original_frame_rgb = cv2.cvtColor(original_frame, cv2.COLOR_BGR2RGB)
-        height1, width1, channel1 = original_frame_rgb.shape
-        bytesPerLine1 = 3 * width1
-        qimage1 = QImage(original_frame_rgb.data, width1, height1, bytesPerLine1, QImage.Format_RGB888)
-        pixmap1 = QPixmap.fromImage(qimage1)
-        self.label1.setPixmap(pixmap1.scaled(self.label1.size(), Qt.KeepAspectRatio))
-
-        annotated_frame_rgb = cv2.cvtColor(annotated_frame, cv2.COLOR_BGR2RGB)
-        height2, width2, channel2 = annotated_frame_rgb.shape
-        bytesPerLine2 = 3 * width2
-        qimage2 = QImage(annotated_frame_rgb.data, width2, height2, bytesPerLine2, QImage.Format_RGB888)
-        pixmap2 = QPixmap.fromImage(qimage2)
-        self.label2.setPixmap(pixmap2.scaled(self.label2.size(), Qt.KeepAspectRatio))
+        self.label1.set_frame(original_frame)
+        self.label2.set_frame(annotated_frame)
 
     def detect_image(self, image_path):
         if image_path:
@@ -0,0 +1,106 @@
+import math
+
+import cv2
+import numpy as np
+from PyQt5.QtGui import QColor, QImage, QPainter
+from PyQt5.QtWidgets import QLabel
+
+# Qt 5.14 起支持 BGR888，可直接显示 OpenCV 的 BGR 图像，无需 cvtColor
+BGR888 = getattr(QImage, "Format_BGR888", None)
+
+
+class FrameView(QLabel):
+    """
+    直接显示 BGR ndarray 的标签控件。
+
+    先按控件大小缩放到预分配的缓冲区再构建 QImage（不经过 QPixmap），同一帧在控件大小不变时不重复绘制。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buffer = None  # 预分配的显示缓冲区，仅在显示尺寸变化时重新分配
+        self.image = None
+        self.frame = None
+        self.frame_size = None
+        self.overlay = []  # 叠加显示在画面左上角的文字行
+
+    def set_overlay(self, lines):
+        self.overlay = list(lines)
+        self.update()
+
+    def set_frame(self, frame):
+        """显示一帧 BGR 图像，返回是否发生了重绘。"""
+        if frame is None:
+            return False
+        size = self.display_size(frame.shape[1], frame.shape[0])
+        if frame is self.frame and size == self.frame_size:
+            return False  # 画面未变化，跳过重绘
+        w, h = size
+        if w <= 0 or h <= 0:
+            return False
+        if self.buffer is None or self.buffer.shape[:2] != (h, w):
+            self.buffer = np.empty((h, w, 3), dtype=np.uint8)
+        src = np.ascontiguousarray(frame)
+        if (w, h) == (src.shape[1], src.shape[0]):
+            np.copyto(self.buffer, src)
+        else:
+            cv2.resize(src, (w, h), dst=self.buffer, interpolation=cv2.INTER_LINEAR)
+        if BGR888 is not None:
+            self.image = QImage(self.buffer.data, w, h, 3 * w, BGR888)
+        else:
+            cv2.cvtColor(self.buffer, cv2.COLOR_BGR2RGB, dst=self.buffer)
+            self.image = QImage(self.buffer.data, w, h, 3 * w, QImage.Format_RGB888)
+        self.frame = frame
+        self.frame_size = size
+        self.update()
+        return True
+
+    def display_size(self, width, height):
+        """保持宽高比缩放到控件内容区域后的尺寸。"""
+        rect = self.contentsRect()
+        scale = min(rect.width() / width, rect.height() / height)
+        return int(width * scale), int(height * scale)
+
+    def clear(self):
+        self.image = None
+        self.frame = None
+        self.frame_size = None
+        super().clear()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.frame is not None:
+            self.set_frame(self.frame)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.image is not None:
+            rect = self.contentsRect()
+            x = rect.x() + (rect.width() - self.image.width()) // 2
+            y = rect.y() + (rect.height() - self.image.height()) // 2
+            painter = QPainter(self)
+            painter.drawImage(x, y, self.image)
+            if self.overlay:
+                line_height = painter.fontMetrics().height()
+                width = max(painter.fontMetrics().width(line) for line in self.overlay) + 10
+                painter.fillRect(x, y, width, line_height * len(self.overlay) + 6, QColor(0, 0, 0, 160))
+                painter.setPen(QColor(0, 255, 0))
+                for i, line in enumerate(self.overlay):
+                    painter.drawText(x + 5, y + 3 + line_height * (i + 1) - painter.fontMetrics().descent(), line)
+            painter.end()
+
+
+def tile_frames(frames, tile_size=(640, 360)):
+    """把多路画面按网格拼接成一张 BGR 图像，每路保持宽高比居中放置。"""
+    cols = math.ceil(math.sqrt(len(frames)))
+    rows = math.ceil(len(frames) / cols)
+    tw, th = tile_size
+    grid = np.zeros((rows * th, cols * tw, 3), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        h, w = frame.shape[:2]
+        scale = min(tw / w, th / h)
+        nw, nh = int(w * scale), int(h * scale)
+        x = (i % cols) * tw + (tw - nw) // 2
+        y = (i // cols) * th + (th - nh) // 2
+        grid[y : y + nh, x : x + nw] = cv2.resize(frame, (nw, nh), interpolation=cv2.INTER_AREA)
+    return grid
@@ -0,0 +1,445 @@
+import collections
+import csv
+import os
+import queue
+import threading
+import time
+
+import cv2
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+from ultralytics import YOLO
+from ultralytics.data.loaders import LoadStreams
+
+
+class LatestFrameQueue:
+    """有界队列，队满时丢弃最旧的元素，消费者总是拿到最新的帧。"""
+
+    def __init__(self, maxsize=1):
+        self.items = collections.deque(maxlen=maxsize)
+        self.cond = threading.Condition()
+        self.closed = False
+        self.dropped = 0
+
+    def put(self, item):
+        with self.cond:
+            if len(self.items) == self.items.maxlen:
+                self.dropped += 1
+            self.items.append(item)
+            self.cond.notify()
+
+    def get(self, timeout=None):
+        """取出最旧的元素，超时或队列已关闭且为空时返回 None。"""
+        with self.cond:
+            if not self.items and not self.closed:
+                self.cond.wait(timeout)
+            return self.items.popleft() if self.items else None
+
+    def get_latest(self):
+        """取出最新的元素并清空队列，不阻塞。"""
+        with self.cond:
+            if not self.items:
+                return None
+            item = self.items.pop()
+            self.dropped += len(self.items)
+            self.items.clear()
+            return item
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def is_finished(self):
+        with self.cond:
+            return self.closed and not self.items
+
+
+class FPSMeter:
+    """按指数滑动平均统计某一阶段的帧率。"""
+
+    def __init__(self, alpha=0.1):
+        self.alpha = alpha
+        self.fps = 0.0
+        self.last = None
+
+    def tick(self):
+        now = time.perf_counter()
+        if self.last is not None and now > self.last:
+            fps = 1.0 / (now - self.last)
+            self.fps = fps if self.fps == 0 else (1 - self.alpha) * self.fps + self.alpha * fps
+        self.last = now
+
+
+class AdaptiveController:
+    """
+    自适应控制器：根据实测耗时和端到端延迟在运行时调整推理尺寸 imgsz 和跳帧间隔，使帧率/延迟满足目标。
+
+    imgsz 由每帧处理耗时决定：超出帧预算时逐级减小，明显低于预算时恢复。跳帧只减少送去推理的帧数，不会缩短单帧处理耗时，
+    因此只由端到端延迟决定：imgsz 已到下限而延迟仍超出预算时增大跳帧间隔，若增大后延迟没有下降则撤回；
+    延迟明显低于预算时再逐级减小。未设置延迟预算时不跳帧。
+    """
+
+    def __init__(self, target_fps=15, latency_budget=None, imgsz_range=(320, 640), max_stride=4, step=32,
+                 patience=10):
+        self.target_fps = target_fps  # 目标帧率，None 表示不限制
+        self.latency_budget = latency_budget  # 端到端延迟预算（毫秒），None 表示不限制
+        self.min_imgsz, self.max_imgsz = imgsz_range
+        self.max_stride = max_stride
+        self.step = step  # imgsz 每次调整的步长，应为模型步长 32 的倍数
+        self.patience = patience  # 两次调整之间至少间隔的帧数，避免来回抖动
+        self.imgsz = self.max_imgsz
+        self.stride = 1
+        self.stride_limit = max_stride  # 实测有效的最大跳帧间隔，增大跳帧无效时下调
+        self.stride_latency = None  # 上次增大跳帧间隔前的延迟（毫秒），用于判断跳帧是否有效
+        self.process_time = 0.0  # 推理+绘制耗时（毫秒，滑动平均）
+        self.latency = 0.0  # 采集到显示的延迟（毫秒，滑动平均）
+        self.display_time = 0.0  # 最近一帧的显示耗时（毫秒），由 GUI 线程更新
+        self.frames_since_change = 0
+
+    def predict_args(self):
+        return {"imgsz": self.imgsz}
+
+    def update(self, process_time, latency):
+        """输入一帧的处理耗时和端到端延迟（毫秒），必要时调整 imgsz 和跳帧间隔。"""
+        self.process_time = process_time if not self.process_time else 0.8 * self.process_time + 0.2 * process_time
+        self.latency = latency if not self.latency else 0.8 * self.latency + 0.2 * latency
+        self.frames_since_change += 1
+        if self.frames_since_change < self.patience:
+            return
+        if not (self.update_stride() or self.update_imgsz()):
+            return
+        # 参数变化后重新统计
+        self.frames_since_change = 0
+        self.process_time = self.latency = 0.0
+
+    def update_stride(self):
+        """根据端到端延迟调整跳帧间隔，有变化时返回 True。"""
+        latency_budget = self.latency_budget or float("inf")
+        if self.stride_latency is not None:
+            # 上次增大跳帧后延迟没有明显下降，说明瓶颈不在送帧数量上，撤回并不再尝试更大的间隔
+            stride_latency, self.stride_latency = self.stride_latency, None
+            if self.latency > 0.9 * stride_latency:
+                self.stride -= 1
+                self.stride_limit = self.stride
+                return True
+        if self.latency > latency_budget and self.imgsz <= self.min_imgsz and self.stride < self.stride_limit:
+            self.stride_latency = self.latency
+            self.stride += 1
+            return True
+        if self.latency < 0.7 * latency_budget:
+            if self.stride > 1:
+                self.stride -= 1
+                return True
+            self.stride_limit = self.max_stride  # 延迟有余量时允许以后重新尝试跳帧
+        return False
+
+    def update_imgsz(self):
+        """根据每帧处理耗时调整推理尺寸，有变化时返回 True。"""
+        frame_budget = 1000 / self.target_fps if self.target_fps else float("inf")
+        latency_budget = self.latency_budget or float("inf")
+        if self.process_time > frame_budget or self.latency > latency_budget:
+            if self.imgsz > self.min_imgsz:
+                self.imgsz = max(self.imgsz - self.step, self.min_imgsz)
+                return True
+        elif self.stride == 1 and self.process_time < 0.7 * frame_budget and self.latency < 0.7 * latency_budget:
+            if self.imgsz < self.max_imgsz:
+                self.imgsz = min(self.imgsz + self.step, self.max_imgsz)
+                return True
+        return False
+
+
+class CaptureThread(QThread):
+    """采集线程：不断读取视频/摄像头帧，连同采集时间戳放入最新帧队列。"""
+
+    failed = pyqtSignal(str)
+
+    def __init__(self, source, out_queue):
+        super().__init__()
+        self.source = source
+        self.out_queue = out_queue
+        self.meter = FPSMeter()
+        self.running = True
+        self.stream = None
+        self.stale = []  # 多路摄像头时各路画面是否已过期（断线或重连中，显示的是最后一帧）
+
+    def run(self):
+        try:
+            if isinstance(self.source, str) and os.path.isfile(self.source) and not self.source.endswith(".streams"):
+                self.read_file()
+            else:
+                self.read_stream()
+        finally:
+            self.out_queue.close()
+
+    def read_file(self):
+        # 视频文件按原始帧率播放
+        cap = cv2.VideoCapture(self.source)
+        if not cap.isOpened():
+            self.failed.emit(f"无法打开视频源: {self.source}")
+            return
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        interval = 1.0 / fps if fps and fps > 0 else 0.0
+        next_time = time.perf_counter()
+        try:
+            while self.running:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                self.out_queue.put((frame, time.time()))
+                self.meter.tick()
+                if interval:
+                    next_time += interval
+                    delay = next_time - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                    else:
+                        next_time = time.perf_counter()
+        finally:
+            cap.release()
+
+    def read_stream(self):
+        # *.streams 文件中每行一个摄像头地址，多路画面以列表形式一起交给推理线程
+        try:
+            self.stream = LoadStreams(str(self.source), buffer=False)
+        except ConnectionError as e:
+            self.failed.emit(str(e))
+            return
+        try:
+            while self.running:
+                # 不调用 cv2.waitKey，可在 Qt 工作线程中使用；任一路有新帧即返回，断线的摄像头重复最后一帧，不拖慢其他路
+                item = self.stream.read()
+                if item is None:
+                    if not any(thread.is_alive() for thread in self.stream.threads):
+                        break  # 所有摄像头都已结束
+                    continue
+                frames, timestamps, self.stale = item
+                if len(frames) == 1:
+                    self.out_queue.put((frames[0], timestamps[0]))
+                else:
+                    # 延迟按未过期画面中最旧的一帧计算
+                    fresh = [t for t, stale in zip(timestamps, self.stale) if not stale]
+                    self.out_queue.put((frames, min(fresh) if fresh else max(timestamps)))
+                self.meter.tick()
+        finally:
+            self.stream.close(destroy_windows=False)  # HighGUI 窗口只能在 GUI 线程中操作
+
+    def stop(self):
+        self.running = False
+        if self.stream is not None:
+            self.stream.running = False  # 停止后台抓帧，结束等待
+
+
+class InferenceThread(QThread):
+    """推理线程：从采集队列取最新帧，检测并绘制后放入渲染队列。"""
+
+    result_ready = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, process, in_queue, out_queue, controller=None):
+        super().__init__()
+        self.process = process  # (frame, **predict_args) -> (annotated_frame, results)
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+        self.controller = controller
+        self.meter = FPSMeter()
+        self.running = True
+        self.frame_index = 0
+
+    def run(self):
+        try:
+            while self.running:
+                item = self.in_queue.get(timeout=0.1)
+                if item is None:
+                    if self.in_queue.is_finished():
+                        break
+                    continue
+                frame, timestamp = item
+                controller = self.controller
+                self.frame_index += 1
+                if controller is not None and self.frame_index % controller.stride:
+                    continue  # 跳帧
+                capture_time = (time.time() - timestamp) * 1000
+                start = time.perf_counter()
+                annotated_frame, results = self.process(frame, **(controller.predict_args() if controller else {}))
+                process_time = (time.perf_counter() - start) * 1000
+                timings = self.stage_timings(results, capture_time, process_time)
+                if controller is not None:
+                    latency = (time.time() - timestamp) * 1000 + controller.display_time
+                    controller.update(process_time, latency)
+                self.out_queue.put((frame, annotated_frame, results, timings, timestamp))
+                self.meter.tick()
+                self.result_ready.emit()
+        except Exception as e:
+            self.failed.emit(f"检测失败: {e}")
+        finally:
+            self.out_queue.close()
+
+    @staticmethod
+    def stage_timings(results, capture_time, process_time):
+        """汇总一帧（多路时为一批）各阶段耗时（毫秒），predict 内部耗时取自 Results.speed。"""
+        timings = {"capture": capture_time}
+        for stage in ("preprocess", "inference", "postprocess", "plot"):
+            timings[stage] = sum(result.speed.get(stage) or 0.0 for result in results)
+        measured = sum(timings[stage] for stage in ("preprocess", "inference", "postprocess", "plot"))
+        timings["overhead"] = max(process_time - measured, 0.0)  # predict 调用本身的 Python 开销
+        return timings
+
+    def stop(self):
+        self.running = False
+
+
+class LatencyTracker:
+    """逐帧记录各阶段耗时，统计滑动窗口内的 p50/p95，并可把整个会话逐帧写入 CSV。"""
+
+    STAGES = ("capture", "preprocess", "inference", "postprocess", "overhead", "plot", "display", "total")
+
+    def __init__(self, window=300, csv_path=None):
+        self.samples = {stage: collections.deque(maxlen=window) for stage in self.STAGES}
+        self.csv_path = csv_path
+        self.csv_file = None
+        self.csv_writer = None
+        if csv_path:
+            os.makedirs(os.path.dirname(csv_path) or ".", exist_ok=True)
+            self.csv_file = open(csv_path, "w", newline="")
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(["time", *self.STAGES])
+
+    def record(self, timings):
+        for stage in self.STAGES:
+            self.samples[stage].append(timings.get(stage, 0.0))
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(
+                [f"{time.time():.3f}", *(f"{timings.get(stage, 0.0):.2f}" for stage in self.STAGES)]
+            )
+
+    def percentiles(self):
+        """返回 {阶段: (p50, p95)}，单位毫秒。"""
+        return {stage: tuple(np.percentile(v, (50, 95))) for stage, v in self.samples.items() if v}
+
+    def close(self):
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = self.csv_writer = None
+
+
+class ModelCache:
+    """最近使用的模型缓存（LRU），切换回缓存中的模型无需重新加载。"""
+
+    def __init__(self, maxsize=2):
+        self.maxsize = maxsize
+        self.models = collections.OrderedDict()
+
+    def get(self, path):
+        model = self.models.get(path)
+        if model is not None:
+            self.models.move_to_end(path)
+        return model
+
+    def put(self, path, model):
+        self.models[path] = model
+        self.models.move_to_end(path)
+        while len(self.models) > self.maxsize:
+            self.models.popitem(last=False)
+
+
+class ModelLoaderThread(QThread):
+    """模型加载线程：在后台完成加载、融合和预热，完成后再交给界面切换。"""
+
+    loaded = pyqtSignal(str, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, model_path, imgsz=(480, 640)):
+        super().__init__()
+        self.model_path = model_path
+        self.imgsz = imgsz
+
+    def run(self):
+        try:
+            model = YOLO(self.model_path)
+            # 用空白帧预测一次，完成 AutoBackend 初始化、融合和预热，避免切换后第一帧卡顿
+            model.predict_frame(np.zeros((*self.imgsz, 3), dtype=np.uint8))
+            self.loaded.emit(self.model_path, model)
+        except Exception as e:
+            self.failed.emit(f"模型加载失败: {e}")
+
+
+class DetectionPipeline:
+    """采集 → 推理 → 渲染 流水线，各阶段之间用最新帧队列连接。"""
+
+    def __init__(self, source, process, controller=None, tracker=None):
+        self.capture_queue = LatestFrameQueue(maxsize=1)
+        self.render_queue = LatestFrameQueue(maxsize=1)
+        self.controller = controller
+        self.tracker = tracker
+        self.capture_thread = CaptureThread(source, self.capture_queue)
+        self.inference_thread = InferenceThread(process, self.capture_queue, self.render_queue, controller)
+        self.render_meter = FPSMeter()
+        self.latency = 0.0  # 采集到显示的延迟（毫秒，滑动平均）
+
+    def start(self):
+        self.inference_thread.start()
+        self.capture_thread.start()
+
+    def stop(self):
+        self.capture_thread.stop()
+        self.inference_thread.stop()
+        self.capture_queue.close()
+        self.capture_thread.wait()
+        self.inference_thread.wait()
+        if self.tracker is not None:
+            self.tracker.close()
+
+    def latest_result(self):
+        """在 GUI 线程中调用，取出最新的检测结果。"""
+        item = self.render_queue.get_latest()
+        if item is not None:
+            self.render_meter.tick()
+            latency = (time.time() - item[-1]) * 1000
+            self.latency = latency if self.latency == 0 else 0.9 * self.latency + 0.1 * latency
+        return item
+
+    def stats(self):
+        return {
+            "capture": self.capture_thread.meter.fps,
+            "inference": self.inference_thread.meter.fps,
+            "render": self.render_meter.fps,
+            "latency": self.latency,
+            "dropped": self.capture_queue.dropped + self.render_queue.dropped,
+            "stale": [i for i, stale in enumerate(self.capture_thread.stale) if stale],
+        }
+
+
+class AsyncVideoWriter:
+    """后台线程编码写入视频。队列有界，编码跟不上时 write() 才会阻塞（背压）。"""
+
+    def __init__(self, path, fps, frame_size, fourcc="mp4v", queue_size=64):
+        self.path = path
+        self.writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc), fps, frame_size)
+        if not self.writer.isOpened():
+            raise IOError(f"无法创建视频文件: {path} (编码 {fourcc})")
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.frames_written = 0
+        self.blocked_time = 0.0  # 因背压累计等待的时间（秒）
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def write(self, frame):
+        start = time.perf_counter()
+        self.queue.put(frame)
+        self.blocked_time += time.perf_counter() - start
+
+    def run(self):
+        while True:
+            frame = self.queue.get()
+            if frame is None:
+                break
+            self.writer.write(frame)
+            self.frames_written += 1
+        self.writer.release()
+
+    def close(self):
+        """写完队列中剩余的帧并关闭文件。"""
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
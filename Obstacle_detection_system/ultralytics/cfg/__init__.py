@@ -120,6 +120,7 @@ CFG_FRACTION_KEYS = {
     "conf",
     "iou",
     "fraction",
+    "tile_overlap",
 }  # fraction floats 0.0 - 1.0
 CFG_INT_KEYS = {
     "epochs",
@@ -134,6 +135,7 @@ CFG_INT_KEYS = {
     "line_width",
     "nbs",
     "save_period",
+    "topk",
 }
 CFG_BOOL_KEYS = {
     "save",
@@ -170,6 +172,8 @@ CFG_BOOL_KEYS = {
     "nms",
     "profile",
     "multi_scale",
+    "pipelined",
+    "tile_full",
 }
 
 
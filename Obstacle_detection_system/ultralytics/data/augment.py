@@ -747,6 +747,41 @@ class LetterBox:
         new_shape = labels.pop("rect_shape", self.new_shape)
         if isinstance(new_shape, int):
             new_shape = (new_shape, new_shape)
+        ratio, new_unpad, (dw, dh, top, bottom, left, right) = self.get_params(shape, new_shape)
+
+        if shape[::-1] != new_unpad:  # resize
+            img = cv2.resize(img, new_unpad, interpolation=cv2.INTER_LINEAR)
+        img = cv2.copyMakeBorder(
+            img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114)
+        )  # add border
+        if labels.get("ratio_pad"):
+            labels["ratio_pad"] = (labels["ratio_pad"], (left, top))  # for evaluation
+
+        if len(labels):
+            labels = self._update_labels(labels, ratio, dw, dh)
+            labels["img"] = img
+            labels["resized_shape"] = new_shape
+            return labels
+        else:
+            return img
+
+    def get_params(self, shape, new_shape=None):
+        """
+        Computes the letterbox geometry for an image of the given shape.
+
+        Args:
+            shape (tuple): Image shape as (height, width).
+            new_shape (int | tuple, optional): Target shape, defaults to `self.new_shape`.
+
+        Returns:
+            ratio (tuple): Width and height scale ratios.
+            new_unpad (tuple): Resized (width, height) before padding.
+            pad (tuple): Padding as (dw, dh, top, bottom, left, right).
+        """
+        if new_shape is None:
+            new_shape = self.new_shape
+        if isinstance(new_shape, int):
+            new_shape = (new_shape, new_shape)
 
         # Scale ratio (new / old)
         r = min(new_shape[0] / shape[0], new_shape[1] / shape[1])
@@ -768,23 +803,39 @@ class LetterBox:
             dw /= 2  # divide padding into 2 sides
             dh /= 2
 
-        if shape[::-1] != new_unpad:  # resize
-            img = cv2.resize(img, new_unpad, interpolation=cv2.INTER_LINEAR)
         top, bottom = int(round(dh - 0.1)) if self.center else 0, int(round(dh + 0.1))
         left, right = int(round(dw - 0.1)) if self.center else 0, int(round(dw + 0.1))
-        img = cv2.copyMakeBorder(
-            img, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(114, 114, 114)
-        )  # add border
-        if labels.get("ratio_pad"):
-            labels["ratio_pad"] = (labels["ratio_pad"], (left, top))  # for evaluation
+        return ratio, new_unpad, (dw, dh, top, bottom, left, right)
 
-        if len(labels):
-            labels = self._update_labels(labels, ratio, dw, dh)
-            labels["img"] = img
-            labels["resized_shape"] = new_shape
-            return labels
-        else:
-            return img
+    def batch(self, images, out=None):
+        """
+        Letterboxes a list of images straight into one (N, h, w, 3) uint8 array.
+
+        Each image is resized into its slot of `out` and only the borders are filled, giving the same pixels as calling
+        the instance on every image and stacking the results, without the intermediate per-image copies.
+
+        Args:
+            images (List[np.ndarray]): HWC images whose letterboxed outputs share one shape.
+            out (np.ndarray, optional): Preallocated output array to reuse, allocated when None.
+
+        Returns:
+            (np.ndarray): The (N, h, w, 3) batch, `out` if it was given.
+        """
+        for i, img in enumerate(images):
+            shape = img.shape[:2]
+            _, (w, h), (_, _, top, bottom, left, right) = self.get_params(shape)
+            if out is None:
+                out = np.empty((len(images), h + top + bottom, w + left + right, img.shape[2]), dtype=img.dtype)
+            dst = out[i]
+            if shape[::-1] != (w, h):
+                cv2.resize(img, (w, h), dst=dst[top : top + h, left : left + w], interpolation=cv2.INTER_LINEAR)
+            else:
+                dst[top : top + h, left : left + w] = img
+            dst[:top] = 114  # add border
+            dst[top + h :] = 114
+            dst[top : top + h, :left] = 114
+            dst[top : top + h, left + w :] = 114
+        return out
 
     def _update_labels(self, labels, ratio, padw, padh):
         """Update labels."""
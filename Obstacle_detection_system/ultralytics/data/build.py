@@ -173,7 +173,7 @@ def check_source(source):
     return source, webcam, screenshot, from_img, in_memory, tensor
 
 
-def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False):
+def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False, rect=False):
     """
     Loads an inference source for object detection and applies necessary transformations.
 
@@ -182,6 +182,7 @@ def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False):
         batch (int, optional): Batch size for dataloaders. Default is 1.
         vid_stride (int, optional): The frame interval for video sources. Default is 1.
         buffer (bool, optional): Determined whether stream frames will be buffered. Default is False.
+        rect (bool, optional): Group images of similar aspect ratio into the same batch. Default is False.
 
     Returns:
         dataset (Dataset): A dataset object for the specified input source.
@@ -201,7 +202,7 @@ def load_inference_source(source=None, batch=1, vid_stride=1, buffer=False):
     elif from_img:
         dataset = LoadPilAndNumpy(source)
     else:
-        dataset = LoadImagesAndVideos(source, batch=batch, vid_stride=vid_stride)
+        dataset = LoadImagesAndVideos(source, batch=batch, vid_stride=vid_stride, rect=rect)
 
     # Attach source types to the dataset
     setattr(dataset, "source_type", source_type)
@@ -5,6 +5,7 @@ import math
 import os
 import time
 from dataclasses import dataclass
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from threading import Thread
 from urllib.parse import urlparse
@@ -15,8 +16,8 @@ import requests
 import torch
 from PIL import Image
 
-from ultralytics.data.utils import FORMATS_HELP_MSG, IMG_FORMATS, VID_FORMATS
-from ultralytics.utils import IS_COLAB, IS_KAGGLE, LOGGER, ops
+from ultralytics.data.utils import FORMATS_HELP_MSG, IMG_FORMATS, VID_FORMATS, exif_size
+from ultralytics.utils import IS_COLAB, IS_KAGGLE, LOGGER, NUM_THREADS, ops
 from ultralytics.utils.checks import check_requirements
 
 
@@ -41,6 +42,10 @@ class LoadStreams:
         running (bool): Flag to indicate if the streaming thread is running.
         mode (str): Set to 'stream' indicating real-time capture.
         imgs (list): List of image frames for each stream.
+        times (list): List of capture timestamps (seconds since epoch) for the frames in `imgs`.
+        timestamps (list): Capture timestamps of the frames returned by the last `__next__` or `read` call.
+        last_imgs (list): Last frame returned by `read` for each stream, reused while a stream delivers no new frames.
+        reconnect_delay (tuple): Initial and maximum delay in seconds between reconnection attempts.
         fps (list): List of FPS for each stream.
         frames (list): List of total frames for each stream.
         threads (list): List of threads for each stream.
@@ -51,6 +56,7 @@ class LoadStreams:
     Methods:
         __init__: Initialize the stream loader.
         update: Read stream frames in daemon thread.
+        read: Return the newest frame of each stream without HighGUI calls, for use from worker threads.
         close: Close stream loader and release resources.
         __iter__: Returns an iterator object for the class.
         __next__: Returns source paths, transformed, and original images for processing.
@@ -69,6 +75,7 @@ class LoadStreams:
         self.running = True  # running flag for Thread
         self.mode = "stream"
         self.vid_stride = vid_stride  # video frame-rate stride
+        self.reconnect_delay = (0.5, 16.0)  # exponential backoff between reconnection attempts (initial, max)
 
         sources = Path(sources).read_text().rsplit() if os.path.isfile(sources) else [sources]
         n = len(sources)
@@ -78,6 +85,9 @@ class LoadStreams:
         self.threads = [None] * n
         self.caps = [None] * n  # video capture objects
         self.imgs = [[] for _ in range(n)]  # images
+        self.times = [[] for _ in range(n)]  # capture timestamps
+        self.timestamps = [0.0] * n  # capture timestamps of the last returned frames
+        self.last_imgs = [None] * n  # last frames returned by read()
         self.shape = [[] for _ in range(n)]  # image shapes
         self.sources = [ops.clean_str(x) for x in sources]  # clean source names for later
         for i, s in enumerate(sources):  # index, source
@@ -107,6 +117,7 @@ class LoadStreams:
             if not success or im is None:
                 raise ConnectionError(f"{st}Failed to read images from {s}")
             self.imgs[i].append(im)
+            self.times[i].append(time.time())
             self.shape[i] = im.shape
             self.threads[i] = Thread(target=self.update, args=([i, self.caps[i], s]), daemon=True)
             LOGGER.info(f"{st}Success ✅ ({self.frames[i]} frames of shape {w}x{h} at {self.fps[i]:.2f} FPS)")
@@ -114,27 +125,84 @@ class LoadStreams:
         LOGGER.info("")  # newline
 
     def update(self, i, cap, stream):
-        """Read stream `i` frames in daemon thread."""
+        """Read stream `i` frames in daemon thread, reconnecting with exponential backoff if the signal is lost."""
         n, f = 0, self.frames[i]  # frame number, frame array
-        while self.running and cap.isOpened() and n < (f - 1):
-            if len(self.imgs[i]) < 30:  # keep a <=30-image buffer
+        delay = self.reconnect_delay[0]
+        while self.running and n < (f - 1):
+            if not cap.isOpened():
+                self._wait(delay)
+                delay = min(delay * 2, self.reconnect_delay[1])
+                if self.running and not cap.open(stream):  # re-open stream if signal was lost
+                    LOGGER.warning(f"WARNING ⚠️ Reconnecting to stream {i} failed, retrying in {delay:.1f}s...")
+            elif len(self.imgs[i]) < 30:  # keep a <=30-image buffer
                 n += 1
                 cap.grab()  # .read() = .grab() followed by .retrieve()
+                t = time.time()  # capture timestamp
                 if n % self.vid_stride == 0:
                     success, im = cap.retrieve()
                     if not success:
-                        im = np.zeros(self.shape[i], dtype=np.uint8)
                         LOGGER.warning("WARNING ⚠️ Video stream unresponsive, please check your IP camera connection.")
-                        cap.open(stream)  # re-open stream if signal was lost
-                    if self.buffer:
-                        self.imgs[i].append(im)
+                        cap.release()  # reconnect on the next iteration
                     else:
-                        self.imgs[i] = [im]
+                        delay = self.reconnect_delay[0]
+                        if self.buffer:
+                            self.times[i].append(t)
+                            self.imgs[i].append(im)
+                        else:
+                            self.imgs[i] = [im]
+                            self.times[i] = [t]
             else:
                 time.sleep(0.01)  # wait until the buffer is empty
 
-    def close(self):
-        """Close stream loader and release resources."""
+    def _wait(self, seconds):
+        """Sleep for up to `seconds`, returning early once the loader is closed."""
+        end = time.time() + seconds
+        while self.running and time.time() < end:
+            time.sleep(0.05)
+
+    def read(self, timeout=0.5, stale_after=1.0):
+        """
+        Return the newest frame of each stream as soon as any stream has a new one, without polling HighGUI.
+
+        Unlike iterating the loader, this never calls `cv2.waitKey`, so it is safe to call from threads other than the
+        GUI thread, and one stream that stalls or reconnects does not hold back the others. Streams without a new frame
+        repeat the last frame returned for them, and are reported as stale once that frame is older than
+        `stale_after` seconds. Older buffered frames are discarded.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait for a new frame.
+            stale_after (float): Age in seconds after which the frame of a stream is reported as stale.
+
+        Returns:
+            (tuple | None): Lists of frames, of their capture timestamps and of stale flags, or None on timeout or once
+                all reading threads have stopped.
+        """
+        end = time.time() + timeout
+        while self.running and any(thread.is_alive() for thread in self.threads):
+            if any(self.imgs):
+                now = time.time()
+                frames, stale = [], []
+                for i, x in enumerate(self.imgs):
+                    if x and self.buffer:  # drop the consumed frames and their timestamps, the reader only appends
+                        n = len(x)
+                        self.timestamps[i], self.last_imgs[i] = self.times[i][n - 1], x[n - 1]
+                        del x[:n], self.times[i][:n]
+                    elif x:
+                        self.timestamps[i] = self.times[i][-1]  # read first, a racing update only ages it
+                        self.last_imgs[i] = x.pop(-1)
+                        x.clear()
+                    if self.last_imgs[i] is None:
+                        self.last_imgs[i] = np.zeros(self.shape[i], dtype=np.uint8)
+                    frames.append(self.last_imgs[i])
+                    stale.append(now - self.timestamps[i] > stale_after)
+                return frames, list(self.timestamps), stale
+            if time.time() > end:
+                break
+            time.sleep(0.002)
+        return None
+
+    def close(self, destroy_windows=True):
+        """Close stream loader and release resources, and HighGUI windows if `destroy_windows` is True."""
         self.running = False  # stop flag for Thread
         for thread in self.threads:
             if thread.is_alive():
@@ -144,7 +212,8 @@ class LoadStreams:
                 cap.release()  # release video capture
             except Exception as e:
                 LOGGER.warning(f"WARNING ⚠️ Could not release VideoCapture object: {e}")
-        cv2.destroyAllWindows()
+        if destroy_windows:
+            cv2.destroyAllWindows()
 
     def __iter__(self):
         """Iterates through YOLO image feed and re-opens unresponsive streams."""
@@ -169,10 +238,12 @@ class LoadStreams:
 
             # Get and remove the first frame from imgs buffer
             if self.buffer:
+                self.timestamps[i] = self.times[i].pop(0)
                 images.append(x.pop(0))
 
             # Get the last frame, and clear the rest from the imgs buffer
             else:
+                self.timestamps[i] = self.times[i][-1]  # read before the frame, a racing update only makes it older
                 images.append(x.pop(-1) if x else np.zeros(self.shape[i], dtype=np.uint8))
                 x.clear()
 
@@ -266,12 +337,17 @@ class LoadImagesAndVideos:
         frame (int): Frame counter for video.
         frames (int): Total number of frames in the video.
         count (int): Counter for iteration, initialized at 0 during `__iter__()`.
+        order (list | None): Input index of each image in iteration order when `rect` bucketing reordered them.
+        pool (ThreadPool | None): Image decoding threads, created on the first multi-image batch and closed at the end.
 
     Methods:
+        _imread(files): Read a batch of images, decoding them in parallel threads.
+        _close_pool(): Close the image decoding threads.
+        _rect_order(files, batch): Order images by aspect ratio within windows of batches.
         _new_video(path): Create a new cv2.VideoCapture object for a given video path.
     """
 
-    def __init__(self, path, batch=1, vid_stride=1):
+    def __init__(self, path, batch=1, vid_stride=1, rect=False):
         """Initialize the Dataloader and raise FileNotFoundError if file not found."""
         parent = None
         if isinstance(path, str) and Path(path).suffix == ".txt":  # *.txt file with img/vid/dir on each line
@@ -300,6 +376,10 @@ class LoadImagesAndVideos:
             elif suffix in VID_FORMATS:
                 videos.append(f)
         ni, nv = len(images), len(videos)
+        self.order = None
+        if rect and batch > 1 and ni > 1:  # aspect-ratio buckets, predictor restores input order
+            self.order = self._rect_order(images, batch)
+            images = [images[i] for i in self.order]
 
         self.files = images + videos
         self.nf = ni + nv  # number of files
@@ -308,6 +388,7 @@ class LoadImagesAndVideos:
         self.mode = "image"
         self.vid_stride = vid_stride  # video frame-rate stride
         self.bs = batch
+        self.pool = None
         if any(videos):
             self._new_video(videos[0])  # new video
         else:
@@ -328,6 +409,7 @@ class LoadImagesAndVideos:
                 if len(imgs) > 0:
                     return paths, imgs, info  # return last partial batch
                 else:
+                    self._close_pool()
                     raise StopIteration
 
             path = self.files[self.count]
@@ -360,18 +442,57 @@ class LoadImagesAndVideos:
                         self._new_video(self.files[self.count])
             else:
                 self.mode = "image"
-                im0 = cv2.imread(path)  # BGR
-                if im0 is None:
-                    raise FileNotFoundError(f"Image Not Found {path}")
-                paths.append(path)
-                imgs.append(im0)
-                info.append(f"image {self.count + 1}/{self.nf} {path}: ")
-                self.count += 1  # move to the next file
+                files = self.files[self.count : min(self.count + self.bs - len(imgs), self.ni)]
+                for path, im0 in zip(files, self._imread(files)):
+                    if im0 is None:
+                        raise FileNotFoundError(f"Image Not Found {path}")
+                    paths.append(path)
+                    imgs.append(im0)
+                    info.append(f"image {self.count + 1}/{self.nf} {path}: ")
+                    self.count += 1  # move to the next file
                 if self.count >= self.ni:  # end of image list
                     break
 
         return paths, imgs, info
 
+    def _imread(self, files):
+        """Reads a list of images as BGR arrays, decoding batches in parallel threads (cv2 releases the GIL)."""
+        if len(files) == 1:
+            return [cv2.imread(files[0])]
+        if self.pool is None:
+            self.pool = ThreadPool(min(NUM_THREADS, self.bs))
+        return self.pool.map(cv2.imread, files)
+
+    def _close_pool(self):
+        """Closes the image decoding threads, a later batch creates a new pool."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+    def __del__(self):
+        """Closes the image decoding threads when the loader is garbage collected before the end of iteration."""
+        if getattr(self, "pool", None) is not None:
+            self.pool.terminate()
+
+    @staticmethod
+    def _rect_order(files, batch, window=32):
+        """
+        Order images by aspect ratio so that each batch holds similar shapes and can use a tight rectangle.
+
+        Sorting is done within windows of `window` batches, which bounds how many results the predictor buffers to
+        return them in input order. Image sizes are read from file headers without decoding.
+        """
+        ratios = []
+        for f in files:
+            try:
+                w, h = exif_size(Image.open(f))
+                ratios.append(h / w)
+            except Exception:
+                ratios.append(1.0)
+        n = batch * window
+        windows = (range(s, min(s + n, len(files))) for s in range(0, len(files), n))
+        return [i for w in windows for i in sorted(w, key=ratios.__getitem__)]
+
     def _new_video(self, path):
         """Creates a new video capture object for the given path."""
         self.frame = 0
@@ -65,6 +65,7 @@ class Model(nn.Module):
         info: Logs or returns information about the model.
         fuse: Fuses Conv2d and BatchNorm2d layers for optimized inference.
         predict: Performs object detection predictions.
+        predict_frame: Performs low-overhead predictions on in-memory frames for real-time loops.
         track: Performs object tracking.
         val: Validates the model on a dataset.
         benchmark: Benchmarks the model on various export formats.
@@ -120,6 +121,8 @@ class Model(nn.Module):
         super().__init__()
         self.callbacks = callbacks.get_default_callbacks()
         self.predictor = None  # reuse predictor
+        self._frame_args = None  # predict_frame() arguments currently applied to the predictor
+        self._predict_args = None  # predictor arguments replaced by predict_frame(), restored by predict()
         self.model = None  # model object
         self.trainer = None  # trainer object
         self.ckpt = None  # if loaded from *.pt
@@ -444,13 +447,51 @@ class Model(nn.Module):
             self.predictor = predictor or self._smart_load("predictor")(overrides=args, _callbacks=self.callbacks)
             self.predictor.setup_model(model=self.model, verbose=is_cli)
         else:  # only update args if predictor is already setup
+            if self._predict_args is not None:  # drop the per-frame overrides of predict_frame()
+                self.predictor.args, self._predict_args = self._predict_args, None
             self.predictor.args = get_cfg(self.predictor.args, args)
             if "project" in args or "name" in args:
                 self.predictor.save_dir = get_save_dir(self.predictor.args)
+        self._frame_args = None  # predict_frame() must re-apply its own arguments
         if prompts and hasattr(self.predictor, "set_prompts"):  # for SAM-type models
             self.predictor.set_prompts(prompts)
         return self.predictor.predict_cli(source=source) if is_cli else self.predictor(source=source, stream=stream)
 
+    def predict_frame(self, frame: Union[np.ndarray, list], **kwargs) -> list:
+        """
+        Performs low-overhead predictions on in-memory frames, intended for real-time camera and video loops.
+
+        Unlike `predict`, this method reuses the warmed-up predictor and skips source and dataset construction,
+        callbacks and per-frame logging. Arguments are validated only when `kwargs` differ from the previous call, so
+        repeated calls with the same arguments cost little more than preprocess, inference and postprocess. Results are
+        never saved or shown, and trackers registered through `track` are not updated. The per-frame arguments are kept
+        apart from those of `predict`, which restores its own arguments on its next call.
+
+        Args:
+            frame (np.ndarray | List[np.ndarray]): A BGR HWC frame, or a list of frames predicted as one batch.
+            **kwargs (any): Prediction arguments such as 'conf', 'iou', 'classes' or 'imgsz'.
+
+        Returns:
+            (List[ultralytics.engine.results.Results]): One Results object per frame.
+
+        Examples:
+            >>> model = YOLO("yolov8n.pt")
+            >>> for frame in frames:
+            ...     results = model.predict_frame(frame, conf=0.5)
+        """
+        if not self.predictor or kwargs != self._frame_args:
+            if not self.predictor:
+                args = {**self.overrides, "conf": 0.25, "batch": 1, "save": False, "mode": "predict"}  # as predict()
+                self.predictor = self._smart_load("predictor")(overrides=args, _callbacks=self.callbacks)
+                self.predictor.setup_model(model=self.model, verbose=False)
+            if self._predict_args is None:
+                self._predict_args = self.predictor.args  # shared arguments, restored by predict()
+            custom = {"conf": 0.25, "batch": 1, "save": False, "show": False, "verbose": False, "mode": "predict"}
+            self.predictor.args = get_cfg(self._predict_args, {**custom, **kwargs})  # a copy, shared args untouched
+            self.predictor.imgsz = None  # re-check image size and head options on the next frame
+            self._frame_args = dict(kwargs)
+        return self.predictor.predict_frame(frame)
+
     def track(
         self,
         source: Union[str, Path, int, list, tuple, np.ndarray, torch.Tensor] = None,
@@ -723,6 +764,7 @@ class Model(nn.Module):
         self._check_is_pytorch_model()
         self = super()._apply(fn)  # noqa
         self.predictor = None  # reset predictor as device may have changed
+        self._frame_args = self._predict_args = None
         self.overrides["device"] = self.device  # was str(self.device) i.e. device(type='cuda', index=0) -> 'cuda:0'
         return self
 
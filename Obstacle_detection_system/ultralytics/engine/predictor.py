@@ -29,9 +29,13 @@ Usage - formats:
                               yolov8n_ncnn_model         # NCNN
 """
 
+import math
 import platform
+import queue
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from pathlib import Path
 
 import cv2
@@ -42,10 +46,11 @@ from ultralytics.cfg import get_cfg, get_save_dir
 from ultralytics.data import load_inference_source
 from ultralytics.data.augment import LetterBox, classify_transforms
 from ultralytics.nn.autobackend import AutoBackend
+from ultralytics.nn.tasks import Ensemble
 from ultralytics.utils import DEFAULT_CFG, LOGGER, MACOS, WINDOWS, callbacks, colorstr, ops
 from ultralytics.utils.checks import check_imgsz, check_imshow
 from ultralytics.utils.files import increment_path
-from ultralytics.utils.torch_utils import select_device, smart_inference_mode
+from ultralytics.utils.torch_utils import TORCH_1_9, select_device, smart_inference_mode
 
 STREAM_WARNING = """
 WARNING ⚠️ inference results will accumulate in RAM unless `stream=True` is passed, causing potential out-of-memory
@@ -75,6 +80,9 @@ class BasePredictor:
         device (torch.device): Device used for prediction.
         dataset (Dataset): Dataset used for prediction.
         vid_writer (dict): Dictionary of {save_path: video_writer, ...} writer for saving video output.
+        frame_skipping (bool): Whether callbacks may skip inference on batches, which requires the serial predict loop.
+        skip_inference (bool): Set by 'on_predict_batch_start' callbacks to skip inference on the current batch.
+        reid_hook (FeatureHook | None): Captures the detection head inputs of each inference call, set by trackers.
     """
 
     def __init__(self, cfg=DEFAULT_CFG, overrides=None, _callbacks=None):
@@ -105,10 +113,18 @@ class BasePredictor:
         self.seen = 0
         self.windows = []
         self.batch = None
+        self.dataset_state = None  # dataset mode/count/fps captured when self.batch was read
         self.results = None
+        self.pending_results = {}  # rect bucketed results waiting for earlier inputs, {input index: Results}
+        self.result_count = 0  # results received from the model in iteration order
         self.transforms = None
+        self.input_buffer = None  # reused uint8 (N, h, w, 3) letterbox staging tensor
+        self.input_tensor = None  # reused normalized (N, 3, h, w) model input
         self.callbacks = _callbacks or callbacks.get_default_callbacks()
         self.txt_path = None
+        self.frame_skipping = False  # set in 'on_predict_start' callbacks, e.g. by trackers detecting every n frames
+        self.skip_inference = False
+        self.reid_hook = None  # set in 'on_predict_start' callbacks by trackers pooling ReID features
         self._lock = threading.Lock()  # for automatic thread-safe inference
         callbacks.add_integration_callbacks(self)
 
@@ -120,11 +136,15 @@ class BasePredictor:
             im (torch.Tensor | List(np.ndarray)): BCHW for tensor, [(HWC) x B] for list.
         """
         not_tensor = not isinstance(im, torch.Tensor)
-        if not_tensor:
+        if self.sliced(im):
+            im = self.slice(im)
+        if not_tensor and type(self).pre_transform is not BasePredictor.pre_transform:  # custom pre_transform
             im = np.stack(self.pre_transform(im))
             im = im[..., ::-1].transpose((0, 3, 1, 2))  # BGR to RGB, BHWC to BCHW, (n, 3, h, w)
             im = np.ascontiguousarray(im)  # contiguous
             im = torch.from_numpy(im)
+        elif not_tensor:
+            return self.preprocess_batch(im)
 
         im = im.to(self.device)
         im = im.half() if self.model.fp16 else im.float()  # uint8 to fp16/32
@@ -132,6 +152,45 @@ class BasePredictor:
             im /= 255  # 0 - 255 to 0.0 - 1.0
         return im
 
+    def preprocess_batch(self, im):
+        """
+        Letterboxes, converts and normalizes a list of BGR images in one pass over reused buffers.
+
+        Images are resized straight into a (N, h, w, 3) uint8 staging tensor, pinned when running on CUDA, which is
+        copied to the device once and converted channel by channel (BGR to RGB, BHWC to BCHW) into the input tensor.
+        Both buffers are reused while the batch shape is unchanged; the input tensor is not reused in pipelined mode,
+        where the next batch is preprocessed while the current one is still in use, nor across a change of inference
+        mode, since inference tensors cannot be updated in place outside of it.
+
+        Args:
+            im (List(np.ndarray)): [(HWC) x B] BGR images.
+
+        Returns:
+            (torch.Tensor): The normalized (B, 3, h, w) input tensor on the model device.
+        """
+        letterbox = self.get_letterbox(im)
+        _, (w, h), (_, _, top, bottom, left, right) = letterbox.get_params(im[0].shape[:2])
+        shape = (len(im), h + top + bottom, w + left + right, 3)
+        if self.input_buffer is None or self.input_buffer.shape != shape:
+            self.input_buffer = torch.empty(shape, dtype=torch.uint8, pin_memory=self.device.type == "cuda")
+            self.input_tensor = None
+        letterbox.batch(im, out=self.input_buffer.numpy())
+
+        src = self.input_buffer.to(self.device)
+        dtype = torch.half if self.model.fp16 else torch.float
+        dst = self.input_tensor
+        if (
+            dst is None
+            or dst.dtype != dtype
+            or self.args.pipelined
+            or (TORCH_1_9 and dst.is_inference() != torch.is_inference_mode_enabled())
+        ):
+            dst = torch.empty((shape[0], 3, *shape[1:3]), dtype=dtype, device=self.device)
+            self.input_tensor = None if self.args.pipelined else dst
+        for c in range(3):
+            dst[:, c].copy_(src[..., 2 - c])  # BGR to RGB, BHWC to BCHW, uint8 to fp16/32
+        return dst.div_(255)  # 0 - 255 to 0.0 - 1.0
+
     def inference(self, im, *args, **kwargs):
         """Runs inference on a given image using the specified model and arguments."""
         visualize = (
@@ -139,7 +198,27 @@ class BasePredictor:
             if self.args.visualize and (not self.source_type.tensor)
             else False
         )
-        return self.model(im, augment=self.args.augment, visualize=visualize, embed=self.args.embed, *args, **kwargs)
+        with self.head_topk(), self.reid_hook.record() if self.reid_hook is not None else nullcontext():
+            return self.model(
+                im, augment=self.args.augment, visualize=visualize, embed=self.args.embed, *args, **kwargs
+            )
+
+    def get_letterbox(self, im):
+        """
+        Returns the LetterBox transform used to resize a batch of images.
+
+        Args:
+            im (List(np.ndarray)): [(h, w, 3) x N] images of the batch.
+        """
+        same_shapes = len({x.shape for x in im}) == 1
+        if self.args.rect and not same_shapes and self.model.pt:
+            # Tight rectangle holding every image scaled to fit imgsz, as BaseDataset.set_rectangle does for val
+            r = [min(self.imgsz[0] / x.shape[0], self.imgsz[1] / x.shape[1]) for x in im]
+            h = max(round(x.shape[0] * ri) for x, ri in zip(im, r))
+            w = max(round(x.shape[1] * ri) for x, ri in zip(im, r))
+            stride = self.model.stride
+            return LetterBox((math.ceil(h / stride) * stride, math.ceil(w / stride) * stride), stride=stride)
+        return LetterBox(self.imgsz, auto=same_shapes and self.model.pt, stride=self.model.stride)
 
     def pre_transform(self, im):
         """
@@ -151,10 +230,97 @@ class BasePredictor:
         Returns:
             (list): A list of transformed images.
         """
-        same_shapes = len({x.shape for x in im}) == 1
-        letterbox = LetterBox(self.imgsz, auto=same_shapes and self.model.pt, stride=self.model.stride)
+        letterbox = self.get_letterbox(im)
         return [letterbox(image=x) for x in im]
 
+    def get_tiles(self, shape):
+        """
+        Returns the windows sliced inference runs on for an image, a grid of overlapping `tile` sized windows.
+
+        Tiles are spread evenly so that neighbours share at least `tile_overlap` of the tile size and the last row and
+        column end at the image border. The full frame is appended as the last window if `tile_full` is set.
+
+        Args:
+            shape (tuple): Image shape (h, w, ...).
+
+        Returns:
+            (List[tuple]): (x0, y0, x1, y1) pixel windows.
+        """
+        h, w = shape[:2]
+        th, tw = (self.args.tile, self.args.tile) if isinstance(self.args.tile, int) else self.args.tile
+        starts = []
+        for size, t in (h, th), (w, tw):
+            t = min(t, size)
+            n = math.ceil((size - t) / max(round(t * (1 - self.args.tile_overlap)), 1)) + 1  # tiles along this axis
+            starts.append([round(i * (size - t) / (n - 1)) if n > 1 else 0 for i in range(n)])
+        th, tw = min(th, h), min(tw, w)
+        windows = [(x, y, x + tw, y + th) for y in starts[0] for x in starts[1]]
+        if self.args.tile_full and len(windows) > 1:
+            windows.append((0, 0, w, h))
+        return windows
+
+    def sliced(self, im):
+        """Whether images are predicted with sliced inference, only supported by the detection postprocess."""
+        from ultralytics.models.yolo.detect import DetectionPredictor  # scope to avoid circular import
+
+        supported = type(self).postprocess is DetectionPredictor.postprocess
+        return bool(self.args.tile) and isinstance(im, list) and supported
+
+    def slice(self, im):
+        """
+        Cuts images into the windows of `get_tiles` for sliced inference, all predicted together as one batch.
+
+        Args:
+            im (List(np.ndarray)): [(HWC) x B] images.
+
+        Returns:
+            (List(np.ndarray)): Tiles of all images, image by image, as views into the images.
+        """
+        return [x[y0:y1, x0:x1] for x in im for x0, y0, x1, y1 in self.get_tiles(x.shape)]
+
+    def merge_tiles(self, preds, img, orig_imgs):
+        """
+        Maps per-tile detections back to their images and merges them with class-aware NMS, or `fusion` if set.
+
+        Boxes are scaled from the letterboxed tile to the tile with `ops.scale_boxes` and shifted by the tile position.
+        With a full-frame pass, tile boxes touching an inner tile border are dropped first: objects smaller than the
+        overlap are found whole in a neighbouring tile, and larger ones by the full-frame pass.
+
+        Args:
+            preds (List[torch.Tensor]): Per-tile detections (x1, y1, x2, y2, confidence, class, ...) in `img` pixels.
+            img (torch.Tensor): The preprocessed batch of tiles.
+            orig_imgs (List(np.ndarray)): The images the tiles were cut from.
+
+        Returns:
+            (List[torch.Tensor]): Per-image detections in original image pixels, most confident first.
+        """
+        import torchvision  # scope for faster 'import ultralytics'
+
+        merged, k = [], 0
+        for im0 in orig_imgs:
+            h, w = im0.shape[:2]
+            windows = self.get_tiles(im0.shape)
+            full = self.args.tile_full and len(windows) > 1
+            x = []
+            for j, (x0, y0, x1, y1) in enumerate(windows):
+                p = preds[k + j]
+                p[:, :4] = ops.scale_boxes(img.shape[2:], p[:, :4], (y1 - y0, x1 - x0))
+                p[:, :4] += torch.tensor([x0, y0, x0, y0], device=p.device, dtype=p.dtype)
+                if full and j < len(windows) - 1:  # drop boxes cut by an inner tile border
+                    cut = (p[:, 0] < x0 + 1) & (x0 > 0) | (p[:, 2] > x1 - 1) & (x1 < w)
+                    cut |= (p[:, 1] < y0 + 1) & (y0 > 0) | (p[:, 3] > y1 - 1) & (y1 < h)
+                    p = p[~cut]
+                x.append(p)
+            k += len(windows)
+            x = torch.cat(x)
+            boxes = x[:, :4] + x[:, 5:6] * (0 if self.args.agnostic_nms else 7680)  # offset by class
+            i = torchvision.ops.nms(boxes, x[:, 4], self.args.iou)[: self.args.max_det]
+            if self.args.fusion:
+                merged.append(ops.fuse_boxes(x, boxes, i, self.args.iou, self.args.fusion, self.fusion_sources))
+            else:
+                merged.append(x[i])
+        return merged
+
     def postprocess(self, preds, img, orig_imgs):
         """Post-processes predictions for an image and returns them."""
         return preds
@@ -177,8 +343,8 @@ class BasePredictor:
         for _ in gen:  # noqa, running CLI inference without accumulating any outputs (do not modify)
             pass
 
-    def setup_source(self, source):
-        """Sets up source and inference mode."""
+    def setup_imgsz(self):
+        """Checks the inference image size and sets up classification transforms for the current arguments."""
         self.imgsz = check_imgsz(self.args.imgsz, stride=self.model.stride, min_dim=2)  # check image size
         self.transforms = (
             getattr(
@@ -189,11 +355,36 @@ class BasePredictor:
             if self.args.task == "classify"
             else None
         )
+
+    @contextmanager
+    def head_topk(self):
+        """Applies the `topk` argument to the Detect head of a PyTorch model for one forward pass, then restores it."""
+        head = self.model.model.model[-1] if self.model.pt and hasattr(self.model.model, "model") else None
+        if not hasattr(head, "topk"):
+            yield
+            return
+        topk, head.topk = head.topk, self.args.topk
+        try:
+            yield
+        finally:
+            head.topk = topk
+
+    @property
+    def fusion_sources(self):
+        """Number of predictions made per object for box fusion, ensemble models times test-time augmentations."""
+        model = getattr(self.model, "model", None)
+        n = len(model) if isinstance(model, Ensemble) else 1
+        return n * 3 if self.args.augment else n  # DetectionModel augments at 3 scales
+
+    def setup_source(self, source):
+        """Sets up source and inference mode."""
+        self.setup_imgsz()
         self.dataset = load_inference_source(
             source=source,
             batch=self.args.batch,
             vid_stride=self.args.vid_stride,
             buffer=self.args.stream_buffer,
+            rect=self.args.rect,
         )
         self.source_type = self.dataset.source_type
         if not getattr(self, "stream", True) and (
@@ -229,50 +420,54 @@ class BasePredictor:
                 self.done_warmup = True
 
             self.seen, self.windows, self.batch = 0, [], None
+            self.pending_results, self.result_count = {}, 0
             profilers = (
                 ops.Profile(device=self.device),
                 ops.Profile(device=self.device),
                 ops.Profile(device=self.device),
             )
             self.run_callbacks("on_predict_start")
-            for self.batch in self.dataset:
-                self.run_callbacks("on_predict_batch_start")
-                paths, im0s, s = self.batch
+            if self.args.pipelined and not (
+                self.frame_skipping
+                or self.args.embed
+                or self.args.show
+                or self.args.visualize
+                or self.source_type.stream
+                or self.source_type.screenshot
+            ):
+                im = yield from self.pipelined_inference(profilers, *args, **kwargs)
+            else:
+                im = None
+                for self.batch in self.dataset:
+                    self.dataset_state = self.get_dataset_state()
+                    self.skip_inference = False
+                    self.run_callbacks("on_predict_batch_start")
+                    paths, im0s, s = self.batch
+                    if self.skip_inference and im is not None:
+                        yield from self.skipped_inference(im, profilers)
+                        continue
+                    self.skip_inference = False  # no earlier input to report shapes against
 
-                # Preprocess
-                with profilers[0]:
-                    im = self.preprocess(im0s)
+                    # Preprocess
+                    with profilers[0]:
+                        im = self.preprocess(im0s)
 
-                # Inference
-                with profilers[1]:
-                    preds = self.inference(im, *args, **kwargs)
-                    if self.args.embed:
-                        yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
-                        continue
+                    # Inference
+                    with profilers[1]:
+                        preds = self.inference(im, *args, **kwargs)
+                        if self.args.embed:
+                            yield from [preds] if isinstance(preds, torch.Tensor) else preds  # yield embedding tensors
+                            continue
+
+                    # Postprocess
+                    with profilers[2]:
+                        self.results = self.postprocess(preds, im, im0s)
+                    self.run_callbacks("on_predict_postprocess_end")
 
-                # Postprocess
-                with profilers[2]:
-                    self.results = self.postprocess(preds, im, im0s)
-                self.run_callbacks("on_predict_postprocess_end")
-
-                # Visualize, save, write results
-                n = len(im0s)
-                for i in range(n):
-                    self.seen += 1
-                    self.results[i].speed = {
-                        "preprocess": profilers[0].dt * 1e3 / n,
-                        "inference": profilers[1].dt * 1e3 / n,
-                        "postprocess": profilers[2].dt * 1e3 / n,
-                    }
-                    if self.args.verbose or self.args.save or self.args.save_txt or self.args.show:
-                        s[i] += self.write_results(i, Path(paths[i]), im, s)
-
-                # Print batch results
-                if self.args.verbose:
-                    LOGGER.info("\n".join(s))
-
-                self.run_callbacks("on_predict_batch_end")
-                yield from self.results
+                    # Visualize, save, write results
+                    self.write_batch(im, [x.dt for x in profilers])
+                    self.run_callbacks("on_predict_batch_end")
+                    yield from self.restore_order(self.results)
 
         # Release assets
         for v in self.vid_writer.values():
@@ -292,6 +487,212 @@ class BasePredictor:
             LOGGER.info(f"Results saved to {colorstr('bold', self.save_dir)}{s}")
         self.run_callbacks("on_predict_end")
 
+    @smart_inference_mode()
+    def predict_frame(self, im0s):
+        """
+        Runs inference on in-memory frames without building a dataset, for low-overhead real-time loops.
+
+        The image size is only checked when `self.imgsz` has been reset, and callbacks, logging, saving and showing are
+        skipped entirely, so per-call overhead is limited to preprocess, inference and postprocess.
+
+        Args:
+            im0s (np.ndarray | List[np.ndarray]): A BGR HWC frame, or a list of frames predicted as one batch.
+
+        Returns:
+            (List[ultralytics.engine.results.Results]): One Results object per frame.
+        """
+        if not isinstance(im0s, list):
+            im0s = [im0s]
+        n = len(im0s)
+        with self._lock:  # for thread-safe inference
+            if self.imgsz is None:
+                self.setup_imgsz()
+            if not self.done_warmup:
+                self.model.warmup(imgsz=(1 if self.model.pt or self.model.triton else n, 3, *self.imgsz))
+                self.done_warmup = True
+            self.batch = ([f"image{i}.jpg" for i in range(n)], im0s, [""] * n)
+            profilers = (
+                ops.Profile(device=self.device),
+                ops.Profile(device=self.device),
+                ops.Profile(device=self.device),
+            )
+            with profilers[0]:
+                im = self.preprocess(im0s)
+            with profilers[1]:
+                preds = self.inference(im)
+            with profilers[2]:
+                self.results = self.postprocess(preds, im, im0s)
+            self.seen += n
+            for result in self.results:
+                result.speed = {
+                    "preprocess": profilers[0].dt * 1e3 / n,
+                    "inference": profilers[1].dt * 1e3 / n,
+                    "postprocess": profilers[2].dt * 1e3 / n,
+                }
+                if len(im) != n:  # sliced inference
+                    result.speed["tile"] = profilers[1].dt * 1e3 / len(im)
+            return self.results
+
+    def skipped_inference(self, im, profilers):
+        """
+        Finishes a batch on which callbacks skipped inference.
+
+        Every image gets a Results object without predictions, which 'on_predict_postprocess_end' callbacks fill in,
+        e.g. trackers with their predicted tracks. Results are then written as usual, reporting the input shape of the
+        last batch that was run through the model and zero preprocess and inference time.
+
+        Args:
+            im (torch.Tensor): Input of the last batch that was run through the model.
+            profilers (tuple): Preprocess, inference and postprocess profilers.
+
+        Returns:
+            (List[Results]): Results of the batch, in input order.
+        """
+        from ultralytics.engine.results import Results
+
+        paths, im0s, _ = self.batch
+        with profilers[2]:
+            self.results = [Results(im0, path=path, names=self.model.names) for im0, path in zip(im0s, paths)]
+            self.run_callbacks("on_predict_postprocess_end")
+        self.write_batch(im[: len(im0s)], (0.0, 0.0, profilers[2].dt))
+        self.run_callbacks("on_predict_batch_end")
+        return self.restore_order(self.results)
+
+    def pipelined_inference(self, profilers, *args, **kwargs):
+        """
+        Runs the predict loop as three overlapping stages so that multi-core CPUs are kept busy.
+
+        A reader thread decodes and preprocesses batch N+1 while batch N runs through the model on the calling thread,
+        and a writer thread postprocesses, saves and logs batch N-1. Every stage handles batches in order, so results
+        are yielded in the same order and with the same values as the serial loop in `stream_inference`.
+
+        Args:
+            profilers (tuple): Preprocess, inference and postprocess profilers, each used by a single stage.
+
+        Returns:
+            (torch.Tensor | None): The last preprocessed batch, used for the final speed log.
+        """
+        inference_mode = torch.inference_mode if TORCH_1_9 else torch.no_grad  # thread-local, enable in each worker
+        prefetched = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    prefetched.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        @inference_mode()
+        def read():
+            try:
+                for batch in self.dataset:
+                    with profilers[0]:
+                        im = self.preprocess(batch[1])
+                    if not put((batch, self.get_dataset_state(), im, profilers[0].dt)):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(None)  # end of dataset
+
+        @inference_mode()
+        def write(batch, state, im, preds, dt):
+            self.batch, self.dataset_state = batch, state
+            self.run_callbacks("on_predict_batch_start")
+            with profilers[2]:
+                self.results = self.postprocess(preds, im, batch[1])
+            self.run_callbacks("on_predict_postprocess_end")
+            self.write_batch(im, (*dt, profilers[2].dt))
+            self.run_callbacks("on_predict_batch_end")
+            return self.results
+
+        reader = threading.Thread(target=read, daemon=True)
+        writer = ThreadPoolExecutor(max_workers=1)  # a single worker keeps batches in order
+        pending, im = None, None
+        reader.start()
+        try:
+            while True:
+                item = prefetched.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                batch, state, im, dt = item
+                with profilers[1]:
+                    preds = self.inference(im, *args, **kwargs)
+                future = writer.submit(write, batch, state, im, preds, (dt, profilers[1].dt))
+                if pending is not None:
+                    yield from self.restore_order(pending.result())
+                pending = future
+            if pending is not None:
+                yield from self.restore_order(pending.result())
+        finally:
+            stop.set()
+            writer.shutdown(wait=True)
+            reader.join()
+        return im
+
+    def restore_order(self, results):
+        """
+        Returns the results that are next in input order, buffering the rest.
+
+        Only has an effect when the dataset reordered images into aspect-ratio buckets (`rect=True`), in which case
+        `dataset.order` holds the input index of each image in iteration order.
+
+        Args:
+            results (List[Results]): Results of one batch, in iteration order.
+
+        Returns:
+            (List[Results]): Results that can be yielded now, in input order.
+        """
+        order = getattr(self.dataset, "order", None)
+        if order is None:
+            return results
+        ready = []
+        for result in results:
+            i = self.result_count
+            self.result_count += 1
+            if i >= len(order):  # video frames follow the images and are never reordered
+                ready.append(result)
+                continue
+            self.pending_results[order[i]] = result
+            emitted = self.result_count - len(self.pending_results)  # input index of the next result to return
+            while emitted in self.pending_results:
+                ready.append(self.pending_results.pop(emitted))
+                emitted += 1
+        return ready
+
+    def get_dataset_state(self):
+        """Returns the dataset attributes read by `write_results` for the batch that was just loaded."""
+        return {
+            "mode": self.dataset.mode,
+            "count": getattr(self.dataset, "count", 0),
+            "fps": getattr(self.dataset, "fps", 30),
+        }
+
+    def write_batch(self, im, dt):
+        """Sets per-image speeds on `self.results`, then writes and logs the results of `self.batch`."""
+        paths, im0s, s = self.batch
+        n = len(im0s)
+        for i in range(n):
+            self.seen += 1
+            self.results[i].speed = {
+                "preprocess": dt[0] * 1e3 / n,
+                "inference": dt[1] * 1e3 / n,
+                "postprocess": dt[2] * 1e3 / n,
+            }
+            if len(im) != n:  # sliced inference
+                self.results[i].speed["tile"] = dt[1] * 1e3 / len(im)
+            if self.args.verbose or self.args.save or self.args.save_txt or self.args.show:
+                s[i] += self.write_results(i, Path(paths[i]), im, s)
+
+        # Print batch results
+        if self.args.verbose:
+            LOGGER.info("\n".join(s))
+
     def setup_model(self, model, verbose=True):
         """Initialize YOLO model with given parameters and set it to evaluation mode."""
         self.model = AutoBackend(
@@ -316,16 +717,19 @@ class BasePredictor:
             im = im[None]  # expand for batch dim
         if self.source_type.stream or self.source_type.from_img or self.source_type.tensor:  # batch_size >= 1
             string += f"{i}: "
-            frame = self.dataset.count
+            frame = self.dataset_state["count"]
         else:
             match = re.search(r"frame (\d+)/", s[i])
             frame = int(match.group(1)) if match else None  # 0 if frame undetermined
 
-        self.txt_path = self.save_dir / "labels" / (p.stem + ("" if self.dataset.mode == "image" else f"_{frame}"))
+        suffix = "" if self.dataset_state["mode"] == "image" else f"_{frame}"
+        self.txt_path = self.save_dir / "labels" / (p.stem + suffix)
         string += "%gx%g " % im.shape[2:]
         result = self.results[i]
         result.save_dir = self.save_dir.__str__()  # used in other locations
         string += result.verbose() + f"{result.speed['inference']:.1f}ms"
+        if "tile" in result.speed:
+            string += f" ({len(self.get_tiles(result.orig_shape))} tiles, {result.speed['tile']:.1f}ms/tile)"
 
         # Add predictions to image
         if self.args.save or self.args.show:
@@ -354,8 +758,8 @@ class BasePredictor:
         im = self.plotted_img
 
         # Save videos and streams
-        if self.dataset.mode in {"stream", "video"}:
-            fps = self.dataset.fps if self.dataset.mode == "video" else 30
+        if self.dataset_state["mode"] in {"stream", "video"}:
+            fps = self.dataset_state["fps"] if self.dataset_state["mode"] == "video" else 30
             frames_path = f'{save_path.split(".", 1)[0]}_frames/'
             if save_path not in self.vid_writer:  # new video
                 if self.args.save_frames:
@@ -385,7 +789,7 @@ class BasePredictor:
             cv2.namedWindow(p, cv2.WINDOW_NORMAL | cv2.WINDOW_KEEPRATIO)  # allow window resize (Linux)
             cv2.resizeWindow(p, im.shape[1], im.shape[0])  # (width, height)
         cv2.imshow(p, im)
-        cv2.waitKey(300 if self.dataset.mode == "image" else 1)  # 1 millisecond
+        cv2.waitKey(300 if self.dataset_state["mode"] == "image" else 1)  # 1 millisecond
 
     def run_callbacks(self, event: str):
         """Runs all registered callbacks for a specific event."""
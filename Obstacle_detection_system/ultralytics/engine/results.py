@@ -103,7 +103,8 @@ class Results(SimpleClass):
             path (str): The path to the image file.
             names (dict): A dictionary of class names.
             boxes (torch.tensor, optional): A 2D tensor of bounding box coordinates for each detection.
-            masks (torch.tensor, optional): A 3D tensor of detection masks, where each mask is a binary image.
+            masks (torch.tensor | ops.MaskCrops, optional): A 3D tensor of detection masks, where each mask is a binary
+                image, or masks to compute lazily.
             probs (torch.tensor, optional): A 1D tensor of probabilities of each class for classification task.
             keypoints (torch.tensor, optional): A 2D tensor of keypoint coordinates for each detection.
             obb (torch.tensor, optional): A 2D tensor of oriented bounding box coordinates for each detection.
@@ -524,9 +525,13 @@ class Masks(BaseTensor):
     """
     A class for storing and manipulating detection masks.
 
+    Masks can be created from an `ops.MaskCrops` object instead of a tensor, in which case nothing is computed until
+    `data` is first accessed, and `xy`/`xyn` trace contours on the box crops without building the full masks.
+
     Attributes:
         xy (list): A list of segments in pixel coordinates.
         xyn (list): A list of normalized segments.
+        crops (ops.MaskCrops | None): The lazily evaluated masks, if created from one.
 
     Methods:
         cpu(): Returns the masks tensor on CPU memory.
@@ -536,18 +541,47 @@ class Masks(BaseTensor):
     """
 
     def __init__(self, masks, orig_shape) -> None:
-        """Initialize the Masks class with the given masks tensor and original image shape."""
+        """Initialize the Masks class with the given masks tensor or ops.MaskCrops and original image shape."""
+        self.crops, self._data = None, None
+        if isinstance(masks, ops.MaskCrops):
+            self.crops, self.orig_shape = masks, orig_shape
+            return
         if masks.ndim == 2:
             masks = masks[None, :]
         super().__init__(masks, orig_shape)
 
+    @property
+    def data(self):
+        """Return the masks tensor, pasting it from the crops on first access if created lazily."""
+        if self._data is None and self.crops is not None:
+            self._data = self.crops.paste()
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        """Set the masks tensor."""
+        self._data = data
+
+    @property
+    def shape(self):
+        """Return the shape of the masks tensor without computing lazy masks."""
+        return (len(self.crops), *self.crops.shape) if self._data is None else self.data.shape
+
+    def __len__(self):
+        """Return the number of masks without computing lazy masks."""
+        return len(self.crops) if self._data is None else len(self.data)
+
+    def __getitem__(self, idx):
+        """Return a Masks object for the specified index, still lazy if this one has not been computed."""
+        return Masks(self.crops[idx], self.orig_shape) if self._data is None else super().__getitem__(idx)
+
     @property
     @lru_cache(maxsize=1)
     def xyn(self):
         """Return normalized segments."""
         return [
-            ops.scale_coords(self.data.shape[1:], x, self.orig_shape, normalize=True)
-            for x in ops.masks2segments(self.data)
+            ops.scale_coords(self.shape[1:], x, self.orig_shape, normalize=True)
+            for x in (self.crops.segments() if self.crops is not None else ops.masks2segments(self.data))
         ]
 
     @property
@@ -555,8 +589,8 @@ class Masks(BaseTensor):
     def xy(self):
         """Return segments in pixel coordinates."""
         return [
-            ops.scale_coords(self.data.shape[1:], x, self.orig_shape, normalize=False)
-            for x in ops.masks2segments(self.data)
+            ops.scale_coords(self.shape[1:], x, self.orig_shape, normalize=False)
+            for x in (self.crops.segments() if self.crops is not None else ops.masks2segments(self.data))
         ]
 
 
@@ -0,0 +1,175 @@
+# Ultralytics YOLO 🚀, AGPL-3.0 license
+"""
+Micro-batching inference server that merges concurrent single-frame requests into batched forward passes.
+
+Usage - threads:
+    from ultralytics import YOLO
+    from ultralytics.engine.server import InferenceServer
+
+    with InferenceServer(YOLO("yolov8n.pt"), max_batch=8, max_wait=0.005, conf=0.5) as server:
+        result = server.predict(frame)  # blocking, safe to call from many threads
+        future = server.submit(frame)  # concurrent.futures.Future resolving to a Results object
+
+Usage - asyncio:
+    async with InferenceServer(YOLO("yolov8n.pt")) as server:
+        result = await server.apredict(frame)
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from ultralytics.utils import LOGGER
+
+
+class InferenceServer:
+    """
+    Collects frames from many callers and runs them through the model as one batch.
+
+    `BasePredictor` serializes callers with a lock, so concurrent batch-1 requests run one after another. The server
+    instead queues requests and a single worker thread drains up to `max_batch` of them, waiting at most `max_wait`
+    seconds after the first one arrives, then runs a single `Model.predict_frame` call and resolves each caller's future
+    with its own Results object.
+
+    Attributes:
+        model (Model): The model used for prediction, only ever called from the worker thread.
+        max_batch (int): Maximum number of frames per forward pass.
+        max_wait (float): Maximum time in seconds to wait for more frames after the first one of a batch.
+        kwargs (dict): Prediction arguments passed to `Model.predict_frame`, such as 'conf' or 'imgsz'.
+        requests (queue.Queue): Pending (frame, future) pairs.
+        batches (int): Number of forward passes run so far.
+        frames (int): Number of frames predicted so far.
+
+    Methods:
+        start: Starts the worker thread.
+        stop: Stops the worker thread, failing any requests still queued.
+        submit: Queues a frame and returns a future.
+        predict: Queues a frame and waits for its result.
+        apredict: Queues a frame and awaits its result from asyncio code.
+    """
+
+    def __init__(self, model, max_batch=8, max_wait=0.005, **kwargs):
+        """
+        Initializes the server, call `start` or use it as a context manager before submitting frames.
+
+        Args:
+            model (Model): A loaded model, e.g. YOLO("yolov8n.pt").
+            max_batch (int): Maximum number of frames per forward pass.
+            max_wait (float): Maximum time in seconds to wait for more frames after the first one of a batch.
+            **kwargs (any): Prediction arguments passed to `Model.predict_frame`.
+        """
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.kwargs = kwargs
+        self.requests = queue.Queue()
+        self.batches = 0
+        self.frames = 0
+        self._thread = None
+        self._running = False
+        self._lock = threading.Lock()  # makes the running check and queueing in submit() atomic with stop()
+
+    def start(self):
+        """Starts the worker thread if it is not already running."""
+        with self._lock:
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the worker thread after its current batch, failing any requests still queued."""
+        with self._lock:  # no request can be queued after this block, so the drain below fails all leftovers
+            if not self._running:
+                return
+            self._running = False
+            self.requests.put(None)  # wake up the worker
+        self._thread.join()
+        while True:
+            try:
+                item = self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(RuntimeError("InferenceServer stopped before the request was processed"))
+
+    def submit(self, frame):
+        """
+        Queues a frame for prediction.
+
+        Args:
+            frame (np.ndarray): A BGR HWC image.
+
+        Returns:
+            (concurrent.futures.Future): Resolves to the frame's Results object.
+        """
+        future = Future()
+        with self._lock:
+            if not self._running:
+                raise RuntimeError("InferenceServer is not running, call start() first")
+            self.requests.put((frame, future))
+        return future
+
+    def predict(self, frame, timeout=None):
+        """Queues a frame and blocks until its Results object is available."""
+        return self.submit(frame).result(timeout)
+
+    async def apredict(self, frame):
+        """Queues a frame and awaits its Results object without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(frame))
+
+    def _collect(self):
+        """Waits for a first request, then gathers more until the batch is full or `max_wait` has passed."""
+        item = self.requests.get()
+        if item is None:
+            return []
+        batch = [item]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self.requests.get(timeout=remaining) if remaining > 0 else self.requests.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:  # stop() was called, finish this batch first
+                self._running = False
+                break
+            batch.append(item)
+        return [(frame, future) for frame, future in batch if future.set_running_or_notify_cancel()]
+
+    def _run(self):
+        """Worker loop running one batched forward pass per collected batch."""
+        while self._running:
+            batch = self._collect()
+            if not batch:
+                continue
+            try:
+                results = self.model.predict_frame([frame for frame, _ in batch], **self.kwargs)
+            except Exception as e:
+                LOGGER.warning(f"WARNING ⚠️ InferenceServer batch of {len(batch)} failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.frames += len(batch)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def __enter__(self):
+        """Starts the server when entering a `with` block."""
+        return self.start()
+
+    def __exit__(self, *args):
+        """Stops the server when leaving a `with` block."""
+        self.stop()
+
+    async def __aenter__(self):
+        """Starts the server when entering an `async with` block."""
+        return self.start()
+
+    async def __aexit__(self, *args):
+        """Stops the server without blocking the event loop when leaving an `async with` block."""
+        await asyncio.get_running_loop().run_in_executor(None, self.stop)
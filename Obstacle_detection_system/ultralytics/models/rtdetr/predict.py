@@ -71,16 +71,15 @@ class RTDETRPredictor(BasePredictor):
             results.append(Results(orig_img, path=img_path, names=self.model.names, boxes=pred))
         return results
 
-    def pre_transform(self, im):
+    def get_letterbox(self, im):
         """
-        Pre-transforms the input images before feeding them into the model for inference. The input images are
-        letterboxed to ensure a square aspect ratio and scale-filled. The size must be square(640) and scaleFilled.
+        Returns the LetterBox transform for the input images. The input images are letterboxed to ensure a square
+        aspect ratio and scale-filled. The size must be square(640) and scaleFilled.
 
         Args:
-            im (list[np.ndarray] |torch.Tensor): Input images of shape (N,3,h,w) for tensor, [(h,w,3) x N] for list.
+            im (list[np.ndarray]): Input images, [(h,w,3) x N].
 
         Returns:
-            (list): List of pre-transformed images ready for model inference.
+            (LetterBox): The scale-fill letterbox transform.
         """
-        letterbox = LetterBox(self.imgsz, auto=False, scaleFill=True)
-        return [letterbox(image=x) for x in im]
+        return LetterBox(self.imgsz, auto=False, scaleFill=True)
@@ -28,16 +28,22 @@ class DetectionPredictor(BasePredictor):
             self.args.iou,
             agnostic=self.args.agnostic_nms,
             max_det=self.args.max_det,
+            fusion=self.args.fusion,
+            sources=self.fusion_sources,
             classes=self.args.classes,
         )
 
+        tiled = self.sliced(orig_imgs)
+        if tiled:  # sliced inference, map tile boxes to their images and merge them
+            preds = self.merge_tiles(preds, img, orig_imgs)
         if not isinstance(orig_imgs, list):  # input images are a torch.Tensor, not a list
             orig_imgs = ops.convert_torch2numpy_batch(orig_imgs)
 
         results = []
         for i, pred in enumerate(preds):
             orig_img = orig_imgs[i]
-            pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
+            if not tiled:
+                pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
             img_path = self.batch[0][i]
             results.append(Results(orig_img, path=img_path, names=self.model.names, boxes=pred))
         return results
@@ -38,6 +38,8 @@ class PosePredictor(DetectionPredictor):
             self.args.iou,
             agnostic=self.args.agnostic_nms,
             max_det=self.args.max_det,
+            fusion=self.args.fusion,
+            sources=self.fusion_sources,
             classes=self.args.classes,
             nc=len(self.model.names),
         )
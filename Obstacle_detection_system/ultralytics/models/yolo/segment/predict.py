@@ -33,6 +33,8 @@ class SegmentationPredictor(DetectionPredictor):
             self.args.iou,
             agnostic=self.args.agnostic_nms,
             max_det=self.args.max_det,
+            fusion=self.args.fusion,
+            sources=self.fusion_sources,
             nc=len(self.model.names),
             classes=self.args.classes,
         )
@@ -49,9 +51,9 @@ class SegmentationPredictor(DetectionPredictor):
                 masks = None
             elif self.args.retina_masks:
                 pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
-                masks = ops.process_mask_native(proto[i], pred[:, 6:], pred[:, :4], orig_img.shape[:2])  # HWC
-            else:
-                masks = ops.process_mask(proto[i], pred[:, 6:], pred[:, :4], img.shape[2:], upsample=True)  # HWC
+                masks = ops.MaskCrops(proto[i], pred[:, 6:], pred[:, :4].clone(), orig_img.shape[:2], native=True)
+            else:  # computed lazily, only inside each box
+                masks = ops.MaskCrops(proto[i], pred[:, 6:], pred[:, :4].clone(), img.shape[2:])
                 pred[:, :4] = ops.scale_boxes(img.shape[2:], pred[:, :4], orig_img.shape)
             results.append(Results(orig_img, path=img_path, names=self.model.names, boxes=pred[:, :6], masks=masks))
         return results
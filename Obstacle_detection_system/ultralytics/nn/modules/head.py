@@ -22,6 +22,8 @@ class Detect(nn.Module):
 
     dynamic = False  # force grid reconstruction
     export = False  # export mode
+    topk = None  # sparse output, keep only the top-k anchors per image by class score
+    keep = None  # (B, k) indices of the anchors kept by topk in the last forward pass
     shape = None
     anchors = torch.empty(0)  # init
     strides = torch.empty(0)  # init
@@ -61,16 +63,25 @@ class Detect(nn.Module):
         else:
             box, cls = x_cat.split((self.reg_max * 4, self.nc), 1)
 
+        anchors, strides = self.anchors.unsqueeze(0), self.strides
+        if self.topk:  # select candidates on class logits, then decode only those anchors
+            self.keep = cls.amax(1).topk(min(self.topk, cls.shape[2]), dim=1).indices
+            box, cls = self.gather(box), self.gather(cls)
+            anchors = self.gather(anchors.expand(shape[0], -1, -1))
+            strides = self.gather(strides.unsqueeze(0).expand(shape[0], -1, -1))
+        else:
+            self.keep = None
+
         if self.export and self.format in {"tflite", "edgetpu"}:
             # Precompute normalization factor to increase numerical stability
             # See https://github.com/ultralytics/ultralytics/issues/7371
             grid_h = shape[2]
             grid_w = shape[3]
             grid_size = torch.tensor([grid_w, grid_h, grid_w, grid_h], device=box.device).reshape(1, 4, 1)
-            norm = self.strides / (self.stride[0] * grid_size)
-            dbox = self.decode_bboxes(self.dfl(box) * norm, self.anchors.unsqueeze(0) * norm[:, :2])
+            norm = strides / (self.stride[0] * grid_size)
+            dbox = self.decode_bboxes(self.dfl(box) * norm, anchors * norm[:, :2])
         else:
-            dbox = self.decode_bboxes(self.dfl(box), self.anchors.unsqueeze(0)) * self.strides
+            dbox = self.decode_bboxes(self.dfl(box), anchors) * strides
 
         y = torch.cat((dbox, cls.sigmoid()), 1)
         return y if self.export else (y, x)
@@ -88,6 +99,12 @@ class Detect(nn.Module):
         """Decode bounding boxes."""
         return dist2bbox(bboxes, anchors, xywh=True, dim=1)
 
+    def gather(self, x):
+        """Select the anchors kept by `topk` from a (B, C, A) tensor, returns `x` unchanged when `topk` is not set."""
+        if self.keep is None:
+            return x
+        return x.gather(2, self.keep.unsqueeze(1).expand(-1, x.shape[1], -1))
+
 
 class Segment(Detect):
     """YOLOv8 Segment head for segmentation models."""
@@ -112,7 +129,8 @@ class Segment(Detect):
         x = self.detect(self, x)
         if self.training:
             return x, mc, p
-        return (torch.cat([x, mc], 1), p) if self.export else (torch.cat([x[0], mc], 1), (x[1], mc, p))
+        kept = self.gather(mc)  # mask coefficients of the anchors kept by topk
+        return (torch.cat([x, kept], 1), p) if self.export else (torch.cat([x[0], kept], 1), (x[1], mc, p))
 
 
 class OBB(Detect):
@@ -139,11 +157,12 @@ class OBB(Detect):
         x = self.detect(self, x)
         if self.training:
             return x, angle
-        return torch.cat([x, angle], 1) if self.export else (torch.cat([x[0], angle], 1), (x[1], angle))
+        kept = self.gather(angle)  # angles of the anchors kept by topk
+        return torch.cat([x, kept], 1) if self.export else (torch.cat([x[0], kept], 1), (x[1], angle))
 
     def decode_bboxes(self, bboxes, anchors):
         """Decode rotated bounding boxes."""
-        return dist2rbox(bboxes, self.angle, anchors, dim=1)
+        return dist2rbox(bboxes, self.gather(self.angle), anchors, dim=1)
 
 
 class Pose(Detect):
@@ -166,7 +185,7 @@ class Pose(Detect):
         x = self.detect(self, x)
         if self.training:
             return x, kpt
-        pred_kpt = self.kpts_decode(bs, kpt)
+        pred_kpt = self.gather(self.kpts_decode(bs, kpt))
         return torch.cat([x, pred_kpt], 1) if self.export else (torch.cat([x[0], pred_kpt], 1), (x[1], kpt))
 
     def kpts_decode(self, bs, kpts):
@@ -27,8 +27,9 @@ class BOTrack(STrack):
     Methods:
         update_features(feat): Update features vector and smooth it using exponential moving average.
         predict(): Predicts the mean and covariance using Kalman filter.
-        re_activate(new_track, frame_id, new_id): Reactivates a track with updated features and optionally new ID.
-        update(new_track, frame_id): Update the YOLOv8 instance with new track and frame ID.
+        re_activate(new_track, frame_id, new_id, state): Reactivates a track with updated features and optionally
+            new ID.
+        update(new_track, frame_id, state): Update the YOLOv8 instance with new track and frame ID.
         tlwh: Property that gets the current position in tlwh format `(top left x, top left y, width, height)`.
         multi_predict(stracks): Predicts the mean and covariance of multiple object tracks using shared Kalman filter.
         convert_coords(tlwh): Converts tlwh bounding box coordinates to xywh format.
@@ -73,17 +74,17 @@ class BOTrack(STrack):
 
         self.mean, self.covariance = self.kalman_filter.predict(mean_state, self.covariance)
 
-    def re_activate(self, new_track, frame_id, new_id=False):
+    def re_activate(self, new_track, frame_id, new_id=False, state=None):
         """Reactivates a track with updated features and optionally assigns a new ID."""
         if new_track.curr_feat is not None:
             self.update_features(new_track.curr_feat)
-        super().re_activate(new_track, frame_id, new_id)
+        super().re_activate(new_track, frame_id, new_id, state)
 
-    def update(self, new_track, frame_id):
+    def update(self, new_track, frame_id, state=None):
         """Update the YOLOv8 instance with new track and frame ID."""
         if new_track.curr_feat is not None:
             self.update_features(new_track.curr_feat)
-        super().update(new_track, frame_id)
+        super().update(new_track, frame_id, state)
 
     @property
     def tlwh(self):
@@ -129,7 +130,7 @@ class BOTSORT(BYTETracker):
     Attributes:
         proximity_thresh (float): Threshold for spatial proximity (IoU) between tracks and detections.
         appearance_thresh (float): Threshold for appearance similarity (ReID embeddings) between tracks and detections.
-        encoder (object): Object to handle ReID embeddings, set to None if ReID is not enabled.
+        encoder (object): Object to handle ReID embeddings, set to None if ReID is not enabled or not available.
         gmc (GMC): An instance of the GMC algorithm for data association.
         args (object): Parsed command-line arguments containing tracking parameters.
 
@@ -156,9 +157,13 @@ class BOTSORT(BYTETracker):
         self.appearance_thresh = args.appearance_thresh
 
         if args.with_reid:
-            # Haven't supported BoT-SORT(reid) yet
+            # Set by the tracking callbacks to a DetectorEncoder pooling embeddings from the detector's feature maps
             self.encoder = None
-        self.gmc = GMC(method=args.gmc_method)
+        self.gmc = GMC(
+            method=args.gmc_method,
+            interval=getattr(args, "gmc_interval", 1),
+            asynchronous=getattr(args, "gmc_async", False),
+        )
 
     def get_kalmanfilter(self):
         """Returns an instance of KalmanFilterXYWH for object tracking."""
@@ -188,7 +193,7 @@ class BOTSORT(BYTETracker):
             emb_dists[emb_dists > self.appearance_thresh] = 1.0
             emb_dists[dists_mask] = 1.0
             dists = np.minimum(dists, emb_dists)
-        return dists
+        return self.gate_dists(dists, tracks, detections)
 
     def multi_predict(self, tracks):
         """Predict and track multiple objects with YOLOv8 model."""
@@ -34,9 +34,10 @@ class STrack(BaseTrack):
         predict(): Predict the next state of the object using Kalman filter.
         multi_predict(stracks): Predict the next states for multiple tracks.
         multi_gmc(stracks, H): Update multiple track states using a homography matrix.
+        multi_update(stracks, detections, frame_id): Update or re-activate multiple matched tracks at once.
         activate(kalman_filter, frame_id): Activate a new tracklet.
-        re_activate(new_track, frame_id, new_id): Reactivate a previously lost tracklet.
-        update(new_track, frame_id): Update the state of a matched track.
+        re_activate(new_track, frame_id, new_id, state): Reactivate a previously lost tracklet.
+        update(new_track, frame_id, state): Update the state of a matched track.
         convert_coords(tlwh): Convert bounding box to x-y-aspect-height format.
         tlwh_to_xyah(tlwh): Convert tlwh bounding box to xyah format.
     """
@@ -100,6 +101,21 @@ class STrack(BaseTrack):
                 stracks[i].mean = mean
                 stracks[i].covariance = cov
 
+    @staticmethod
+    def multi_update(stracks, detections, frame_id):
+        """Correct matched tracks with one batched Kalman update, then update tracked and re-activate lost tracks."""
+        if len(stracks) <= 0:
+            return
+        multi_mean = np.asarray([st.mean for st in stracks])
+        multi_covariance = np.asarray([st.covariance for st in stracks])
+        measurement = np.asarray([st.convert_coords(det.tlwh) for st, det in zip(stracks, detections)])
+        multi_mean, multi_covariance = stracks[0].kalman_filter.multi_update(multi_mean, multi_covariance, measurement)
+        for st, det, mean, cov in zip(stracks, detections, multi_mean, multi_covariance):
+            if st.state == TrackState.Tracked:
+                st.update(det, frame_id, state=(mean, cov))
+            else:
+                st.re_activate(det, frame_id, new_id=False, state=(mean, cov))
+
     def activate(self, kalman_filter, frame_id):
         """Start a new tracklet."""
         self.kalman_filter = kalman_filter
@@ -113,11 +129,11 @@ class STrack(BaseTrack):
         self.frame_id = frame_id
         self.start_frame = frame_id
 
-    def re_activate(self, new_track, frame_id, new_id=False):
-        """Reactivates a previously lost track with a new detection."""
-        self.mean, self.covariance = self.kalman_filter.update(
-            self.mean, self.covariance, self.convert_coords(new_track.tlwh)
-        )
+    def re_activate(self, new_track, frame_id, new_id=False, state=None):
+        """Reactivates a previously lost track with a new detection, or with an already corrected (mean, covariance)."""
+        if state is None:
+            state = self.kalman_filter.update(self.mean, self.covariance, self.convert_coords(new_track.tlwh))
+        self.mean, self.covariance = state
         self.tracklet_len = 0
         self.state = TrackState.Tracked
         self.is_activated = True
@@ -129,21 +145,22 @@ class STrack(BaseTrack):
         self.angle = new_track.angle
         self.idx = new_track.idx
 
-    def update(self, new_track, frame_id):
+    def update(self, new_track, frame_id, state=None):
         """
         Update the state of a matched track.
 
         Args:
             new_track (STrack): The new track containing updated information.
             frame_id (int): The ID of the current frame.
+            state (tuple, optional): The measurement-corrected (mean, covariance) of this track, as computed for many
+                tracks at once by `multi_update`. If None, the Kalman update is run for this track alone.
         """
         self.frame_id = frame_id
         self.tracklet_len += 1
 
-        new_tlwh = new_track.tlwh
-        self.mean, self.covariance = self.kalman_filter.update(
-            self.mean, self.covariance, self.convert_coords(new_tlwh)
-        )
+        if state is None:
+            state = self.kalman_filter.update(self.mean, self.covariance, self.convert_coords(new_track.tlwh))
+        self.mean, self.covariance = state
         self.state = TrackState.Tracked
         self.is_activated = True
 
@@ -228,10 +245,14 @@ class BYTETracker:
 
     Methods:
         update(results, img=None): Updates object tracker with new detections.
+        coast(img=None, flow=None): Advances tracks by one frame without detections.
+        uncertainty(): Returns the largest relative position uncertainty of the tracked tracks.
         get_kalmanfilter(): Returns a Kalman filter object for tracking bounding boxes.
         init_track(dets, scores, cls, img=None): Initialize object tracking with detections.
         get_dists(tracks, detections): Calculates the distance between tracks and detections.
+        gate_dists(dists, tracks, detections): Excludes pairs outside the Kalman gate of the tracks.
         multi_predict(tracks): Predicts the location of tracks.
+        multi_update(tracks, detections): Corrects matched tracks with their detections in one batched update.
         reset_id(): Resets the ID counter of STrack.
         joint_stracks(tlista, tlistb): Combines two lists of stracks.
         sub_stracks(tlista, tlistb): Filters out the stracks present in the second list from the first list.
@@ -297,30 +318,19 @@ class BYTETracker:
         dists = self.get_dists(strack_pool, detections)
         matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
 
-        for itracked, idet in matches:
-            track = strack_pool[itracked]
-            det = detections[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
+        tracks = [strack_pool[itracked] for itracked, _ in matches]
+        activated_stracks.extend(track for track in tracks if track.state == TrackState.Tracked)
+        refind_stracks.extend(track for track in tracks if track.state != TrackState.Tracked)
+        self.multi_update(tracks, [detections[idet] for _, idet in matches])
         # Step 3: Second association, with low score detection boxes association the untrack to the low score detections
         detections_second = self.init_track(dets_second, scores_second, cls_second, img)
         r_tracked_stracks = [strack_pool[i] for i in u_track if strack_pool[i].state == TrackState.Tracked]
         # TODO
         dists = matching.iou_distance(r_tracked_stracks, detections_second)
         matches, u_track, u_detection_second = matching.linear_assignment(dists, thresh=0.5)
-        for itracked, idet in matches:
-            track = r_tracked_stracks[itracked]
-            det = detections_second[idet]
-            if track.state == TrackState.Tracked:
-                track.update(det, self.frame_id)
-                activated_stracks.append(track)
-            else:
-                track.re_activate(det, self.frame_id, new_id=False)
-                refind_stracks.append(track)
+        tracks = [r_tracked_stracks[itracked] for itracked, _ in matches]  # all tracked, none to re-activate
+        activated_stracks.extend(tracks)
+        self.multi_update(tracks, [detections_second[idet] for _, idet in matches])
 
         for it in u_track:
             track = r_tracked_stracks[it]
@@ -331,9 +341,9 @@ class BYTETracker:
         detections = [detections[i] for i in u_detection]
         dists = self.get_dists(unconfirmed, detections)
         matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
-        for itracked, idet in matches:
-            unconfirmed[itracked].update(detections[idet], self.frame_id)
-            activated_stracks.append(unconfirmed[itracked])
+        tracks = [unconfirmed[itracked] for itracked, _ in matches]
+        activated_stracks.extend(tracks)
+        self.multi_update(tracks, [detections[idet] for _, idet in matches])
         for it in u_unconfirmed:
             track = unconfirmed[it]
             track.mark_removed()
@@ -364,6 +374,52 @@ class BYTETracker:
 
         return np.asarray([x.result for x in self.tracked_stracks if x.is_activated], dtype=np.float32)
 
+    def coast(self, img=None, flow=None):
+        """
+        Advances all tracks by one frame on which the detector did not run, and returns the tracked boxes.
+
+        Tracks are predicted with the Kalman filter and compensated for camera motion, but are not marked lost, so only
+        a later detected frame can lose them. The time since their last detection still counts towards `track_buffer`.
+
+        Args:
+            img (np.ndarray, optional): The frame, used for camera motion compensation.
+            flow (callable, optional): Maps the (N, 4) xyxy boxes of the previous frame to their (N, 2) displacements
+                and a validity mask, e.g. `DetectionSchedule.flow`. Valid displaced boxes correct the Kalman states of
+                the tracked tracks as measurements.
+
+        Returns:
+            (np.ndarray): Tracked boxes in the format returned by `update`, whose detection index refers to the last
+                detected frame.
+        """
+        self.frame_id += 1
+        tracked = [t for t in self.tracked_stracks if t.is_activated]
+        unconfirmed = [t for t in self.tracked_stracks if not t.is_activated]
+        strack_pool = self.joint_stracks(tracked, self.lost_stracks)
+        boxes = np.asarray([t.xyxy for t in tracked]).reshape(-1, 4)  # in the previous frame
+        self.multi_predict(strack_pool)
+        if hasattr(self, "gmc") and img is not None:
+            warp = self.gmc.apply(img)
+            STrack.multi_gmc(strack_pool, warp)
+            STrack.multi_gmc(unconfirmed, warp)
+        if flow is not None and len(tracked):
+            shift, ok = flow(boxes)
+            tracks = [t for t, valid in zip(tracked, ok) if valid]
+            if tracks:
+                tlwh = np.concatenate([boxes[ok, :2] + shift[ok], boxes[ok, 2:] - boxes[ok, :2]], 1)
+                mean = np.asarray([t.mean for t in tracks])
+                covariance = np.asarray([t.covariance for t in tracks])
+                measurement = np.asarray([t.convert_coords(x) for t, x in zip(tracks, tlwh)])
+                mean, covariance = self.kalman_filter.multi_update(mean, covariance, measurement)
+                for t, m, c in zip(tracks, mean, covariance):
+                    t.mean, t.covariance = m, c
+        return np.asarray([x.result for x in self.tracked_stracks if x.is_activated], dtype=np.float32)
+
+    def uncertainty(self):
+        """Returns the largest position standard deviation of the tracked tracks relative to their box height."""
+        tracks = [t for t in self.tracked_stracks if t.is_activated]
+        std = [np.sqrt(t.covariance[[0, 1], [0, 1]].max()) / max(t.tlwh[3], 1.0) for t in tracks]
+        return max(std, default=0.0)
+
     def get_kalmanfilter(self):
         """Returns a Kalman filter object for tracking bounding boxes."""
         return KalmanFilterXYAH()
@@ -378,12 +434,25 @@ class BYTETracker:
         # TODO: mot20
         # if not self.args.mot20:
         dists = matching.fuse_score(dists, detections)
-        return dists
+        return self.gate_dists(dists, tracks, detections)
+
+    def gate_dists(self, dists, tracks, detections):
+        """Excludes track-detection pairs outside the Kalman gate of the tracks when `motion_gating` is enabled."""
+        if not getattr(self.args, "motion_gating", False) or dists.size == 0:
+            return dists
+        mean = np.asarray([track.mean for track in tracks])
+        covariance = np.asarray([track.covariance for track in tracks])
+        measurements = np.asarray([det.convert_coords(det.tlwh) for det in detections])
+        return matching.gate_cost_matrix(self.kalman_filter, dists, mean, covariance, measurements)
 
     def multi_predict(self, tracks):
         """Returns the predicted tracks using the YOLOv8 network."""
         STrack.multi_predict(tracks)
 
+    def multi_update(self, tracks, detections):
+        """Corrects matched tracks with their detections in one batched Kalman update."""
+        STrack.multi_update(tracks, detections, self.frame_id)
+
     @staticmethod
     def reset_id():
         """Resets the ID counter of STrack."""
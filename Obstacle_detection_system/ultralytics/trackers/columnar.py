@@ -0,0 +1,517 @@
+# Ultralytics YOLO 🚀, AGPL-3.0 license
+"""
+Columnar (struct-of-arrays) versions of BYTETracker and BOTSORT.
+
+Instead of one STrack object per track, all track attributes live in preallocated arrays indexed by slot, and the
+tracked and lost track lists are arrays of slots. Prediction, motion compensation, box conversion, IoU costs and list
+bookkeeping are then single NumPy operations per frame rather than Python loops over track objects. Association
+follows `BYTETracker.update` step by step, so matches and track IDs are the same as with the object trackers.
+
+Usage:
+    Set `backend: columnar` in the tracker YAML, e.g. a copy of bytetrack.yaml or botsort.yaml.
+"""
+
+import numpy as np
+from scipy.spatial.distance import cdist
+
+from ..utils.ops import xywh2ltwh
+from .basetrack import BaseTrack, TrackState
+from .utils import matching
+from .utils.gmc import GMC
+from .utils.kalman_filter import KalmanFilterXYAH, KalmanFilterXYWH
+
+
+class TrackStore:
+    """
+    Per-track attributes in preallocated arrays indexed by slot.
+
+    Arrays grow by doubling when full, and slots of tracks that are neither tracked nor lost are released and reused.
+
+    Attributes:
+        COLUMNS (dict): Name to (trailing shape, dtype) of every per-track array.
+        capacity (int): Number of allocated slots.
+        used (np.ndarray): Whether each slot holds a track.
+        mean (np.ndarray): Kalman state means, (capacity, 8).
+        covariance (np.ndarray): Kalman state covariances, (capacity, 8, 8).
+        track_id (np.ndarray): Track IDs.
+        score (np.ndarray): Confidence of the last matched detection.
+        cls (np.ndarray): Class of the last matched detection.
+        idx (np.ndarray): Index of the last matched detection in its frame.
+        angle (np.ndarray): Angle of the last matched detection, for oriented boxes.
+        state (np.ndarray): TrackState of each track.
+        is_activated (np.ndarray): Whether each track is confirmed.
+        frame_id (np.ndarray): Last frame each track was updated in.
+        start_frame (np.ndarray): Frame each track started in.
+        tracklet_len (np.ndarray): Number of consecutive updates.
+        smooth_feat (np.ndarray | None): Smoothed ReID features, allocated with the first feature.
+        curr_feat (np.ndarray | None): Last ReID features, allocated with the first feature.
+
+    Methods:
+        alloc(n): Returns `n` free slots, growing the arrays if needed.
+        release(slots): Frees slots for reuse.
+        set_features(slots, feat, alpha): Updates ReID features as `BOTrack.update_features` does.
+    """
+
+    COLUMNS = {
+        "mean": ((8,), np.float64),
+        "covariance": ((8, 8), np.float64),
+        "track_id": ((), np.int64),
+        "score": ((), np.float32),
+        "cls": ((), np.float32),
+        "idx": ((), np.float64),
+        "angle": ((), np.float64),
+        "state": ((), np.int8),
+        "is_activated": ((), bool),
+        "frame_id": ((), np.int64),
+        "start_frame": ((), np.int64),
+        "tracklet_len": ((), np.int64),
+    }
+
+    def __init__(self, capacity=256):
+        """Allocates arrays for `capacity` tracks."""
+        self.capacity = capacity
+        self.used = np.zeros(capacity, dtype=bool)
+        for name, (shape, dtype) in self.COLUMNS.items():
+            setattr(self, name, np.zeros((capacity, *shape), dtype=dtype))
+        self.smooth_feat, self.curr_feat = None, None
+
+    def alloc(self, n):
+        """Returns `n` free slots, marked as used, doubling the capacity as needed."""
+        free = np.flatnonzero(~self.used)
+        if len(free) < n:
+            grow = max(self.capacity, n - len(free))
+            for name in (*self.COLUMNS, "smooth_feat", "curr_feat"):
+                a = getattr(self, name)
+                if a is not None:
+                    setattr(self, name, np.concatenate([a, np.zeros((grow, *a.shape[1:]), dtype=a.dtype)]))
+            self.used = np.concatenate([self.used, np.zeros(grow, dtype=bool)])
+            self.capacity += grow
+            free = np.flatnonzero(~self.used)
+        slots = free[:n]
+        self.used[slots] = True
+        return slots
+
+    def release(self, slots):
+        """Frees slots for reuse."""
+        self.used[slots] = False
+
+    def set_features(self, slots, feat, alpha=0.9):
+        """Sets current and exponentially smoothed L2-normalized ReID features, as `BOTrack.update_features` does."""
+        if self.smooth_feat is None:
+            self.smooth_feat = np.zeros((self.capacity, feat.shape[1]), dtype=feat.dtype)
+            self.curr_feat = np.zeros((self.capacity, feat.shape[1]), dtype=feat.dtype)
+            self.has_feat = np.zeros(self.capacity, dtype=bool)
+        if len(self.has_feat) < self.capacity:
+            self.has_feat = np.concatenate([self.has_feat, np.zeros(self.capacity - len(self.has_feat), dtype=bool)])
+        feat = feat / np.linalg.norm(feat, axis=1, keepdims=True)
+        smooth = np.where(self.has_feat[slots, None], alpha * self.smooth_feat[slots] + (1 - alpha) * feat, feat)
+        self.curr_feat[slots] = feat
+        self.smooth_feat[slots] = smooth / np.linalg.norm(smooth, axis=1, keepdims=True)
+        self.has_feat[slots] = True
+
+
+class Detections:
+    """
+    Detections of one frame as arrays, the columnar counterpart of the STrack list returned by `init_track`.
+
+    Attributes:
+        tlwh (np.ndarray): Boxes as (top left x, top left y, width, height), float32 as in STrack.
+        score (np.ndarray): Confidences.
+        cls (np.ndarray): Classes.
+        idx (np.ndarray): Index of each detection in its frame.
+        angle (np.ndarray | None): Angles of oriented boxes.
+        feat (np.ndarray | None): L2-normalized ReID features.
+    """
+
+    def __init__(self, xywh, score, cls, feat=None):
+        """Initializes from (n, 5) xywh+idx or (n, 6) xywhr+idx boxes, scores, classes and optional features."""
+        self.tlwh = np.asarray(xywh2ltwh(xywh[:, :4]), dtype=np.float32)
+        self.score = score
+        self.cls = cls
+        self.idx = xywh[:, -1]
+        self.angle = xywh[:, 4] if xywh.shape[1] == 6 else None
+        self.feat = None if feat is None else feat / np.linalg.norm(feat, axis=1, keepdims=True)
+
+    def __len__(self):
+        """Returns the number of detections."""
+        return len(self.score)
+
+    def __getitem__(self, i):
+        """Returns the detections at indices `i`."""
+        d = Detections.__new__(Detections)
+        d.tlwh, d.score, d.cls, d.idx = self.tlwh[i], self.score[i], self.cls[i], self.idx[i]
+        d.angle = None if self.angle is None else self.angle[i]
+        d.feat = None if self.feat is None else self.feat[i]
+        return d
+
+    def boxes(self):
+        """Returns xyxy boxes, or xywha boxes for oriented detections, as used for IoU costs."""
+        ret = self.tlwh.copy()
+        if self.angle is None:
+            ret[:, 2:] += ret[:, :2]
+            return ret
+        ret[:, :2] += ret[:, 2:] / 2
+        return np.concatenate([ret, self.angle[:, None]], axis=1)
+
+
+class ColumnarBYTETracker:
+    """
+    BYTETracker with all track state in a TrackStore.
+
+    Attributes:
+        store (TrackStore): Per-track arrays.
+        tracked_slots (np.ndarray): Slots of tracked tracks, in the order of `BYTETracker.tracked_stracks`.
+        lost_slots (np.ndarray): Slots of lost tracks, in the order of `BYTETracker.lost_stracks`.
+        removed_ids (list): IDs of the last removed tracks, as kept by `BYTETracker.removed_stracks`.
+        frame_id (int): The current frame ID.
+        args (namespace): Tracker arguments.
+        max_time_lost (int): The maximum frames for a track to be considered as 'lost'.
+        kalman_filter (KalmanFilterXYAH): Kalman filter shared by all tracks.
+        oriented (bool): Whether oriented boxes are being tracked.
+
+    Methods:
+        update(results, img=None): Updates the tracker with new detections and returns the tracked boxes.
+        coast(img=None, flow=None): Advances tracks by one frame without detections, as `BYTETracker.coast`.
+        uncertainty(): Returns the largest relative position uncertainty of the tracked tracks.
+        init_track(dets, scores, cls, img=None): Wraps detections in a Detections object.
+        get_dists(slots, detections): IoU costs fused with detection scores.
+        gate_dists(dists, slots, detections): Excludes pairs outside the Kalman gate of the tracks.
+        multi_predict(slots): Kalman prediction of all given tracks at once.
+        multi_gmc(slots, H): Applies a camera motion homography to all given tracks at once.
+        track_boxes(slots): xyxy, or xywha, boxes of tracks.
+    """
+
+    velocity_dims = [7]  # state velocities zeroed when predicting tracks that are not tracked
+
+    def __init__(self, args, frame_rate=30):
+        """Initializes the tracker with given arguments and frame rate."""
+        self.args = args
+        self.max_time_lost = int(frame_rate / 30.0 * args.track_buffer)
+        self.reset()
+
+    def update(self, results, img=None):
+        """Updates the tracker with new detections and returns tracked object bounding boxes."""
+        self.frame_id += 1
+        self.oriented = hasattr(results, "xywhr")
+        s = self.store
+
+        scores = results.conf
+        bboxes = results.xywhr if hasattr(results, "xywhr") else results.xywh
+        bboxes = np.concatenate([bboxes, np.arange(len(bboxes)).reshape(-1, 1)], axis=-1)  # add index
+        cls = results.cls
+
+        remain_inds = scores > self.args.track_high_thresh
+        inds_second = (scores > self.args.track_low_thresh) & (scores < self.args.track_high_thresh)
+        dets = bboxes[remain_inds]
+        detections = self.init_track(dets, scores[remain_inds], cls[remain_inds], img)
+
+        confirmed = s.is_activated[self.tracked_slots]
+        unconfirmed = self.tracked_slots[~confirmed]
+
+        # Step 2: First association, with high score detection boxes
+        pool = self.joint_slots(self.tracked_slots[confirmed], self.lost_slots)
+        self.multi_predict(pool)
+        if hasattr(self, "gmc") and img is not None:
+            warp = self.gmc.apply(img, dets)
+            self.multi_gmc(pool, warp)
+            self.multi_gmc(unconfirmed, warp)
+
+        dists = self.get_dists(pool, detections)
+        matches, u_track, u_detection = matching.linear_assignment(dists, thresh=self.args.match_thresh)
+        activated, refind = self.update_tracks(pool, detections, matches)
+
+        # Step 3: Second association, with low score detection boxes
+        detections_second = self.init_track(bboxes[inds_second], scores[inds_second], cls[inds_second], img)
+        r_tracked = pool[np.asarray(u_track, dtype=int)]
+        r_tracked = r_tracked[s.state[r_tracked] == TrackState.Tracked]
+        dists = matching.iou_distance(self.track_boxes(r_tracked), detections_second.boxes())
+        matches, u_track, _ = matching.linear_assignment(dists, thresh=0.5)
+        activated_second, refind_second = self.update_tracks(r_tracked, detections_second, matches)
+        lost = r_tracked[np.asarray(u_track, dtype=int)]
+        lost = lost[s.state[lost] != TrackState.Lost]
+        s.state[lost] = TrackState.Lost
+
+        # Deal with unconfirmed tracks, usually tracks with only one beginning frame
+        detections = detections[np.asarray(u_detection, dtype=int)]
+        dists = self.get_dists(unconfirmed, detections)
+        matches, u_unconfirmed, u_detection = matching.linear_assignment(dists, thresh=0.7)
+        activated_unconfirmed, _ = self.update_tracks(unconfirmed, detections, matches)
+        removed = unconfirmed[np.asarray(u_unconfirmed, dtype=int)]
+        s.state[removed] = TrackState.Removed
+
+        # Step 4: Init new tracks
+        new = np.asarray(u_detection, dtype=int)
+        new = self.activate(detections, new[detections.score[new] >= self.args.new_track_thresh])
+
+        # Step 5: Update state
+        expired = self.lost_slots[self.frame_id - s.frame_id[self.lost_slots] > self.max_time_lost]
+        s.state[expired] = TrackState.Removed
+
+        tracked = self.tracked_slots[s.state[self.tracked_slots] == TrackState.Tracked]
+        tracked = self.joint_slots(tracked, np.concatenate([activated, activated_second, activated_unconfirmed, new]))
+        tracked = self.joint_slots(tracked, np.concatenate([refind, refind_second]))
+        lost = np.concatenate([self.lost_slots[~np.isin(self.lost_slots, tracked)], lost])
+        lost = lost[~np.isin(s.track_id[lost], self.removed_ids)]
+        self.tracked_slots, self.lost_slots = self.remove_duplicate_slots(tracked, lost)
+        self.removed_ids.extend(s.track_id[np.concatenate([removed, expired])].tolist())
+        if len(self.removed_ids) > 1000:
+            self.removed_ids = self.removed_ids[-999:]  # clip removed tracks to 1000 maximum
+        s.release(np.setdiff1d(np.flatnonzero(s.used), np.concatenate([self.tracked_slots, self.lost_slots])))
+
+        out = self.tracked_slots[s.is_activated[self.tracked_slots]]
+        coords = self.track_boxes(out)
+        columns = (s.track_id[out], s.score[out], s.cls[out], s.idx[out])
+        return np.concatenate([coords, np.stack(columns, axis=1)], axis=1).astype(np.float32)
+
+    def coast(self, img=None, flow=None):
+        """Advances all tracks by one frame without detections and returns the tracked boxes, as `BYTETracker.coast`."""
+        self.frame_id += 1
+        s = self.store
+        confirmed = s.is_activated[self.tracked_slots]
+        tracked, unconfirmed = self.tracked_slots[confirmed], self.tracked_slots[~confirmed]
+        pool = self.joint_slots(tracked, self.lost_slots)
+        tlwh = self.track_tlwh(tracked)  # in the previous frame
+        self.multi_predict(pool)
+        if hasattr(self, "gmc") and img is not None:
+            warp = self.gmc.apply(img)
+            self.multi_gmc(pool, warp)
+            self.multi_gmc(unconfirmed, warp)
+        if flow is not None and len(tracked):
+            shift, ok = flow(np.concatenate([tlwh[:, :2], tlwh[:, :2] + tlwh[:, 2:]], 1))
+            t = tracked[ok]
+            if len(t):
+                tlwh[ok, :2] += shift[ok]
+                z = self.convert_coords(tlwh[ok])
+                s.mean[t], s.covariance[t] = self.kalman_filter.multi_update(s.mean[t], s.covariance[t], z)
+        coords = self.track_boxes(tracked)
+        columns = (s.track_id[tracked], s.score[tracked], s.cls[tracked], s.idx[tracked])
+        return np.concatenate([coords, np.stack(columns, axis=1)], axis=1).astype(np.float32)
+
+    def uncertainty(self):
+        """Returns the largest position standard deviation of the tracked tracks relative to their box height."""
+        t = self.tracked_slots[self.store.is_activated[self.tracked_slots]]
+        if not len(t):
+            return 0.0
+        std = np.sqrt(self.store.covariance[t][:, [0, 1], [0, 1]].max(1))
+        return float((std / np.maximum(self.track_tlwh(t)[:, 3], 1.0)).max())
+
+    def get_kalmanfilter(self):
+        """Returns a Kalman filter object for tracking bounding boxes."""
+        return KalmanFilterXYAH()
+
+    def init_track(self, dets, scores, cls, img=None):
+        """Wraps detections, (n, 5) xywh+idx or (n, 6) xywhr+idx, with their scores and classes."""
+        return Detections(dets, scores, cls)
+
+    def get_dists(self, slots, detections):
+        """Calculates the IoU distance between tracks and detections, fused with detection scores."""
+        dists = matching.iou_distance(self.track_boxes(slots), detections.boxes())
+        return self.gate_dists(self.fuse_score(dists, detections), slots, detections)
+
+    def gate_dists(self, dists, slots, detections):
+        """Excludes track-detection pairs outside the Kalman gate of the tracks when `motion_gating` is enabled."""
+        if not getattr(self.args, "motion_gating", False) or dists.size == 0:
+            return dists
+        s = self.store
+        measurements = self.convert_coords(detections.tlwh)
+        return matching.gate_cost_matrix(self.kalman_filter, dists, s.mean[slots], s.covariance[slots], measurements)
+
+    @staticmethod
+    def fuse_score(dists, detections):
+        """Fuses an IoU cost matrix with detection scores, as `matching.fuse_score` does."""
+        return 1 - (1 - dists) * detections.score[None] if dists.size else dists
+
+    def multi_predict(self, slots):
+        """Runs the Kalman prediction of all given tracks in one call."""
+        if len(slots) == 0:
+            return
+        s = self.store
+        mean = s.mean[slots]
+        mean[np.ix_(s.state[slots] != TrackState.Tracked, self.velocity_dims)] = 0
+        s.mean[slots], s.covariance[slots] = self.kalman_filter.multi_predict(mean, s.covariance[slots])
+
+    def multi_gmc(self, slots, H=np.eye(2, 3)):
+        """Applies a 2x3 camera motion homography to the states of all given tracks."""
+        if len(slots) == 0:
+            return
+        s = self.store
+        R8x8 = np.kron(np.eye(4, dtype=float), H[:2, :2])
+        mean = s.mean[slots] @ R8x8.T
+        mean[:, :2] += H[:2, 2]
+        s.mean[slots] = mean
+        s.covariance[slots] = R8x8 @ s.covariance[slots] @ R8x8.T
+
+    def convert_coords(self, tlwh):
+        """Converts tlwh boxes to the Kalman measurement space, (center x, center y, aspect ratio, height)."""
+        ret = tlwh.copy()
+        ret[:, :2] += ret[:, 2:] / 2
+        ret[:, 2] /= ret[:, 3]
+        return ret
+
+    def track_tlwh(self, slots):
+        """Returns the (top left x, top left y, width, height) boxes of tracks from their Kalman states."""
+        ret = self.store.mean[slots, :4].copy()
+        ret[:, 2] *= ret[:, 3]
+        ret[:, :2] -= ret[:, 2:] / 2
+        return ret
+
+    def track_boxes(self, slots):
+        """Returns xyxy boxes of tracks, or xywha boxes when tracking oriented boxes."""
+        ret = self.track_tlwh(slots)
+        if not self.oriented:
+            ret[:, 2:] += ret[:, :2]
+            return ret
+        ret[:, :2] += ret[:, 2:] / 2
+        return np.concatenate([ret, self.store.angle[slots, None]], axis=1)
+
+    def update_tracks(self, slots, detections, matches):
+        """
+        Corrects matched tracks with their detections, as `STrack.update` and `STrack.re_activate` do.
+
+        Args:
+            slots (np.ndarray): Slots of the tracks the first column of `matches` indexes.
+            detections (Detections): Detections the second column of `matches` indexes.
+            matches (list | np.ndarray): (track index, detection index) pairs.
+
+        Returns:
+            (tuple[np.ndarray, np.ndarray]): Slots of updated tracked tracks, and of re-activated lost tracks.
+        """
+        s = self.store
+        m = np.asarray(matches, dtype=int).reshape(-1, 2)
+        t, d = slots[m[:, 0]], m[:, 1]
+        tracked = s.state[t] == TrackState.Tracked
+        if detections.feat is not None:
+            s.set_features(t, detections.feat[d])
+        if len(t):
+            z = self.convert_coords(detections.tlwh[d])
+            s.mean[t], s.covariance[t] = self.kalman_filter.multi_update(s.mean[t], s.covariance[t], z)
+        s.tracklet_len[t] = np.where(tracked, s.tracklet_len[t] + 1, 0)
+        s.state[t] = TrackState.Tracked
+        s.is_activated[t] = True
+        s.frame_id[t] = self.frame_id
+        s.score[t], s.cls[t], s.idx[t] = detections.score[d], detections.cls[d], detections.idx[d]
+        if detections.angle is not None:
+            s.angle[t] = detections.angle[d]
+        return t[tracked], t[~tracked]
+
+    def activate(self, detections, i):
+        """Starts new tracks from the detections at indices `i`, as `STrack.activate` does, and returns their slots."""
+        s = self.store
+        slots = s.alloc(len(i))
+        for slot, z in zip(slots, self.convert_coords(detections.tlwh[i])):
+            s.track_id[slot] = BaseTrack.next_id()
+            s.mean[slot], s.covariance[slot] = self.kalman_filter.initiate(z)
+        s.tracklet_len[slots] = 0
+        s.state[slots] = TrackState.Tracked
+        s.is_activated[slots] = self.frame_id == 1
+        s.frame_id[slots] = self.frame_id
+        s.start_frame[slots] = self.frame_id
+        s.score[slots], s.cls[slots], s.idx[slots] = detections.score[i], detections.cls[i], detections.idx[i]
+        if detections.angle is not None:
+            s.angle[slots] = detections.angle[i]
+        if detections.feat is not None:
+            s.set_features(slots, detections.feat[i])
+        return slots
+
+    def reset(self):
+        """Reset tracker."""
+        self.store = TrackStore()
+        self.tracked_slots = np.empty(0, dtype=int)
+        self.lost_slots = np.empty(0, dtype=int)
+        self.removed_ids = []
+        self.frame_id = 0
+        self.kalman_filter = self.get_kalmanfilter()
+        self.oriented = False  # whether oriented boxes are tracked, set from the results on each update
+        self.reset_id()
+
+    @staticmethod
+    def reset_id():
+        """Resets the ID counter shared with STrack."""
+        BaseTrack.reset_id()
+
+    @staticmethod
+    def joint_slots(a, b):
+        """Appends the slots of `b` that are not in `a`, keeping their first occurrence, as `joint_stracks` does."""
+        b = b[~np.isin(b, a)]
+        _, first = np.unique(b, return_index=True)
+        return np.concatenate([a, b[np.sort(first)]])
+
+    def remove_duplicate_slots(self, a, b):
+        """Removes tracks overlapping with IoU > 0.85, keeping the longer lived one, as `remove_duplicate_stracks`."""
+        pdist = matching.iou_distance(self.track_boxes(a), self.track_boxes(b))
+        p, q = np.where(pdist < 0.15)
+        s = self.store
+        older = (s.frame_id[a[p]] - s.start_frame[a[p]]) > (s.frame_id[b[q]] - s.start_frame[b[q]])
+        keep_a, keep_b = np.ones(len(a), dtype=bool), np.ones(len(b), dtype=bool)
+        keep_a[p[~older]] = False
+        keep_b[q[older]] = False
+        return a[keep_a], b[keep_b]
+
+
+class ColumnarBOTSORT(ColumnarBYTETracker):
+    """
+    BOTSORT with all track state in a TrackStore.
+
+    Attributes:
+        proximity_thresh (float): Threshold for spatial proximity (IoU) between tracks and detections.
+        appearance_thresh (float): Threshold for appearance similarity (ReID embeddings) between tracks and detections.
+        encoder (object): Object to handle ReID embeddings, set to None if ReID is not enabled or not available.
+        gmc (GMC): An instance of the GMC algorithm for data association.
+    """
+
+    velocity_dims = [6, 7]
+
+    def __init__(self, args, frame_rate=30):
+        """Initializes the tracker with ReID thresholds and GMC."""
+        super().__init__(args, frame_rate)
+        self.proximity_thresh = args.proximity_thresh
+        self.appearance_thresh = args.appearance_thresh
+        if args.with_reid:
+            # Set by the tracking callbacks to a DetectorEncoder pooling embeddings from the detector's feature maps
+            self.encoder = None
+        self.gmc = GMC(
+            method=args.gmc_method,
+            interval=getattr(args, "gmc_interval", 1),
+            asynchronous=getattr(args, "gmc_async", False),
+        )
+
+    def get_kalmanfilter(self):
+        """Returns an instance of KalmanFilterXYWH for object tracking."""
+        return KalmanFilterXYWH()
+
+    def init_track(self, dets, scores, cls, img=None):
+        """Wraps detections with their scores, classes and ReID features if an encoder is available."""
+        feat = None
+        if len(dets) and self.args.with_reid and self.encoder is not None:
+            feat = np.asarray(self.encoder.inference(img, dets), dtype=np.float32)
+        return Detections(dets, scores, cls, feat)
+
+    def get_dists(self, slots, detections):
+        """Get distances between tracks and detections using IoU and (optionally) ReID embeddings."""
+        dists = matching.iou_distance(self.track_boxes(slots), detections.boxes())
+        dists_mask = dists > self.proximity_thresh
+        dists = self.fuse_score(dists, detections)
+        if self.args.with_reid and self.encoder is not None and dists.size:
+            emb_dists = np.maximum(0.0, cdist(self.store.smooth_feat[slots], detections.feat, "cosine")) / 2.0
+            emb_dists[emb_dists > self.appearance_thresh] = 1.0
+            emb_dists[dists_mask] = 1.0
+            dists = np.minimum(dists, emb_dists)
+        return self.gate_dists(dists, slots, detections)
+
+    def convert_coords(self, tlwh):
+        """Converts tlwh boxes to the Kalman measurement space, (center x, center y, width, height)."""
+        ret = tlwh.copy()
+        ret[:, :2] += ret[:, 2:] / 2
+        return ret
+
+    def track_tlwh(self, slots):
+        """Returns the (top left x, top left y, width, height) boxes of tracks from their Kalman states."""
+        ret = self.store.mean[slots, :4].copy()
+        ret[:, :2] -= ret[:, 2:] / 2
+        return ret
+
+    def reset(self):
+        """Reset tracker."""
+        super().reset()
+        if hasattr(self, "gmc"):
+            self.gmc.reset_params()
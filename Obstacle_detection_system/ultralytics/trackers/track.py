@@ -5,14 +5,18 @@ from pathlib import Path
 
 import torch
 
-from ultralytics.utils import IterableSimpleNamespace, yaml_load
+from ultralytics.utils import LOGGER, IterableSimpleNamespace, yaml_load
 from ultralytics.utils.checks import check_yaml
 
 from .bot_sort import BOTSORT
 from .byte_tracker import BYTETracker
+from .columnar import ColumnarBOTSORT, ColumnarBYTETracker
+from .utils.reid import DetectorEncoder, FeatureHook
+from .utils.schedule import DetectionSchedule
 
 # A mapping of tracker types to corresponding tracker classes
 TRACKER_MAP = {"bytetrack": BYTETracker, "botsort": BOTSORT}
+COLUMNAR_TRACKER_MAP = {"bytetrack": ColumnarBYTETracker, "botsort": ColumnarBOTSORT}
 
 
 def on_predict_start(predictor: object, persist: bool = False) -> None:
@@ -24,9 +28,14 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
         persist (bool, optional): Whether to persist the trackers if they already exist. Defaults to False.
 
     Raises:
-        AssertionError: If the tracker_type is not 'bytetrack' or 'botsort'.
+        AssertionError: If the tracker_type is not 'bytetrack' or 'botsort', or the backend is not 'objects' or
+            'columnar'.
     """
+    if predictor.reid_hook is not None:  # left over from a prediction that was not run to its end
+        on_predict_end(predictor)
     if hasattr(predictor, "trackers") and persist:
+        if getattr(predictor.trackers[0], "encoder", None) is not None:
+            predictor.reid_hook = FeatureHook.attach(predictor.model)
         return
 
     tracker = check_yaml(predictor.args.tracker)
@@ -34,16 +43,68 @@ def on_predict_start(predictor: object, persist: bool = False) -> None:
 
     if cfg.tracker_type not in {"bytetrack", "botsort"}:
         raise AssertionError(f"Only 'bytetrack' and 'botsort' are supported for now, but got '{cfg.tracker_type}'")
+    backend = cfg.get("backend", "objects")
+    if backend not in {"objects", "columnar"}:
+        raise AssertionError(f"Only 'objects' and 'columnar' tracker backends are supported, but got '{backend}'")
+    tracker_map = COLUMNAR_TRACKER_MAP if backend == "columnar" else TRACKER_MAP
 
     trackers = []
     for _ in range(predictor.dataset.bs):
-        tracker = TRACKER_MAP[cfg.tracker_type](args=cfg, frame_rate=30)
+        tracker = tracker_map[cfg.tracker_type](args=cfg, frame_rate=30)
         trackers.append(tracker)
         if predictor.dataset.mode != "stream":  # only need one tracker for other modes.
             break
     predictor.trackers = trackers
+    if cfg.tracker_type == "botsort" and cfg.with_reid and predictor.args.tile:
+        LOGGER.warning("WARNING ⚠️ ReID embeddings are not pooled from tiles, ReID disabled for sliced inference.")
+    elif cfg.tracker_type == "botsort" and cfg.with_reid:
+        predictor.reid_hook = FeatureHook.attach(predictor.model)  # removed again in 'on_predict_end'
+        if predictor.reid_hook is not None:
+            for tracker in trackers:
+                tracker.encoder = DetectorEncoder()
     predictor.vid_path = [None] * predictor.dataset.bs  # for determining when to reset tracker on new video
 
+    interval = cfg.get("detect_interval", 1)
+    if interval > 1 and predictor.dataset.mode != "stream" and predictor.dataset.bs > 1:
+        LOGGER.warning("WARNING ⚠️ detect_interval needs one frame per tracker and batch, detecting every frame.")
+        interval = 1
+    predictor.frame_skipping = interval > 1
+    predictor.schedules = [
+        DetectionSchedule(
+            interval, cfg.get("detect_motion", 0.0), cfg.get("detect_uncertainty", 0.0), cfg.get("flow_refine", False)
+        )
+        for _ in trackers
+    ]
+
+
+def on_predict_batch_start(predictor: object) -> None:
+    """
+    Decide whether the detector runs on a batch, and hand its frames to the motion compensation of their trackers.
+
+    With `detect_interval` > 1 inference is skipped unless the schedule of at least one tracker asks for detection, the
+    first frame of every video included.
+
+    Args:
+        predictor (object): The predictor object about to run the batch.
+    """
+    if not hasattr(predictor, "trackers"):
+        return
+    path, im0s = predictor.batch[:2]
+    is_stream = predictor.dataset.mode == "stream"
+    if predictor.frame_skipping:
+        due = False
+        for i, im0 in enumerate(im0s):
+            j = i if is_stream else 0
+            new_video = predictor.vid_path[j] != predictor.save_dir / Path(path[i]).name
+            due |= predictor.schedules[j].due(im0, predictor.trackers[j].uncertainty()) or new_video
+        predictor.skip_inference = not due
+        for i in range(len(im0s)):
+            predictor.schedules[i if is_stream else 0].step(detected=due)
+    for i, im0 in enumerate(im0s):
+        gmc = getattr(predictor.trackers[i if is_stream else 0], "gmc", None)
+        if gmc is not None and gmc.asynchronous:
+            gmc.submit(im0)
+
 
 def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None:
     """
@@ -57,6 +118,21 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
 
     is_obb = predictor.args.task == "obb"
     is_stream = predictor.dataset.mode == "stream"
+    if predictor.skip_inference:
+        for i in range(len(im0s)):
+            tracker, schedule = predictor.trackers[i if is_stream else 0], predictor.schedules[i if is_stream else 0]
+            tracks = tracker.coast(im0s[i], schedule.flow if schedule.refine else None)
+            tracks = torch.as_tensor(tracks).reshape(-1, 9 if is_obb else 8)[:, :-1]  # drop the detection index
+            predictor.results[i].update(**{"obb" if is_obb else "boxes": tracks})
+        return
+
+    embeddings = None
+    if predictor.reid_hook is not None and getattr(predictor.trackers[0], "encoder", None) is not None:
+        features = predictor.reid_hook.pop(len(im0s))
+        if features is None:
+            raise RuntimeError("ReID feature maps do not match the batch, the detection head must run once per batch")
+        boxes = [(r.obb if is_obb else r.boxes).xyxy for r in predictor.results]
+        embeddings = predictor.reid_hook.embed(features, boxes, [im0.shape[:2] for im0 in im0s])
     for i in range(len(im0s)):
         tracker = predictor.trackers[i if is_stream else 0]
         vid_path = predictor.save_dir / Path(path[i]).name
@@ -65,7 +141,11 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
             predictor.vid_path[i if is_stream else 0] = vid_path
 
         det = (predictor.results[i].obb if is_obb else predictor.results[i].boxes).cpu().numpy()
+        if embeddings is not None:
+            tracker.encoder.embeddings = embeddings[i]
         if len(det) == 0:
+            if hasattr(tracker, "gmc"):
+                tracker.gmc.skip(im0s[i])  # release the frame handed over in on_predict_batch_start
             continue
         tracks = tracker.update(det, im0s[i])
         if len(tracks) == 0:
@@ -78,6 +158,18 @@ def on_predict_postprocess_end(predictor: object, persist: bool = False) -> None
         predictor.results[i].update(**update_args)
 
 
+def on_predict_end(predictor: object) -> None:
+    """
+    Remove the ReID feature hook from the model once prediction ends, releasing its captured feature maps.
+
+    Args:
+        predictor (object): The predictor object that finished predicting.
+    """
+    if predictor.reid_hook is not None:
+        predictor.reid_hook.remove()
+        predictor.reid_hook = None
+
+
 def register_tracker(model: object, persist: bool) -> None:
     """
     Register tracking callbacks to the model for object tracking during prediction.
@@ -87,4 +179,6 @@ def register_tracker(model: object, persist: bool) -> None:
         persist (bool): Whether to persist the trackers if they already exist.
     """
     model.add_callback("on_predict_start", partial(on_predict_start, persist=persist))
+    model.add_callback("on_predict_batch_start", on_predict_batch_start)
     model.add_callback("on_predict_postprocess_end", partial(on_predict_postprocess_end, persist=persist))
+    model.add_callback("on_predict_end", on_predict_end)
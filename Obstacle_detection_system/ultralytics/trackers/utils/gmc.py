@@ -1,6 +1,8 @@
 # Ultralytics YOLO 🚀, AGPL-3.0 license
 
 import copy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import numpy as np
@@ -15,13 +17,25 @@ class GMC:
     This class provides methods for tracking and detecting objects based on several tracking algorithms including ORB,
     SIFT, ECC, and Sparse Optical Flow. It also supports downscaling of frames for computational efficiency.
 
+    With `interval` K > 1 the motion is only estimated on every K-th frame, against the previous estimated frame. Frames
+    in between reuse the last per-frame motion, and the next estimate corrects what they got wrong, so the summed warp
+    over each interval equals the measured one. With `asynchronous`, estimates run in a worker thread; frames passed to
+    `submit` before detection are processed while the detector runs, and `apply` only waits for the result. In both
+    modes sparse optical flow carries tracked keypoints over to the next estimate and only detects new ones when fewer
+    than half of them survive.
+
     Attributes:
         method (str): The method used for tracking. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
         downscale (int): Factor by which to downscale the frames for processing.
+        interval (int): Number of frames between motion estimates.
+        asynchronous (bool): Whether motion estimates run in a worker thread.
         prevFrame (np.ndarray): Stores the previous frame for tracking.
         prevKeyPoints (list): Stores the keypoints from the previous frame.
         prevDescriptors (np.ndarray): Stores the descriptors from the previous frame.
         initializedFirstFrame (bool): Flag to indicate if the first frame has been processed.
+        step (np.ndarray): The last estimated per-frame motion, applied to frames between estimates.
+        applied (np.ndarray): The 3x3 motion applied since the last estimate.
+        skipped (np.ndarray): The 3x3 motion estimated on skipped frames and not applied yet.
 
     Methods:
         __init__(self, method='sparseOptFlow', downscale=2): Initializes a GMC object with the specified method
@@ -31,20 +45,27 @@ class GMC:
         applyEcc(self, raw_frame, detections=None): Applies the ECC algorithm to a raw frame.
         applyFeatures(self, raw_frame, detections=None): Applies feature-based methods like ORB or SIFT to a raw frame.
         applySparseOptFlow(self, raw_frame, detections=None): Applies the Sparse Optical Flow method to a raw frame.
+        submit(self, raw_frame, detections=None): Starts the motion estimate of the next frame ahead of `apply`.
+        skip(self, raw_frame): Consumes a submitted frame that will not be applied.
     """
 
-    def __init__(self, method: str = "sparseOptFlow", downscale: int = 2) -> None:
+    def __init__(self, method: str = "sparseOptFlow", downscale: int = 2, interval: int = 1, asynchronous=False):
         """
         Initialize a video tracker with specified parameters.
 
         Args:
             method (str): The method used for tracking. Options include 'orb', 'sift', 'ecc', 'sparseOptFlow', 'none'.
             downscale (int): Downscale factor for processing frames.
+            interval (int): Number of frames between motion estimates.
+            asynchronous (bool): Whether to run motion estimates in a worker thread.
         """
         super().__init__()
 
         self.method = method
         self.downscale = max(1, int(downscale))
+        self.interval = max(1, int(interval))
+        self.asynchronous = asynchronous
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gmc") if asynchronous else None
 
         if self.method == "orb":
             self.detector = cv2.FastFeatureDetector_create(20)
@@ -76,11 +97,42 @@ class GMC:
         self.prevKeyPoints = None
         self.prevDescriptors = None
         self.initializedFirstFrame = False
+        self.reset_schedule()
+
+    @property
+    def rate_limited(self) -> bool:
+        """Whether motion is estimated on a schedule, every `interval` frames or in a worker thread."""
+        return self.interval > 1 or self.asynchronous
+
+    def submit(self, raw_frame: np.array, detections: list = None) -> None:
+        """
+        Register the next frame and start its motion estimate if one is due, without waiting for the result.
+
+        Call it before detection to overlap the estimate with the detector; `apply` with the same frame then returns
+        its warp. Detections used to mask features default to those of the previous frame. Does nothing unless motion
+        is estimated on a schedule.
+
+        Args:
+            raw_frame (np.ndarray): The raw frame to be processed.
+            detections (list): List of detections to be used in the processing.
+        """
+        if self.method is None or not self.rate_limited:
+            return
+        detections = self.detections if detections is None else detections
+        due = self.frames % self.interval == 0
+        self.frames += 1
+        future = None
+        if due and self.executor is not None:
+            future = self.executor.submit(self.estimate, raw_frame, detections)
+        self.pending.append((raw_frame, detections, due, future))
 
     def apply(self, raw_frame: np.array, detections: list = None) -> np.array:
         """
         Apply object detection on a raw frame using specified method.
 
+        On a schedule, frames without a due estimate get the last per-frame motion and frames with one wait for the
+        estimate started by `submit`, or run it now if the frame was not submitted.
+
         Args:
             raw_frame (np.ndarray): The raw frame to be processed.
             detections (list): List of detections to be used in the processing.
@@ -94,6 +146,42 @@ class GMC:
             array([[1, 2, 3],
                    [4, 5, 6]])
         """
+        if self.method is None or not self.rate_limited:
+            return self.estimate(raw_frame, detections)
+        while self.pending and self.pending[0][0] is not raw_frame:  # submitted but never applied
+            self.skip(self.pending[0][0])
+        if not self.pending:
+            self.submit(raw_frame, detections)
+        _, masked, due, future = self.pending.popleft()
+        self.detections = masked if detections is None else detections
+        if not due:
+            self.applied = np.vstack([self.step, [0, 0, 1]]) @ self.applied
+            return self.step.copy()
+
+        H = future.result() if future is not None else self.estimate(raw_frame, masked)
+        H = np.vstack([H, [0, 0, 1]])
+        warp = H @ self.skipped @ np.linalg.inv(self.applied)  # correct the motion assumed since the last estimate
+        self.step = self.root(H[:2], self.interval)
+        self.applied, self.skipped = np.eye(3), np.eye(3)
+        return warp[:2]
+
+    def skip(self, raw_frame: np.array) -> None:
+        """
+        Consume a submitted frame that will not be applied, e.g. when the tracker is not updated on it.
+
+        Motion estimated on it is added to the warp of the next estimated frame, as the tracks never received it.
+
+        Args:
+            raw_frame (np.ndarray): The frame passed to `submit`.
+        """
+        if not self.pending or self.pending[0][0] is not raw_frame:
+            return
+        _, _, _, future = self.pending.popleft()
+        if future is not None:
+            self.skipped = np.vstack([future.result(), [0, 0, 1]]) @ self.skipped
+
+    def estimate(self, raw_frame: np.array, detections: list = None) -> np.array:
+        """Estimate the motion from the previously processed frame to `raw_frame` with the chosen method."""
         if self.method in {"orb", "sift"}:
             return self.applyFeatures(raw_frame, detections)
         elif self.method == "ecc":
@@ -315,8 +403,11 @@ class GMC:
         if self.downscale > 1.0:
             frame = cv2.resize(frame, (width // self.downscale, height // self.downscale))
 
-        # Find the keypoints
-        keypoints = cv2.goodFeaturesToTrack(frame, mask=None, **self.feature_params)
+        # Find the keypoints, unless enough of them were tracked from the previous estimate
+        keypoints = None
+        if not self.rate_limited or self.prevKeyPoints is None or len(self.prevKeyPoints) < self.minKeyPoints:
+            keypoints = cv2.goodFeaturesToTrack(frame, mask=None, **self.feature_params)
+            self.minKeyPoints = 0 if keypoints is None else len(keypoints) // 2
 
         # Handle first frame
         if not self.initializedFirstFrame or self.prevKeyPoints is None:
@@ -351,12 +442,49 @@ class GMC:
             LOGGER.warning("WARNING: not enough matching points")
 
         self.prevFrame = frame.copy()
-        self.prevKeyPoints = copy.copy(keypoints)
+        self.prevKeyPoints = copy.copy(keypoints) if keypoints is not None else matchedKeypoints[status[:, 0] == 1]
 
         return H
 
+    @staticmethod
+    def root(H: np.array, n: int) -> np.array:
+        """
+        Split a similarity transform into n equal steps.
+
+        Args:
+            H (np.ndarray): A 2x3 similarity transform as returned by the estimators.
+            n (int): Number of steps.
+
+        Returns:
+            (np.ndarray): The 2x3 transform that gives `H` when applied n times.
+        """
+        if n == 1:
+            return H.copy()
+        angle = np.arctan2(H[1, 0], H[0, 0]) / n
+        scale = np.hypot(H[0, 0], H[1, 0]) ** (1 / n)
+        A = scale * np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        S, P = np.zeros((2, 2)), np.eye(2)
+        for _ in range(n):  # S = I + A + ... + A^(n-1), the translation is t = S @ t_step
+            S += P
+            P = A @ P
+        return np.hstack([A, np.linalg.solve(S, H[:, 2:])])
+
+    def reset_schedule(self) -> None:
+        """Reset the estimate schedule, dropping any pending estimates."""
+        for _, _, _, future in getattr(self, "pending", ()):
+            if future is not None:
+                future.result()  # the worker may still be updating the previous frame state
+        self.pending = deque()
+        self.frames = 0
+        self.detections = None
+        self.minKeyPoints = 0
+        self.step = np.eye(2, 3)
+        self.applied = np.eye(3)
+        self.skipped = np.eye(3)
+
     def reset_params(self) -> None:
         """Reset parameters."""
+        self.reset_schedule()
         self.prevFrame = None
         self.prevKeyPoints = None
         self.prevDescriptors = None
@@ -3,6 +3,10 @@
 import numpy as np
 import scipy.linalg
 
+# 0.95 quantile of the chi-square distribution with N degrees of freedom (N=1, ..., 9), used as Mahalanobis gating
+# threshold
+chi2inv95 = {1: 3.8415, 2: 5.9915, 3: 7.8147, 4: 9.4877, 5: 11.070, 6: 12.592, 7: 14.067, 8: 15.507, 9: 16.919}
+
 
 class KalmanFilterXYAH:
     """
@@ -113,6 +117,29 @@ class KalmanFilterXYAH:
         covariance = np.linalg.multi_dot((self._update_mat, covariance, self._update_mat.T))
         return mean, covariance + innovation_cov
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray) -> tuple:
+        """
+        Project state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            (tuple[ndarray, ndarray]): Returns the Nx4 projected means and Nx4x4 projected covariance matrices.
+        """
+        std = [
+            self._std_weight_position * mean[:, 3],
+            self._std_weight_position * mean[:, 3],
+            1e-1 * np.ones_like(mean[:, 3]),
+            self._std_weight_position * mean[:, 3],
+        ]
+        innovation_cov = np.square(np.stack(std, 1))[:, None] * np.eye(4)
+
+        mean = np.dot(mean, self._update_mat.T)
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        return mean, covariance + innovation_cov
+
     def multi_predict(self, mean: np.ndarray, covariance: np.ndarray) -> tuple:
         """
         Run Kalman filter prediction step (Vectorized version).
@@ -173,6 +200,32 @@ class KalmanFilterXYAH:
         new_covariance = covariance - np.linalg.multi_dot((kalman_gain, projected_cov, kalman_gain.T))
         return new_mean, new_covariance
 
+    def multi_update(self, mean: np.ndarray, covariance: np.ndarray, measurement: np.ndarray) -> tuple:
+        """
+        Run Kalman filter correction step (Vectorized version).
+
+        All states are corrected with one batched solve instead of one Cholesky factorization per state, so the cost of
+        the update phase grows in NumPy rather than in Python with the number of matched tracks.
+
+        Args:
+            mean (ndarray): The Nx8 dimensional mean matrix of the predicted object states.
+            covariance (ndarray): The Nx8x8 covariance matrix of the predicted object states.
+            measurement (ndarray): The Nx4 dimensional measurement matrix, one measurement per state in the format
+                used by `update`.
+
+        Returns:
+            (tuple[ndarray, ndarray]): Returns the measurement-corrected state distributions.
+        """
+        projected_mean, projected_cov = self.multi_project(mean, covariance)
+
+        # projected_cov is symmetric, so K = P H^T S^-1 is the transpose of S^-1 (P H^T)^T
+        kalman_gain = np.linalg.solve(projected_cov, self._update_mat @ covariance).transpose((0, 2, 1))
+        innovation = measurement - projected_mean
+
+        new_mean = mean + np.einsum("nij,nj->ni", kalman_gain, innovation)
+        new_covariance = covariance - kalman_gain @ projected_cov @ kalman_gain.transpose((0, 2, 1))
+        return new_mean, new_covariance
+
     def gating_distance(
         self,
         mean: np.ndarray,
@@ -215,6 +268,46 @@ class KalmanFilterXYAH:
         else:
             raise ValueError("Invalid distance metric")
 
+    def multi_gating_distance(
+        self,
+        mean: np.ndarray,
+        covariance: np.ndarray,
+        measurements: np.ndarray,
+        only_position: bool = False,
+        metric: str = "maha",
+    ) -> np.ndarray:
+        """
+        Compute gating distances between N state distributions and M measurements (Vectorized version of
+        `gating_distance`).
+
+        Args:
+            mean (ndarray): The Nx8 dimensional mean matrix of the state distributions.
+            covariance (ndarray): The Nx8x8 covariance matrix of the state distributions.
+            measurements (ndarray): An Mx4 matrix of M measurements in the format used by `gating_distance`.
+            only_position (bool, optional): If True, distance computation is done with respect to the bounding box
+                center position only. Defaults to False.
+            metric (str, optional): The metric to use for calculating the distance. Options are 'gaussian' for the
+                squared Euclidean distance and 'maha' for the squared Mahalanobis distance. Defaults to 'maha'.
+
+        Returns:
+            (np.ndarray): Returns an NxM matrix, where element (i, j) contains the squared distance between
+                (mean[i], covariance[i]) and `measurements[j]`.
+        """
+        mean, covariance = self.multi_project(mean, covariance)
+        if only_position:
+            mean, covariance = mean[:, :2], covariance[:, :2, :2]
+            measurements = measurements[:, :2]
+
+        d = measurements[None] - mean[:, None]  # NxMxk
+        if metric == "gaussian":
+            return np.sum(d * d, axis=2)
+        elif metric == "maha":
+            cholesky_factor = np.linalg.cholesky(covariance)
+            z = np.linalg.solve(cholesky_factor, d.transpose((0, 2, 1)))
+            return np.sum(z * z, axis=1)  # square maha
+        else:
+            raise ValueError("Invalid distance metric")
+
 
 class KalmanFilterXYWH(KalmanFilterXYAH):
     """
@@ -309,6 +402,29 @@ class KalmanFilterXYWH(KalmanFilterXYAH):
         covariance = np.linalg.multi_dot((self._update_mat, covariance, self._update_mat.T))
         return mean, covariance + innovation_cov
 
+    def multi_project(self, mean: np.ndarray, covariance: np.ndarray) -> tuple:
+        """
+        Project state distributions to measurement space (Vectorized version).
+
+        Args:
+            mean (ndarray): The Nx8 dimensional mean matrix of the object states.
+            covariance (ndarray): The Nx8x8 covariance matrix of the object states.
+
+        Returns:
+            (tuple[ndarray, ndarray]): Returns the Nx4 projected means and Nx4x4 projected covariance matrices.
+        """
+        std = [
+            self._std_weight_position * mean[:, 2],
+            self._std_weight_position * mean[:, 3],
+            self._std_weight_position * mean[:, 2],
+            self._std_weight_position * mean[:, 3],
+        ]
+        innovation_cov = np.square(np.stack(std, 1))[:, None] * np.eye(4)
+
+        mean = np.dot(mean, self._update_mat.T)
+        covariance = self._update_mat @ covariance @ self._update_mat.T
+        return mean, covariance + innovation_cov
+
     def multi_predict(self, mean, covariance) -> tuple:
         """
         Run Kalman filter prediction step (Vectorized version).
@@ -6,6 +6,8 @@ from scipy.spatial.distance import cdist
 
 from ultralytics.utils.metrics import batch_probiou, bbox_ioa
 
+from .kalman_filter import chi2inv95
+
 try:
     import lap  # for linear_assignment
 
@@ -58,19 +60,45 @@ def linear_assignment(cost_matrix: np.ndarray, thresh: float, use_lap: bool = Tr
     return matches, unmatched_a, unmatched_b
 
 
+def gate_cost_matrix(
+    kf, cost_matrix: np.ndarray, mean: np.ndarray, covariance: np.ndarray, measurements: np.ndarray
+) -> np.ndarray:
+    """
+    Exclude track-detection pairs that lie outside the 95% gate of the tracks' Kalman state distributions.
+
+    Args:
+        kf (KalmanFilterXYAH): The Kalman filter of the tracks.
+        cost_matrix (np.ndarray): The NxM cost matrix between N tracks and M detections, updated in place.
+        mean (np.ndarray): The Nx8 Kalman state means of the tracks.
+        covariance (np.ndarray): The Nx8x8 Kalman state covariances of the tracks.
+        measurements (np.ndarray): The Mx4 detections in the measurement space of `kf`.
+
+    Returns:
+        (np.ndarray): The cost matrix, with gated pairs set to infinity so they are never matched.
+    """
+    if cost_matrix.size == 0:
+        return cost_matrix
+    gating_distance = kf.multi_gating_distance(mean, covariance, measurements)
+    cost_matrix[gating_distance > chi2inv95[4]] = np.inf
+    return cost_matrix
+
+
 def iou_distance(atracks: list, btracks: list) -> np.ndarray:
     """
     Compute cost based on Intersection over Union (IoU) between tracks.
 
     Args:
-        atracks (list[STrack] | list[np.ndarray]): List of tracks 'a' or bounding boxes.
-        btracks (list[STrack] | list[np.ndarray]): List of tracks 'b' or bounding boxes.
+        atracks (list[STrack] | list[np.ndarray] | np.ndarray): List of tracks 'a' or bounding boxes.
+        btracks (list[STrack] | list[np.ndarray] | np.ndarray): List of tracks 'b' or bounding boxes.
 
     Returns:
         (np.ndarray): Cost matrix computed based on IoU.
     """
 
-    if atracks and isinstance(atracks[0], np.ndarray) or btracks and isinstance(btracks[0], np.ndarray):
+    if isinstance(atracks, np.ndarray) or isinstance(btracks, np.ndarray):
+        atlbrs = atracks
+        btlbrs = btracks
+    elif atracks and isinstance(atracks[0], np.ndarray) or btracks and isinstance(btracks[0], np.ndarray):
         atlbrs = atracks
         btlbrs = btracks
     else:
@@ -0,0 +1,141 @@
+# Ultralytics YOLO 🚀, AGPL-3.0 license
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+
+from ultralytics.nn.modules import Detect
+from ultralytics.utils import LOGGER
+
+
+class FeatureHook:
+    """
+    Captures the feature maps entering the detection head and pools ReID embeddings per box from them.
+
+    The maps are the same ones the `embed` argument of `BaseModel.predict` pools over the whole image, taken here at the
+    head input so that detection still runs. Every box is pooled from every level with one batched RoI-align per level,
+    and the L2-normalized level embeddings are concatenated, so ReID costs no second network. Only the first head call
+    inside `record`, on the recording thread, is captured, so augmented passes and other forwards of the same model,
+    e.g. from other threads, never get paired with the detections of a batch.
+
+    Attributes:
+        head (Detect): The detection head of the model.
+        strides (list[float]): Stride of each captured level.
+        features (deque): Captured feature maps of the last forward passes, oldest first.
+        thread (int | None): Identifier of the thread whose next head call is captured, None when not recording.
+        handle (torch.utils.hooks.RemovableHandle): Handle of the forward pre-hook.
+
+    Methods:
+        attach(model): Returns a FeatureHook on a loaded model, or None if its feature maps are not accessible.
+        record(): Context manager capturing the first head call of the current thread.
+        pop(n): Returns the oldest captured feature maps if they belong to a batch of n images.
+        embed(features, boxes, orig_shapes): Pools one embedding per box.
+        remove(): Removes the hook and drops the captured feature maps.
+    """
+
+    def __init__(self, head, maxlen=4):
+        """Registers a forward pre-hook on `head`, keeping the feature maps of the last `maxlen` forward passes."""
+        self.head = head
+        self.strides = head.stride.tolist()
+        self.features = deque(maxlen=maxlen)  # bounded, batches queue up only while pipelined stages overlap
+        self.thread = None
+        self.handle = head.register_forward_pre_hook(self._capture)
+
+    @classmethod
+    def attach(cls, model):
+        """
+        Hooks the detection head of a loaded model.
+
+        Args:
+            model (AutoBackend): The predictor model.
+
+        Returns:
+            (FeatureHook | None): The hook, or None if the model is not a PyTorch model with a detection head.
+        """
+        head = getattr(getattr(model, "model", None), "model", [None])[-1] if getattr(model, "pt", False) else None
+        if not isinstance(head, Detect):
+            LOGGER.warning("WARNING ⚠️ ReID embeddings need a PyTorch detection model, ReID disabled.")
+            return None
+        return cls(head)
+
+    @contextmanager
+    def record(self):
+        """Captures the feature maps of the first head call made by the current thread inside the context."""
+        self.thread = threading.get_ident()
+        try:
+            yield
+        finally:
+            self.thread = None
+
+    def _capture(self, module, args):
+        """Stores the list of feature maps passed to the head, before the head overwrites its entries."""
+        if self.thread is not None and self.thread == threading.get_ident():
+            self.thread = None  # first call only, later ones are augmented passes
+            self.features.append(list(args[0]))
+
+    def pop(self, n):
+        """Returns the oldest captured feature maps if they cover a batch of `n` images, else None."""
+        if not self.features:
+            return None
+        features = self.features.popleft()
+        return features if len(features[0]) == n else None  # e.g. sliced inference runs the head on tiles
+
+    @torch.no_grad()
+    def embed(self, features, boxes, orig_shapes):
+        """
+        Pools one embedding per box from each feature level and concatenates the normalized level embeddings.
+
+        Args:
+            features (list[torch.Tensor]): Feature maps of a batch, one (B, C, H, W) tensor per level.
+            boxes (list[torch.Tensor]): xyxy boxes of each image in original image coordinates.
+            orig_shapes (list[tuple]): (height, width) of each original image.
+
+        Returns:
+            (list[np.ndarray]): Float32 embeddings of each image, one row per box.
+        """
+        from torchvision.ops import roi_align  # scope for faster 'import ultralytics'
+
+        h, w = (x * self.strides[0] for x in features[0].shape[2:])
+        rois = []
+        for i, (b, (h0, w0)) in enumerate(zip(boxes, orig_shapes)):
+            # Map boxes onto the letterboxed input, the inverse of ops.scale_boxes
+            gain = min(h / h0, w / w0)
+            pad = torch.tensor([round((w - w0 * gain) / 2 - 0.1), round((h - h0 * gain) / 2 - 0.1)] * 2)
+            b = b.float() * gain + pad.to(b.device)
+            rois.append(torch.cat([torch.full_like(b[:, :1], i), b], 1))
+        rois = torch.cat(rois).to(features[0].device)
+        if not len(rois):
+            return [np.zeros((0, sum(x.shape[1] for x in features)), dtype=np.float32) for _ in boxes]
+
+        embeddings = []
+        for x, s in zip(features, self.strides):
+            e = roi_align(x, rois.to(x.dtype), 1, spatial_scale=1 / s, sampling_ratio=-1, aligned=True).flatten(1)
+            embeddings.append(F.normalize(e.float(), dim=1))
+        embeddings = torch.cat(embeddings, 1).cpu().numpy()
+        return np.split(embeddings, np.cumsum([len(b) for b in boxes])[:-1])
+
+    def remove(self):
+        """Removes the hook from the head and drops the captured feature maps."""
+        self.handle.remove()
+        self.features.clear()
+
+
+class DetectorEncoder:
+    """
+    ReID encoder for BoT-SORT that serves the embeddings pooled by a FeatureHook for the current frame.
+
+    Attributes:
+        embeddings (np.ndarray | None): Embeddings of all detections of the current frame, in detection order.
+    """
+
+    def __init__(self):
+        """Initializes the encoder without embeddings."""
+        self.embeddings = None
+
+    def inference(self, img, dets):
+        """Returns the embeddings of `dets`, whose last column is the index of each detection in its frame."""
+        return self.embeddings[dets[:, -1].astype(int)].copy()
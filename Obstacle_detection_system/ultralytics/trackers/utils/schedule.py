@@ -0,0 +1,106 @@
+# Ultralytics YOLO 🚀, AGPL-3.0 license
+
+import cv2
+import numpy as np
+
+
+class DetectionSchedule:
+    """
+    Decides on which frames of a video the detector runs while tracking, and measures box motion on the others.
+
+    The detector runs on every `interval`-th frame, and earlier when the frame changed by more than `motion` mean gray
+    levels since the last detected frame, or when a track's position uncertainty grew beyond `uncertainty` times its
+    height. On the frames in between the tracker advances its tracks with the Kalman filter alone, optionally corrected
+    with the sparse optical flow of each box, measured on a downscaled grayscale copy of the frames.
+
+    Attributes:
+        interval (int): Maximum number of frames between detected frames.
+        motion (float): Mean absolute gray level change that triggers detection, 0 to disable.
+        uncertainty (float): Position standard deviation, relative to the box height, that triggers detection, 0 to
+            disable.
+        refine (bool): Whether boxes are refined with optical flow on frames without detection.
+        size (int): Long side of the downscaled frames.
+        count (int): Frames since the last detected frame.
+        key (np.ndarray | None): Downscaled last detected frame.
+        prev (np.ndarray | None): Downscaled previous frame.
+        curr (np.ndarray | None): Downscaled current frame.
+        scale (float): Downscale factor of the current frame.
+
+    Methods:
+        due(img, uncertainty): Whether the detector should run on a frame.
+        step(detected): Records whether the detector ran on the current frame.
+        flow(boxes): Median optical flow of boxes from the previous frame to the current one.
+        reset(): Forgets all frames, so the next frame is detected.
+    """
+
+    def __init__(self, interval=1, motion=0.0, uncertainty=0.0, refine=False, size=320):
+        """Initializes the schedule, see the class attributes for the arguments."""
+        self.interval = max(1, int(interval))
+        self.motion = motion
+        self.uncertainty = uncertainty
+        self.refine = refine
+        self.size = size
+        self.reset()
+
+    def due(self, img, uncertainty=0.0):
+        """
+        Whether the detector should run on a frame, which becomes the current frame.
+
+        Args:
+            img (np.ndarray): The BGR frame.
+            uncertainty (float): The largest position standard deviation of the tracks, relative to their box height.
+
+        Returns:
+            (bool): True if the interval is over or a motion or uncertainty trigger fired.
+        """
+        h, w = img.shape[:2]
+        self.scale = min(1.0, self.size / max(h, w))
+        small = cv2.resize(img, (round(w * self.scale), round(h * self.scale)), interpolation=cv2.INTER_AREA)
+        self.prev, self.curr = self.curr, cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        if self.key is None or self.count + 1 >= self.interval or self.key.shape != self.curr.shape:
+            return True
+        if self.motion and cv2.absdiff(self.curr, self.key).mean() > self.motion:
+            return True
+        return bool(self.uncertainty and uncertainty > self.uncertainty)
+
+    def step(self, detected):
+        """Records whether the detector ran on the current frame."""
+        if detected:
+            self.key, self.count = self.curr, 0
+        else:
+            self.count += 1
+
+    def flow(self, boxes):
+        """
+        Measures the motion of boxes from the previous frame to the current one with sparse optical flow.
+
+        A 4x4 grid of points over the inner part of every box is tracked in one pyramidal Lucas-Kanade call, and each
+        box moves by the median displacement of its tracked points.
+
+        Args:
+            boxes (np.ndarray): (N, 4) xyxy boxes in the previous frame.
+
+        Returns:
+            (tuple[np.ndarray, np.ndarray]): (N, 2) displacements in pixels, and whether enough points of each box were
+                tracked for its displacement to be valid.
+        """
+        n = len(boxes)
+        if n == 0 or self.prev is None or self.prev.shape != self.curr.shape:
+            return np.zeros((n, 2)), np.zeros(n, dtype=bool)
+        g = np.linspace(0.2, 0.8, 4)
+        grid = np.stack(np.meshgrid(g, g), -1).reshape(1, -1, 2)
+        points = boxes[:, None, :2] + grid * (boxes[:, None, 2:] - boxes[:, None, :2])  # (N, 16, 2)
+        p0 = (points * self.scale).reshape(-1, 1, 2).astype(np.float32)
+        p1, status, _ = cv2.calcOpticalFlowPyrLK(self.prev, self.curr, p0, None, winSize=(15, 15), maxLevel=2)
+        d = (p1 - p0).reshape(n, -1, 2) / self.scale
+        valid = status.reshape(n, -1).astype(bool)
+        ok = valid.sum(1) >= 4
+        d[~valid] = np.nan
+        d[~ok] = 0
+        return np.nanmedian(d, axis=1), ok
+
+    def reset(self):
+        """Forgets all frames, so the next frame is detected."""
+        self.count = 0
+        self.key = self.prev = self.curr = None
+        self.scale = 1.0
@@ -3,9 +3,11 @@
 Benchmark a YOLO model formats for speed and accuracy.
 
 Usage:
-    from ultralytics.utils.benchmarks import ProfileModels, benchmark
+    from ultralytics.utils.benchmarks import ProfileModels, benchmark, benchmark_nms, benchmark_tracker
     ProfileModels(['yolov8n.yaml', 'yolov8s.yaml']).profile()
     benchmark(model='yolov8n.pt', imgsz=160)
+    benchmark_nms(model='yolov8n.pt', conf=0.001)
+    benchmark_tracker(objects=200, frames=300)
 
 Format                  | `format=argument`         | Model
 ---                     | ---                       | ---
@@ -29,15 +31,18 @@ import platform
 import time
 from pathlib import Path
 
+import cv2
 import numpy as np
 import torch.cuda
 
 from ultralytics import YOLO, YOLOWorld
 from ultralytics.cfg import TASK2DATA, TASK2METRIC
+from ultralytics.data.augment import LetterBox
 from ultralytics.engine.exporter import export_formats
 from ultralytics.utils import ARM64, ASSETS, IS_JETSON, IS_RASPBERRYPI, LINUX, LOGGER, MACOS, TQDM, WEIGHTS_DIR
 from ultralytics.utils.checks import IS_PYTHON_3_12, check_requirements, check_yolo
 from ultralytics.utils.files import file_size
+from ultralytics.utils.ops import non_max_suppression
 from ultralytics.utils.torch_utils import select_device
 
 
@@ -152,6 +157,142 @@ def benchmark(
     return df
 
 
+def benchmark_nms(model=WEIGHTS_DIR / "yolov8n.pt", imgsz=640, batch=8, conf=0.001, iou=0.7, runs=20, device="cpu"):
+    """
+    Benchmark plain NMS against merge-NMS and weighted box fusion on the raw output of a model.
+
+    The model is run once on a batch of ASSETS images, then `non_max_suppression` is timed on that output for each
+    `fusion` mode. A low `conf`, as used in validation, gives the largest candidate sets.
+
+    Args:
+        model (str | Path | YOLO, optional): Model, or list of weights for an ensemble. Default is yolov8n.pt.
+        imgsz (int, optional): Image size. Default is 640.
+        batch (int, optional): Number of images per batch. Default is 8.
+        conf (float, optional): Confidence threshold. Default is 0.001.
+        iou (float, optional): IoU threshold. Default is 0.7.
+        runs (int, optional): Number of timed runs per mode. Default is 20.
+        device (str, optional): Device to run the benchmark on. Default is 'cpu'.
+
+    Returns:
+        df (pandas.DataFrame): Time per batch and boxes per image of each mode.
+
+    Example:
+        ```python
+        from ultralytics.utils.benchmarks import benchmark_nms
+
+        benchmark_nms(model='yolov8n.pt', conf=0.001, device='cpu')
+        ```
+    """
+    import pandas as pd  # scope for faster 'import ultralytics'
+
+    from ultralytics.nn.autobackend import AutoBackend
+
+    device = select_device(device, verbose=False)
+    net = AutoBackend(model.model if isinstance(model, YOLO) else model, device=device, fuse=True, verbose=False)
+    net.eval()
+    images = [LetterBox(imgsz, auto=False)(image=cv2.imread(str(f))) for f in sorted(ASSETS.glob("*.jpg"))]
+    im = np.stack([images[i % len(images)] for i in range(batch)])[..., ::-1].transpose(0, 3, 1, 2)
+    im = torch.from_numpy(np.ascontiguousarray(im)).to(device).float() / 255
+    with torch.inference_mode():
+        preds = net(im)
+    preds = preds[0] if isinstance(preds, (list, tuple)) else preds
+    sources = len(net.model) if isinstance(getattr(net, "model", None), torch.nn.ModuleList) else 1
+
+    y = []
+    for fusion in None, "merge", "wbf":
+        kwargs = dict(conf_thres=conf, iou_thres=iou, nc=len(net.names), fusion=fusion, sources=sources)
+        out = non_max_suppression(preds.clone(), **kwargs)  # warmup
+        t = []
+        for _ in range(runs):
+            if device.type == "cuda":
+                torch.cuda.synchronize()
+            t0 = time.perf_counter()
+            non_max_suppression(preds.clone(), **kwargs)
+            if device.type == "cuda":
+                torch.cuda.synchronize()
+            t.append(time.perf_counter() - t0)
+        y.append([fusion or "nms", round(np.median(t) * 1e3, 2), round(sum(map(len, out)) / batch, 1)])
+
+    df = pd.DataFrame(y, columns=["Mode", "Time (ms/batch)", "Boxes/img"])
+    LOGGER.info(f"\nNMS benchmark at imgsz={imgsz}, batch={batch}, conf={conf}, iou={iou} on {device}\n{df}\n")
+    return df
+
+
+def benchmark_tracker(tracker="bytetrack.yaml", objects=100, frames=300, shape=(1080, 1920), seed=0):
+    """
+    Benchmark the per-frame update time of the object and columnar tracker backends on a synthetic sequence.
+
+    Objects move with constant velocity plus jitter, enter and leave the frame, and are missed or detected with a low
+    score at random, so every association stage of the tracker is exercised. Both backends see the same detections and
+    their outputs are compared frame by frame.
+
+    Args:
+        tracker (str, optional): Tracker YAML, 'bytetrack.yaml' or 'botsort.yaml'. Default is 'bytetrack.yaml'.
+        objects (int, optional): Number of objects in the scene at a time. Default is 100.
+        frames (int, optional): Number of frames. Default is 300.
+        shape (tuple, optional): Frame (height, width). Default is (1080, 1920).
+        seed (int, optional): Random seed of the sequence. Default is 0.
+
+    Returns:
+        df (pandas.DataFrame): Update time per frame and tracks per frame of each backend, and whether the outputs of
+            the columnar backend match the object backend.
+
+    Example:
+        ```python
+        from ultralytics.utils.benchmarks import benchmark_tracker
+
+        benchmark_tracker('botsort.yaml', objects=200, frames=300)
+        ```
+    """
+    import pandas as pd  # scope for faster 'import ultralytics'
+
+    from ultralytics.engine.results import Boxes
+    from ultralytics.trackers.track import COLUMNAR_TRACKER_MAP, TRACKER_MAP
+    from ultralytics.utils import IterableSimpleNamespace, yaml_load
+    from ultralytics.utils.checks import check_yaml
+
+    cfg = IterableSimpleNamespace(**yaml_load(check_yaml(tracker)))
+    h, w = shape
+    rng = np.random.default_rng(seed)
+    xy = rng.uniform((0, 0), (w, h), (objects, 2))
+    wh = rng.uniform(20, 120, (objects, 2))
+    v = rng.normal(0, 4, (objects, 2))
+    cls = rng.integers(0, 5, objects)
+    sequence = []
+    for _ in range(frames):
+        xy += v
+        leave = (xy < 0).any(1) | (xy > (w, h)).any(1)  # replace objects leaving the frame by new ones
+        xy[leave] = rng.uniform((0, 0), (w, h), (leave.sum(), 2))
+        cls[leave] = rng.integers(0, 5, leave.sum())
+        conf = np.where(rng.random(objects) < 0.15, rng.uniform(0.15, 0.5, objects), rng.uniform(0.5, 1, objects))
+        seen = rng.random(objects) > 0.05
+        box = np.concatenate([xy - wh / 2, xy + wh / 2], 1) + rng.normal(0, 2, (objects, 4))
+        data = np.concatenate([box, conf[:, None], cls[:, None]], 1)[seen]
+        sequence.append(Boxes(data[rng.permutation(len(data))].astype(np.float32), shape))
+
+    y, outputs = [], {}
+    for backend, tracker_map in ("objects", TRACKER_MAP), ("columnar", COLUMNAR_TRACKER_MAP):
+        t, outputs[backend] = [], []
+        model = tracker_map[cfg.tracker_type](args=cfg, frame_rate=30)
+        for boxes in sequence:
+            t0 = time.perf_counter()
+            tracks = model.update(boxes)
+            t.append(time.perf_counter() - t0)
+            outputs[backend].append(np.asarray(tracks, dtype=np.float32).reshape(-1, 8))
+        n = sum(map(len, outputs[backend])) / frames
+        y.append([cfg.tracker_type, backend, round(np.mean(t) * 1e3, 3), round(n, 1)])
+
+    match = all(
+        len(a) == len(b) and (a[:, 4:] == b[:, 4:]).all() and np.allclose(a[:, :4], b[:, :4], atol=1e-2)
+        for a, b in zip(outputs["objects"], outputs["columnar"])
+    )
+    y[1].append(match)
+    y[0].append(True)
+    df = pd.DataFrame(y, columns=["Tracker", "Backend", "Time (ms/frame)", "Tracks/frame", "Match"])
+    LOGGER.info(f"\nTracker benchmark with {objects} objects over {frames} frames\n{df}\n")
+    return df
+
+
 class ProfileModels:
     """
     ProfileModels class for profiling different models on ONNX and TensorRT.
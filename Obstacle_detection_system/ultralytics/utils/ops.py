@@ -139,23 +139,58 @@ def make_divisible(x, divisor):
     return math.ceil(x / divisor) * divisor
 
 
-def nms_rotated(boxes, scores, threshold=0.45):
+def nms_rotated(boxes, scores, threshold=0.45, chunk=1024):
     """
     NMS for obbs, powered by probiou and fast-nms.
 
+    A box is dropped when any higher scoring box overlaps it by at least `threshold`. Up to `chunk` boxes the full
+    probiou matrix is used; larger sets are processed in `chunk` x `chunk` tiles of the upper triangle, keeping only
+    a running per-box maximum, so memory stays O(chunk^2) instead of O(N^2). Within a tile probiou is only computed
+    for boxes that have at least one partner close enough to reach `threshold`, a bound that follows from the
+    Bhattacharyya distance and the larger box side. The kept indices are the same as with the full matrix.
+
     Args:
         boxes (torch.Tensor): (N, 5), xywhr.
         scores (torch.Tensor): (N, ).
         threshold (float): IoU threshold.
+        chunk (int): Tile size for large inputs.
 
     Returns:
+        (torch.Tensor): Indices of the kept boxes, sorted by decreasing score.
     """
     if len(boxes) == 0:
         return np.empty((0,), dtype=np.int8)
     sorted_idx = torch.argsort(scores, descending=True)
     boxes = boxes[sorted_idx]
-    ious = batch_probiou(boxes, boxes).triu_(diagonal=1)
-    pick = torch.nonzero(ious.max(dim=0)[0] < threshold).squeeze_(-1)
+    n = len(boxes)
+    if n <= chunk:
+        ious = batch_probiou(boxes, boxes).triu_(diagonal=1)
+        pick = torch.nonzero(ious.max(dim=0)[0] < threshold).squeeze_(-1)
+        return sorted_idx[pick]
+
+    # probiou >= threshold needs Bhattacharyya distance <= bd, and that distance is at least
+    # |d|^2 / (4 * (l1 + l2)) where l = max(w, h)^2 / 12 is the largest variance of each box, 2x margin
+    bd = max(-math.log(max(1 - (1 - threshold) ** 2, 1e-7)), 0.0)
+    var = boxes[:, 2:4].amax(1).pow(2) / 12
+    iou_max = torch.zeros(n, device=boxes.device)
+    for s in range(0, n, chunk):  # rows, higher scores
+        bs, vs = boxes[s : s + chunk], var[s : s + chunk]
+        for t in range(s, n, chunk):  # columns, lower or equal scores
+            bt, vt = boxes[t : t + chunk], var[t : t + chunk]
+            # direct differences, cdist's matmul formula loses the distance at class-offset coordinates (~1e5)
+            d2 = (bs[:, None, :2] - bt[None, :, :2]).pow_(2).sum(-1)
+            near = d2 <= 8 * bd * (vs[:, None] + vt[None]) + 1e-6
+            if s == t:
+                near.triu_(diagonal=1)
+            rows, cols = near.any(1), near.any(0)
+            if not rows.any():
+                continue
+            ious = batch_probiou(bs[rows], bt[cols])
+            if s == t:  # only pairs above the diagonal
+                r, c = rows.nonzero().squeeze(1), cols.nonzero().squeeze(1)
+                ious *= r[:, None] < c[None]
+            iou_max[t : t + chunk][cols] = torch.maximum(iou_max[t : t + chunk][cols], ious.max(dim=0)[0])
+    pick = torch.nonzero(iou_max < threshold).squeeze_(-1)
     return sorted_idx[pick]
 
 
@@ -174,6 +209,9 @@ def non_max_suppression(
     max_wh=7680,
     in_place=True,
     rotated=False,
+    batched=True,
+    fusion=None,
+    sources=1,
 ):
     """
     Perform non-maximum suppression (NMS) on a set of boxes, with support for masks and multiple labels per box.
@@ -199,6 +237,13 @@ def non_max_suppression(
         max_nms (int): The maximum number of boxes into torchvision.ops.nms().
         max_wh (int): The maximum box width and height in pixels.
         in_place (bool): If True, the input prediction tensor will be modified in place.
+        rotated (bool): If True, boxes are rotated (xywhr) and suppressed with `nms_rotated`.
+        batched (bool): If True, predictions without `labels` or `rotated` boxes go through `batched_nms`, which
+            gathers and converts only candidate anchors and filters all images at once. The output is the same.
+        fusion (str, optional): Instead of discarding the boxes suppressed by a kept box, fuse them into it with
+            `fuse_boxes`, either 'merge' (merge-NMS) or 'wbf' (weighted box fusion). Ignored for `rotated` boxes.
+        sources (int): Number of predictions made per object, i.e. ensemble models times test-time augmentations,
+            used by 'wbf' to scale confidences.
 
     Returns:
         (List[torch.Tensor]): A list of length batch_size, where each element is a tensor of
@@ -210,6 +255,7 @@ def non_max_suppression(
     # Checks
     assert 0 <= conf_thres <= 1, f"Invalid Confidence threshold {conf_thres}, valid values are between 0.0 and 1.0"
     assert 0 <= iou_thres <= 1, f"Invalid IoU {iou_thres}, valid values are between 0.0 and 1.0"
+    assert fusion in {None, "merge", "wbf"}, f"Invalid fusion '{fusion}', valid values are 'merge' and 'wbf'"
     if isinstance(prediction, (list, tuple)):  # YOLOv8 model in validation model, output = (inference_out, loss_out)
         prediction = prediction[0]  # select only inference output
 
@@ -225,6 +271,22 @@ def non_max_suppression(
     multi_label &= nc > 1  # multiple labels per box (adds 0.5ms/img)
 
     prediction = prediction.transpose(-1, -2)  # shape(1,84,6300) to shape(1,6300,84)
+    if batched and not labels and not rotated:
+        return batched_nms(
+            prediction,
+            xc,
+            conf_thres,
+            iou_thres,
+            classes,
+            agnostic,
+            multi_label,
+            max_det,
+            nc,
+            max_nms,
+            max_wh,
+            fusion,
+            sources,
+        )
     if not rotated:
         if in_place:
             prediction[..., :4] = xywh2xyxy(prediction[..., :4])  # xywh to xyxy
@@ -282,19 +344,7 @@ def non_max_suppression(
             i = torchvision.ops.nms(boxes, scores, iou_thres)  # NMS
         i = i[:max_det]  # limit detections
 
-        # # Experimental
-        # merge = False  # use merge-NMS
-        # if merge and (1 < n < 3E3):  # Merge NMS (boxes merged using weighted mean)
-        #     # Update boxes as boxes(i,4) = weights(i,n) * boxes(n,4)
-        #     from .metrics import box_iou
-        #     iou = box_iou(boxes[i], boxes) > iou_thres  # IoU matrix
-        #     weights = iou * scores[None]  # box weights
-        #     x[i, :4] = torch.mm(weights, x[:, :4]).float() / weights.sum(1, keepdim=True)  # merged boxes
-        #     redundant = True  # require redundant detections
-        #     if redundant:
-        #         i = i[iou.sum(1) > 1]  # require redundancy
-
-        output[xi] = x[i]
+        output[xi] = fuse_boxes(x, boxes, i, iou_thres, fusion, sources) if fusion and not rotated else x[i]
         if (time.time() - t) > time_limit:
             LOGGER.warning(f"WARNING ⚠️ NMS time limit {time_limit:.3f}s exceeded")
             break  # time limit exceeded
@@ -302,6 +352,141 @@ def non_max_suppression(
     return output
 
 
+def batched_nms(
+    prediction,
+    xc,
+    conf_thres,
+    iou_thres,
+    classes,
+    agnostic,
+    multi_label,
+    max_det,
+    nc,
+    max_nms,
+    max_wh,
+    fusion=None,
+    sources=1,
+):
+    """
+    Vectorized body of `non_max_suppression` for a whole batch of predictions.
+
+    Candidates of all images are gathered at once and only their boxes are converted from xywh to xyxy, then they are
+    filtered, class-filtered and capped at `max_nms` together. On CUDA they are then
+    suppressed by a single torchvision NMS call, with boxes offset by class exactly as in the per-image loop and then,
+    in float64 so that no precision is lost, by image index so boxes of different images never overlap. The CPU NMS
+    kernel is quadratic in the number of boxes, so there one call per image is made on the already filtered boxes.
+    Results are split back per image, most confident first.
+
+    Args:
+        prediction (torch.Tensor): Predictions of shape (batch_size, num_boxes, 4 + num_classes + num_masks), xywh.
+        xc (torch.Tensor): Boolean candidate mask of shape (batch_size, num_boxes).
+        conf_thres (float): Confidence threshold.
+        iou_thres (float): IoU threshold.
+        classes (List[int]): Class indices to keep, all if None.
+        agnostic (bool): Class-agnostic NMS.
+        multi_label (bool): Allow multiple labels per box.
+        max_det (int): Maximum number of boxes to keep per image.
+        nc (int): Number of classes.
+        max_nms (int): Maximum number of boxes per image into NMS.
+        max_wh (int): Maximum box width and height in pixels, used for the class offset.
+        fusion (str, optional): Box fusion mode passed to `fuse_boxes` per image, 'merge' or 'wbf'.
+        sources (int): Number of predictions made per object, used by 'wbf'.
+
+    Returns:
+        (List[torch.Tensor]): Per-image tensors of shape (num_boxes, 6 + num_masks), as from `non_max_suppression`.
+    """
+    import torchvision  # scope for faster 'import ultralytics'
+
+    bs, nm = prediction.shape[0], prediction.shape[2] - nc - 4
+    bi, ai = xc.nonzero(as_tuple=True)  # image and anchor index of each candidate
+    x = prediction[bi, ai]
+    box, cls, mask = x.split((4, nc, nm), 1)
+    box = xywh2xyxy(box)  # xywh to xyxy
+    if multi_label:
+        i, j = torch.where(cls > conf_thres)
+        x, bi = torch.cat((box[i], x[i, 4 + j, None], j[:, None].float(), mask[i]), 1), bi[i]
+    else:  # best class only
+        conf, j = cls.max(1, keepdim=True)
+        keep = conf.view(-1) > conf_thres
+        x, bi = torch.cat((box, conf, j.float(), mask), 1)[keep], bi[keep]
+    if classes is not None:
+        keep = (x[:, 5:6] == torch.tensor(classes, device=x.device)).any(1)
+        x, bi = x[keep], bi[keep]
+    if not x.shape[0]:
+        return [torch.zeros((0, 6 + nm), device=prediction.device)] * bs
+
+    counts = torch.bincount(bi, minlength=bs)
+    if counts.max() > max_nms:  # keep the max_nms most confident boxes of each image
+        order = x[:, 4].argsort(descending=True)
+        order = order[torch.sort(bi[order], stable=True)[1]]  # group by image, most confident first
+        x, bi = x[order], bi[order]
+        rank = torch.arange(len(bi), device=bi.device) - (counts.cumsum(0) - counts)[bi]
+        x, bi = x[rank < max_nms], bi[rank < max_nms]
+        counts = counts.clamp(max=max_nms)
+    sizes, starts = counts.tolist(), (counts.cumsum(0) - counts).tolist()  # candidates of each image, x is grouped
+
+    boxes = x[:, :4] + x[:, 5:6] * (0 if agnostic else max_wh)  # boxes (offset by class)
+    scores = x[:, 4]  # scores
+    if boxes.is_cuda and len(boxes) <= 100000:  # one parallel NMS kernel for the whole batch
+        offset = boxes.double()  # float64 so that the image offset costs no precision
+        offset += bi[:, None] * (offset.max() - offset.min() + 1)  # offset by image
+        i = torchvision.ops.nms(offset, scores.double(), iou_thres)  # NMS, sorted by score
+        i = i[torch.sort(bi[i], stable=True)[1]]  # group by image, keeping score order
+    else:  # CPU NMS cost grows quadratically with the number of boxes, one call per image is cheaper
+        order = torch.sort(bi, stable=True)[1]
+        i = torch.cat([k[torchvision.ops.nms(boxes[k], scores[k], iou_thres)] for k in order.split(counts.tolist())])
+    counts = torch.bincount(bi[i], minlength=bs)
+    rank = torch.arange(len(i), device=i.device) - (counts.cumsum(0) - counts)[bi[i]]
+    i = i[rank < max_det]  # limit detections
+    counts = counts.clamp(max=max_det).tolist()
+    if not fusion:
+        return list(x[i].split(counts))
+    return [
+        fuse_boxes(xi, b, k - start, iou_thres, fusion, sources)
+        for xi, b, k, start in zip(x.split(sizes), boxes.split(sizes), i.split(counts), starts)
+    ]
+
+
+def fuse_boxes(x, boxes, i, iou_thres, mode="merge", sources=1):
+    """
+    Replaces the boxes kept by NMS with the confidence-weighted mean of the candidates they overlap.
+
+    With 'merge' (merge-NMS) every kept box averages all candidates of its class with IoU above `iou_thres`, and keeps
+    its confidence. With 'wbf' (weighted box fusion) each candidate is assigned to the most confident kept box it
+    overlaps only, and the fused confidence is the summed confidence of the cluster divided by max(cluster size,
+    `sources`), which lowers boxes that only some of the models or augmentations found. Both use a single (K, N) IoU
+    matrix instead of an iterative clustering loop.
+
+    Args:
+        x (torch.Tensor): Candidates of one image, shape (N, 6 + num_masks), (x1, y1, x2, y2, confidence, class, ...).
+        boxes (torch.Tensor): Candidate boxes of shape (N, 4) offset by class, as given to NMS.
+        i (torch.Tensor): Indices of the kept boxes, most confident first.
+        iou_thres (float): IoU threshold above which a candidate joins a kept box.
+        mode (str): 'merge' or 'wbf'.
+        sources (int): Number of predictions made per object, i.e. ensemble models times test-time augmentations.
+
+    Returns:
+        (torch.Tensor): The fused kept boxes, shape (K, 6 + num_masks).
+    """
+    from .metrics import box_iou
+
+    out = x[i]
+    if not len(i):
+        return out
+    scores = x[:, 4].float()
+    iou = box_iou(boxes[i], boxes) > iou_thres  # (K, N)
+    iou[torch.arange(len(i), device=i.device), i] = True  # every kept box joins itself
+    if mode == "wbf":
+        owner = iou.float().argmax(0)  # first, i.e. most confident, kept box overlapping each candidate
+        iou &= owner[None] == torch.arange(len(i), device=owner.device)[:, None]
+        weights = iou * scores
+        out[:, 4] = (weights.sum(1) / iou.sum(1).clamp(min=sources)).to(out.dtype)
+    else:
+        weights = iou * scores
+    out[:, :4] = (weights @ x[:, :4].float() / weights.sum(1, keepdim=True)).to(out.dtype)
+    return out
+
+
 def clip_boxes(boxes, shape):
     """
     Takes a list of bounding boxes and a shape (height, width) and clips the bounding boxes to the shape.
@@ -721,6 +906,145 @@ def process_mask_native(protos, masks_in, bboxes, shape):
     return masks.gt_(0.5)
 
 
+class MaskCrops:
+    """
+    Instance masks evaluated only inside their boxes, and only when first needed.
+
+    `process_mask(..., upsample=True)` and `process_mask_native` multiply every mask coefficient vector with the full
+    prototype tensor, upsample full-frame masks and only then crop them to their boxes, so memory and time grow with
+    frame size times instance count. MaskCrops keeps the prototypes, coefficients and boxes, and on first access
+    computes each mask on just the prototype rows and columns under its box, bilinearly resamples that window to the
+    output pixels of the box with the same sampling positions as `F.interpolate(align_corners=False)`, and thresholds
+    it. Full masks are only pasted from the crops by `paste`, and contours are traced on the crops by `segments`.
+
+    Attributes:
+        protos (torch.Tensor): Prototypes of shape [mask_dim, mask_h, mask_w].
+        masks_in (torch.Tensor): Mask coefficients of shape [n, mask_dim].
+        bboxes (torch.Tensor): Boxes of shape [n, 4] in xyxy coordinates of the output `shape`.
+        shape (tuple): Height and width of the full masks.
+        native (bool): Crop after upsampling from the letterboxed prototypes to the original image size, as in
+            `process_mask_native`, instead of cropping at prototype resolution and upsampling to the letterboxed
+            image size, as in `process_mask(..., upsample=True)`.
+        dtype (torch.dtype): Storage dtype of pasted masks, e.g. torch.uint8, torch.bool or torch.float16.
+
+    Methods:
+        crops: Per-instance (mask, x, y) crops, computed on first access.
+        paste: Returns the full masks of shape [n, h, w].
+        segments: Returns the largest contour of each mask in pixel coordinates.
+    """
+
+    def __init__(self, protos, masks_in, bboxes, shape, native=False, dtype=torch.uint8):
+        """Stores the inputs, no mask is computed until `crops`, `paste` or `segments` is called."""
+        self.protos = protos
+        self.masks_in = masks_in
+        self.bboxes = bboxes
+        self.shape = tuple(shape)
+        self.native = native
+        self.dtype = dtype
+        self._crops = None
+
+    def __len__(self):
+        """Returns the number of masks."""
+        return len(self.masks_in)
+
+    def __getitem__(self, idx):
+        """Returns the MaskCrops of the selected masks, sharing any crops already computed."""
+        i = torch.arange(len(self))[idx].view(-1)
+        m = MaskCrops(self.protos, self.masks_in[i], self.bboxes[i], self.shape, self.native, self.dtype)
+        if self._crops is not None:
+            m._crops = [self._crops[j] for j in i.tolist()]
+        return m
+
+    @property
+    def crops(self):
+        """List of (mask, x, y) per instance, a boolean crop of the full mask and the position of its top left pixel."""
+        if self._crops is None:
+            self._crops = self._compute()
+        return self._crops
+
+    @staticmethod
+    def _weights(o0, o1, out_size, in_size):
+        """Bilinear (align_corners=False) source indices and weights for output pixels o0:o1 of an in_size axis."""
+        scale = in_size / out_size
+        src = ((torch.arange(o0, o1, dtype=torch.float32) + 0.5) * scale - 0.5).clamp_(min=0)
+        i0 = src.long()
+        i1 = (i0 + 1).clamp_(max=in_size - 1)
+        l1 = src - i0
+        return i0, i1, 1 - l1, l1
+
+    def _resample(self, m, i0, i1, l0, l1, start):
+        """Interpolation matrix mapping crop rows starting at `start` to the output rows described by the weights."""
+        w = torch.zeros(len(i0), m, dtype=l0.dtype)
+        r = torch.arange(len(i0))
+        w.index_put_((r, i0 - start), l0, accumulate=True)
+        w.index_put_((r, i1 - start), l1, accumulate=True)
+        return w
+
+    def _compute(self):
+        """Evaluates, resamples and thresholds every mask inside its box."""
+        c, mh, mw = self.protos.shape
+        h, w = self.shape
+        device = self.protos.device
+        dtype = self.protos.dtype if self.protos.is_cuda else torch.float32  # fp16 matmuls on GPU only
+        protos, masks_in = self.protos.to(dtype), self.masks_in.to(dtype)
+        if self.native:  # letterbox padding of the prototypes, as removed by scale_masks
+            gain = min(mh / h, mw / w)
+            pw, ph = (mw - w * gain) / 2, (mh - h * gain) / 2
+            top, left = int(ph), int(pw)
+            sh, sw = int(mh - ph) - top, int(mw - pw) - left
+        else:
+            top, left, sh, sw = 0, 0, mh, mw
+        boxes = self.bboxes.float().cpu()
+        if not self.native:  # cropped at prototype resolution before upsampling, as in process_mask
+            pboxes = (boxes * torch.tensor([mw / w, mh / h, mw / w, mh / h])).ceil_()
+            pboxes[:, 0::2].clamp_(0, mw)
+            pboxes[:, 1::2].clamp_(0, mh)
+        boxes = boxes.ceil()
+        boxes[:, 0::2].clamp_(0, w)
+        boxes[:, 1::2].clamp_(0, h)
+
+        crops = []
+        for k in range(len(self)):
+            if self.native:  # output pixels inside the box
+                x0, y0, x1, y1 = boxes[k].int().tolist()
+            else:  # output pixels that sample prototype pixels inside the box
+                a, b = pboxes[k, 0::2].tolist(), pboxes[k, 1::2].tolist()
+                x0, x1 = max(math.floor((a[0] - 0.5) * w / mw - 0.5), 0), min(math.ceil((a[1] + 0.5) * w / mw), w)
+                y0, y1 = max(math.floor((b[0] - 0.5) * h / mh - 0.5), 0), min(math.ceil((b[1] + 0.5) * h / mh), h)
+            if x1 <= x0 or y1 <= y0 or (not self.native and (a[1] <= a[0] or b[1] <= b[0])):
+                crops.append((torch.zeros((0, 0), dtype=torch.bool, device=device), x0, y0))
+                continue
+            yi0, yi1, yl0, yl1 = self._weights(y0, y1, h, sh)
+            xi0, xi1, xl0, xl1 = self._weights(x0, x1, w, sw)
+            r0, r1, c0, c1 = int(yi0[0]), int(yi1[-1]) + 1, int(xi0[0]), int(xi1[-1]) + 1
+            p = protos[:, top + r0 : top + r1, left + c0 : left + c1]
+            m = (masks_in[k] @ p.reshape(c, -1)).sigmoid().view(r1 - r0, c1 - c0).float()
+            if not self.native:  # zero outside the box at prototype resolution
+                rows = torch.arange(r0, r1, device=device)
+                cols = torch.arange(c0, c1, device=device)
+                m *= ((rows >= b[0]) & (rows < b[1]))[:, None] & ((cols >= a[0]) & (cols < a[1]))[None]
+            wy = self._resample(r1 - r0, yi0, yi1, yl0, yl1, r0).to(device)
+            wx = self._resample(c1 - c0, xi0, xi1, xl0, xl1, c0).to(device)
+            crops.append(((wy @ m @ wx.T) > 0.5, x0, y0))
+        return crops
+
+    def paste(self):
+        """Returns the full masks of shape [n, h, w] with dtype `dtype`."""
+        masks = torch.zeros((len(self), *self.shape), dtype=self.dtype, device=self.protos.device)
+        for k, (m, x, y) in enumerate(self.crops):
+            masks[k, y : y + m.shape[0], x : x + m.shape[1]] = m
+        return masks
+
+    def segments(self, strategy="largest"):
+        """Returns the contours of each mask in pixel coordinates of `shape`, as `masks2segments` on the full masks."""
+        segments = []
+        for m, x, y in self.crops:
+            segment = masks2segments(m[None], strategy)[0] if m.numel() else np.zeros((0, 2), dtype="float32")
+            segment += np.array([x, y], dtype="float32")
+            segments.append(segment)
+        return segments
+
+
 def scale_masks(masks, shape, padding=True):
     """
     Rescale segment masks to shape.